@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from soc2_scanner import scanner
+from soc2_scanner.controls import CONTROL_REGISTRY
+from soc2_scanner.scanner import EXECUTORS, ScanConfig, run_scan
+
+# The unpatched simulation hooks that `synthetic_responses` wraps.
+_simulate_evidence_entry = scanner._simulate_evidence_entry
+_init_simulate_worker = scanner._init_simulate_worker
+
+
+DEFAULT_ACCOUNTS = 400
+DEFAULT_RESPONSE_KB = 64
+DEFAULT_FORMATS = ("json", "csv")
+
+
+def simulated_account_ids(count: int) -> List[str]:
+    return [f"{100000000000 + index:012d}" for index in range(count)]
+
+
+def simulated_api_response(seed: int, response_kb: int) -> Dict[str, Any]:
+    """Encode and decode a describe-style response body of about `response_kb` KiB."""
+    resources = [
+        {
+            "Arn": f"arn:aws:ec2:us-east-1:{seed % 10**12:012d}:instance/i-{index:017x}",
+            "State": "running" if (seed + index) % 4 else "stopped",
+            "Tags": [{"Key": "owner", "Value": f"team-{(seed + index) % 17}"}],
+        }
+        for index in range(response_kb * 1024 // 160)
+    ]
+    body = json.loads(json.dumps({"Resources": resources}))
+    running = sum(1 for resource in body["Resources"] if resource["State"] == "running")
+    return {"resource_count": len(body["Resources"]), "running_count": running, "errors": []}
+
+
+def _evidence_entry(response_kb: int, control: str, account_id: str) -> Dict[str, Any]:
+    entry = _simulate_evidence_entry(control, account_id)
+    seed = int(hashlib.sha256(f"{account_id}:{control}".encode("utf-8")).hexdigest(), 16)
+    entry["data"]["simulated_api"] = simulated_api_response(seed, response_kb)
+    return entry
+
+
+def _init_worker(response_kb: int, *initargs: Any) -> None:
+    # Runs in every account worker; spawned processes start unpatched.
+    scanner._simulate_evidence_entry = partial(_evidence_entry, response_kb)
+    _init_simulate_worker(*initargs)
+
+
+@contextmanager
+def synthetic_responses(response_kb: int) -> Iterator[None]:
+    """Make every simulated control decode a `response_kb` KiB API response.
+
+    Stands in for the JSON decoding of a real scan in simulated runs,
+    including those whose account workers are processes.
+    """
+    if not response_kb:
+        yield
+        return
+    scanner._simulate_evidence_entry = partial(_evidence_entry, response_kb)
+    scanner._init_simulate_worker = partial(_init_worker, response_kb)
+    try:
+        yield
+    finally:
+        scanner._simulate_evidence_entry = _simulate_evidence_entry
+        scanner._init_simulate_worker = _init_simulate_worker
+
+
+def run_benchmark(
+    accounts: int = DEFAULT_ACCOUNTS,
+    workers: Optional[int] = None,
+    response_kb: int = DEFAULT_RESPONSE_KB,
+    executors: Sequence[str] = EXECUTORS,
+    formats: Sequence[str] = DEFAULT_FORMATS,
+    repeat: int = 1,
+) -> List[Dict[str, Any]]:
+    """Time a simulated scan of `accounts` accounts under each executor.
+
+    Every simulated control encodes and decodes a `response_kb` KiB API
+    response, standing in for the JSON decoding and evaluation of a real
+    scan. Each result is the best wall time of `repeat` runs, report
+    writing included.
+    """
+    workers = workers or os.cpu_count() or 1
+    account_ids = simulated_account_ids(accounts)
+    results: List[Dict[str, Any]] = []
+    for executor in executors:
+        best: Optional[float] = None
+        for _ in range(repeat):
+            with tempfile.TemporaryDirectory() as output_dir:
+                config = ScanConfig(
+                    controls=list(CONTROL_REGISTRY),
+                    regions=["us-east-1"],
+                    profile=None,
+                    output_dir=output_dir,
+                    account_ids=account_ids,
+                    simulate=True,
+                    max_account_workers=workers,
+                    executor=executor,
+                    formats=list(formats),
+                )
+                with synthetic_responses(response_kb):
+                    started = time.perf_counter()
+                    run_scan(config)
+                    elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        results.append(
+            {
+                "executor": executor,
+                "workers": workers,
+                "accounts": accounts,
+                "seconds": round(best, 3),
+                "accounts_per_second": round(accounts / best, 1),
+            }
+        )
+    return results
+
+
+def format_results(results: List[Dict[str, Any]]) -> List[str]:
+    baseline = results[0]["seconds"]
+    lines = ["executor  workers  accounts  seconds  accounts/s  speedup"]
+    for result in results:
+        lines.append(
+            f"{result['executor']:<8}  {result['workers']:>7}  {result['accounts']:>8}  "
+            f"{result['seconds']:>7.2f}  {result['accounts_per_second']:>10.1f}  "
+            f"{baseline / result['seconds']:>6.2f}x"
+        )
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m soc2_scanner.benchmark",
+        description="Compare --executor thread and process on a large simulated organization.",
+    )
+    parser.add_argument(
+        "--accounts",
+        type=int,
+        default=DEFAULT_ACCOUNTS,
+        help=f"Simulated accounts (default: {DEFAULT_ACCOUNTS})",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Account workers, threads or processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--response-kb",
+        type=int,
+        default=DEFAULT_RESPONSE_KB,
+        help=(
+            "KiB of synthetic API response each control decodes; 0 measures scheduling "
+            f"overhead only (default: {DEFAULT_RESPONSE_KB})"
+        ),
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Runs per executor; the fastest is reported (default: 1)",
+    )
+    args = parser.parse_args(argv)
+    results = run_benchmark(
+        accounts=args.accounts,
+        workers=args.workers,
+        response_kb=args.response_kb,
+        repeat=args.repeat,
+    )
+    print("\n".join(format_results(results)))
+
+
+if __name__ == "__main__":
+    main()
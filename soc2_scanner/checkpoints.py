@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+
+CHECKPOINT_DIR = "checkpoints"
+RUN_STATE_FILE = "run.json"
+
+# Scans `account_ids`, calling `on_settled(position, result)` as each account
+# finishes and yielding results in account order.
+AccountScan = Callable[
+    [List[str], Callable[[int, Dict[str, Any]], None]], Iterator[Dict[str, Any]]
+]
+
+
+def _atomic_write(path: str, data: str) -> None:
+    directory = os.path.dirname(path)
+    handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+            temp_file.write(data)
+        os.replace(temp_path, path)
+    except OSError:
+        os.unlink(temp_path)
+        raise
+
+
+class CheckpointStore:
+    """Per-account checkpoints of a run, kept in <run_dir>/checkpoints/.
+
+    run.json holds what a resumed run needs to continue the same scan (run
+    ID, evidence header, the account list, controls and regions). Each
+    finished account is written to its own file, named after its position in
+    the account list, as soon as it settles. Every file is written to a
+    temporary name and renamed, so a killed run never leaves a partial record.
+    """
+
+    def __init__(self, run_dir: str) -> None:
+        self.directory = os.path.join(run_dir, CHECKPOINT_DIR)
+
+    def _account_path(self, index: int) -> str:
+        return os.path.join(self.directory, f"{index:06d}.json")
+
+    def write_state(self, state: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        _atomic_write(
+            os.path.join(self.directory, RUN_STATE_FILE), json.dumps(state, sort_keys=True)
+        )
+
+    def load_state(self) -> Dict[str, Any]:
+        path = os.path.join(self.directory, RUN_STATE_FILE)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"No {CHECKPOINT_DIR}/{RUN_STATE_FILE} in {os.path.dirname(self.directory)}; "
+                "the run either finished or was not started by this version."
+            ) from None
+
+    def write_account(self, index: int, account: Dict[str, Any]) -> None:
+        _atomic_write(
+            self._account_path(index), json.dumps(account, separators=(",", ":"))
+        )
+
+    def load_account(self, index: int) -> Dict[str, Any]:
+        with open(self._account_path(index), "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def completed(self) -> Set[int]:
+        """Positions of the accounts that already have a checkpoint."""
+        if not os.path.isdir(self.directory):
+            return set()
+        return {
+            int(name[: -len(".json")])
+            for name in os.listdir(self.directory)
+            if name.endswith(".json") and name[: -len(".json")].isdigit()
+        }
+
+    def remove(self) -> None:
+        """Drop the checkpoints once the run's artifacts are complete."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+def checkpointed_scan(
+    store: CheckpointStore,
+    account_ids: List[str],
+    scan: AccountScan,
+    restored: Optional[List[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield every account's result in order, scanning only those without a checkpoint.
+
+    Checkpointed accounts are read back one at a time; the others are passed
+    to `scan`, and each is checkpointed as soon as it settles. IDs of the
+    accounts read back are appended to `restored`.
+    """
+    done = store.completed()
+    positions = [index for index in range(len(account_ids)) if index not in done]
+
+    def _checkpoint(position: int, account: Dict[str, Any]) -> None:
+        store.write_account(positions[position], account)
+
+    scanned = scan([account_ids[index] for index in positions], _checkpoint)
+    try:
+        for index, account_id in enumerate(account_ids):
+            if index in done:
+                if restored is not None:
+                    restored.append(account_id)
+                yield store.load_account(index)
+            else:
+                yield next(scanned)
+    finally:
+        scanned.close()
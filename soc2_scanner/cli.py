@@ -1,8 +1,18 @@
 import argparse
 import json
-from typing import Any, Dict, List
+import os
+import sys
+from typing import Any, Dict, List, Optional
 
-from soc2_scanner.scanner import ScanConfig, run_scan
+from soc2_scanner.collector_cache import DEFAULT_CACHE_MAX_BYTES
+from soc2_scanner.collectors import COLLECTOR_REGISTRY, DEFAULT_REGION_WORKERS
+from soc2_scanner.evidence_ndjson import EVIDENCE_FORMATS
+from soc2_scanner.evidence_schema import EVIDENCE_SCHEMAS
+from soc2_scanner.hashing import DEFAULT_VERIFY_WORKERS, MANIFEST_FILE, verify_run
+from soc2_scanner.profiling import PROFILERS
+from soc2_scanner.scanner import EXECUTORS, REPORT_WRITERS, ScanConfig, run_merge, run_scan
+from soc2_scanner.sharding import Shard, parse_shard
+from soc2_scanner.throttling import DEFAULT_MAX_API_RATE
 
 
 DEFAULT_CONTROLS = ["CC1", "CC2", "CC3", "CC4", "CC5", "CC6", "CC7", "CC8"]
@@ -42,6 +52,93 @@ def _validate_external_ids(external_ids: Any) -> Dict[str, str]:
     return normalized
 
 
+def _validate_worker_count(value: Any, key: str, default: int = 1) -> int:
+    if value is None:
+        return default
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError(f"{key} must be a positive integer.")
+    return value
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
+def _validate_api_rate(value: Any) -> float:
+    if value is None:
+        return DEFAULT_MAX_API_RATE
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError("max_api_rate must be a positive number.")
+    return float(value)
+
+
+def _validate_evidence_format(value: Any) -> str:
+    if value not in EVIDENCE_FORMATS:
+        raise ValueError(f"evidence_format must be one of: {', '.join(EVIDENCE_FORMATS)}.")
+    return value
+
+
+def _validate_evidence_schema(value: Any) -> str:
+    if value not in EVIDENCE_SCHEMAS:
+        raise ValueError(f"evidence_schema must be one of: {', '.join(EVIDENCE_SCHEMAS)}.")
+    return value
+
+
+def _validate_formats(value: Any) -> List[str]:
+    if value is None:
+        return list(REPORT_WRITERS)
+    requested = _split_csv(value) if isinstance(value, str) else [str(item) for item in value]
+    unknown = [name for name in requested if name not in REPORT_WRITERS]
+    if unknown or not requested:
+        raise ValueError(f"formats must be a non-empty list of: {', '.join(REPORT_WRITERS)}.")
+    return [name for name in REPORT_WRITERS if name in requested]
+
+
+def _validate_region_workers(region_workers: Any) -> Dict[str, int]:
+    if region_workers is None:
+        return {}
+    if not isinstance(region_workers, dict):
+        raise ValueError("region_workers must be a JSON/YAML object of collector to worker count.")
+    return {
+        str(collector): _validate_worker_count(limit, f"region_workers.{collector}")
+        for collector, limit in region_workers.items()
+    }
+
+
+def _validate_collector_ttls(collector_ttls: Any) -> Dict[str, int]:
+    if collector_ttls is None:
+        return {}
+    if not isinstance(collector_ttls, dict):
+        raise ValueError("collector_ttls must be a JSON/YAML object of collector to seconds.")
+    normalized: Dict[str, int] = {}
+    for collector, seconds in collector_ttls.items():
+        if collector not in COLLECTOR_REGISTRY:
+            raise ValueError(f"collector_ttls has an unknown collector: {collector}.")
+        if isinstance(seconds, bool) or not isinstance(seconds, int) or seconds < 0:
+            raise ValueError(f"collector_ttls.{collector} must be a non-negative integer.")
+        normalized[collector] = seconds
+    return normalized
+
+
+def _validate_executor(executor: Any) -> str:
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of: {', '.join(EXECUTORS)}.")
+    return executor
+
+
+def _validate_shard(shard: Any) -> Optional[Shard]:
+    if shard is None:
+        return None
+    return parse_shard(shard)
+
+
 def _merge_cli_config(args: argparse.Namespace) -> Dict[str, Any]:
     config: Dict[str, Any] = {}
     if args.config:
@@ -65,6 +162,28 @@ def _merge_cli_config(args: argparse.Namespace) -> Dict[str, Any]:
         config["simulate"] = True
     if args.external_ids:
         config["external_ids"] = _validate_external_ids(json.loads(args.external_ids))
+    _set_if(args.credential_cache, "credential_cache")
+    _set_if(args.collector_cache, "collector_cache")
+    _set_if(args.collector_cache_max_mb, "collector_cache_max_mb")
+    _set_if(args.max_account_workers, "max_account_workers")
+    _set_if(args.role_prefetch, "role_prefetch")
+    _set_if(args.max_region_workers, "max_region_workers")
+    _set_if(args.max_collector_workers, "max_collector_workers")
+    _set_if(args.max_api_rate, "max_api_rate")
+    if args.telemetry:
+        config["telemetry"] = True
+    _set_if(args.trace_output, "trace_output")
+    if args.profile_run:
+        config["profile_run"] = True
+    _set_if(args.profiler, "profiler")
+    _set_if(args.evidence_format, "evidence_format")
+    _set_if(args.evidence_schema, "evidence_schema")
+    _set_if(args.formats, "formats")
+    if args.account_details:
+        config["account_details"] = True
+    _set_if(args.resume, "resume")
+    _set_if(args.shard, "shard")
+    _set_if(args.executor, "executor")
     return config
 
 
@@ -120,12 +239,273 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Run a simulated scan without AWS API calls",
     )
+    parser.add_argument(
+        "--credential-cache",
+        help=(
+            "Directory for an encrypted cache of assumed-role credentials "
+            "(key read from SOC2_SCANNER_CREDENTIAL_CACHE_KEY)"
+        ),
+    )
+    parser.add_argument(
+        "--collector-cache",
+        help=(
+            "Directory for an on-disk cache of slow-changing collector results "
+            "(organizations, IAM, backup, WAF, ...), reused across runs within each "
+            "collector's TTL"
+        ),
+    )
+    parser.add_argument(
+        "--collector-cache-max-mb",
+        type=int,
+        help=(
+            "Size limit of --collector-cache; least recently used entries are evicted "
+            f"(default: {DEFAULT_CACHE_MAX_BYTES // (1024 * 1024)})"
+        ),
+    )
+    parser.add_argument(
+        "--max-account-workers",
+        type=int,
+        help="Number of accounts to scan concurrently (default: 1)",
+    )
+    parser.add_argument(
+        "--role-prefetch",
+        type=int,
+        help="Accounts whose roles are assumed ahead of the busy account workers (default: 2)",
+    )
+    parser.add_argument(
+        "--max-region-workers",
+        type=int,
+        help=(
+            "Number of regions each collector queries concurrently "
+            f"(default: {DEFAULT_REGION_WORKERS})"
+        ),
+    )
+    parser.add_argument(
+        "--max-collector-workers",
+        type=int,
+        help="Number of collectors prefetched concurrently per account (default: 4)",
+    )
+    parser.add_argument(
+        "--max-api-rate",
+        type=float,
+        help=(
+            "Ceiling in requests/second per account, service and region; the "
+            "adaptive limiter backs off from it on throttling. With --executor process "
+            "every worker process enforces it separately, so N workers calling one "
+            f"account, service and region may reach N times it (default: {DEFAULT_MAX_API_RATE:g})"
+        ),
+    )
+    parser.add_argument(
+        "--telemetry",
+        action="store_true",
+        help="Also write per-API-call telemetry to telemetry.json in the run directory",
+    )
+    parser.add_argument(
+        "--trace-output",
+        help="Write a Chrome Trace Event timeline of the scan to this path (open in Perfetto)",
+    )
+    parser.add_argument(
+        "--profile-run",
+        action="store_true",
+        help=(
+            "Profile the scan and write profile.pstats and profile_summary.txt "
+            "to the run directory"
+        ),
+    )
+    parser.add_argument(
+        "--profiler",
+        choices=["auto", *PROFILERS],
+        help=(
+            "Profiler for --profile-run; auto uses cProfile, which covers worker threads, "
+            "while pyinstrument samples the main thread only (default: auto)"
+        ),
+    )
+    parser.add_argument(
+        "--evidence-format",
+        choices=EVIDENCE_FORMATS,
+        help=(
+            "json writes evidence.json after the scan; ndjson appends one record per "
+            "account to evidence.ndjson as it finishes (default: json)"
+        ),
+    )
+    parser.add_argument(
+        "--evidence-schema",
+        choices=EVIDENCE_SCHEMAS,
+        help=(
+            "v2 stores each collector payload once per account and has controls reference it; "
+            "legacy embeds the payloads in every control, as before (default: v2)"
+        ),
+    )
+    parser.add_argument(
+        "--formats",
+        help=(
+            f"Comma-separated report formats to write ({','.join(REPORT_WRITERS)}); they are "
+            "rendered concurrently after the scan (default: all)"
+        ),
+    )
+    parser.add_argument(
+        "--account-details",
+        action="store_true",
+        help=(
+            "Also write per-account detail reports to accounts/<account_id>.md and .pdf "
+            "(for the md and pdf formats); the summaries stay organization-level"
+        ),
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        help=(
+            "Run account scans on threads, or on --max-account-workers worker processes that "
+            "each have their own boto3 session, for CPU-bound scans of many accounts "
+            "(default: thread)"
+        ),
+    )
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help=(
+            "Scan only shard I of N (1-based) of the resolved account list, partitioned by a "
+            "stable hash of the account ID; combine the N run directories with `merge`"
+        ),
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_DIR",
+        help=(
+            "Finish an interrupted run in RUN_DIR: accounts already checkpointed there are "
+            "read back and only the rest are scanned, with the run's own controls and regions"
+        ),
+    )
     return parser
 
 
-def main() -> None:
+def build_verify_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="soc2_scanner verify",
+        description=(
+            f"Check a run directory against its {MANIFEST_FILE} and per-file .sha256 files."
+        ),
+    )
+    parser.add_argument("run_dir", help="Run directory, e.g. reports/20260201T144724Z")
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        default=DEFAULT_VERIFY_WORKERS,
+        help=f"Number of files hashed in parallel (default: {DEFAULT_VERIFY_WORKERS})",
+    )
+    return parser
+
+
+def verify_main(argv: List[str]) -> int:
+    args = build_verify_parser().parse_args(argv)
+    try:
+        results = verify_run(args.run_dir, max_workers=args.workers)
+    except FileNotFoundError as exc:
+        print(f"Error: {exc}")
+        return 2
+    failures = 0
+    for result in results:
+        name = os.path.relpath(result.path, args.run_dir)
+        if result.ok:
+            status = "OK"
+        else:
+            failures += 1
+            status = "MISSING" if result.actual is None else "FAILED"
+        print(f"{name}: {status} ({result.source})")
+    if failures:
+        print(f"{failures} of {len(results)} checks failed.")
+        return 1
+    print(f"All {len(results)} checks passed.")
+    return 0
+
+
+def build_rerun_parser() -> argparse.ArgumentParser:
     parser = build_parser()
-    args = parser.parse_args()
+    parser.prog = "soc2_scanner rerun"
+    parser.description = (
+        "Scan again only what failed in a previous run: accounts whose role could not be "
+        "assumed, and controls that need review because of collection errors. The new run "
+        "carries everything else over; controls, regions and accounts come from the previous run."
+    )
+    parser.add_argument(
+        "--failed-only",
+        action="store_true",
+        required=True,
+        help="Re-collect only failed accounts and failed collectors (the only rerun mode)",
+    )
+    parser.add_argument("run_dir", help="Previous run directory, e.g. reports/20260201T144724Z")
+    return parser
+
+
+def build_merge_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="soc2_scanner merge",
+        description=(
+            "Combine the run directories of every --shard of a scan into one run directory, "
+            "with the same evidence, reports and manifest as a single-host run."
+        ),
+    )
+    parser.add_argument("run_dirs", nargs="+", help="Shard run directories (all N of them)")
+    parser.add_argument(
+        "--output",
+        default="reports",
+        help="Output directory for the merged run (default: reports)",
+    )
+    parser.add_argument(
+        "--evidence-format",
+        choices=EVIDENCE_FORMATS,
+        default="json",
+        help="Write evidence.json or evidence.ndjson (default: json)",
+    )
+    parser.add_argument(
+        "--formats",
+        help=f"Comma-separated report formats to write ({','.join(REPORT_WRITERS)}; default: all)",
+    )
+    parser.add_argument(
+        "--account-details",
+        action="store_true",
+        help="Also write per-account detail reports to accounts/<account_id>.md and .pdf",
+    )
+    return parser
+
+
+def merge_main(argv: List[str]) -> None:
+    args = build_merge_parser().parse_args(argv)
+    config = ScanConfig(
+        controls=[],
+        regions=[],
+        profile=None,
+        output_dir=args.output,
+        evidence_format=args.evidence_format,
+        formats=_validate_formats(args.formats),
+        account_details=args.account_details,
+    )
+    _print_result(run_merge(args.run_dirs, config), config.output_dir)
+
+
+def _print_result(result: Dict[str, Any], output_dir: str) -> None:
+    artifacts = result["artifacts"]
+    run_dir = os.path.dirname(artifacts[0]) if artifacts else output_dir
+    print(f"Evidence report created in: {run_dir}")
+    for path in artifacts:
+        print(f"- {path}")
+    if result.get("identity_error"):
+        print("Warning: unable to resolve AWS account identity.")
+        print(result["identity_error"])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["verify"]:
+        sys.exit(verify_main(argv[1:]))
+    if argv[:1] == ["merge"]:
+        merge_main(argv[1:])
+        return
+    rerun = argv[:1] == ["rerun"]
+    if rerun:
+        args = build_rerun_parser().parse_args(argv[1:])
+    else:
+        args = build_parser().parse_args(argv)
 
     merged = _merge_cli_config(args)
     controls = _split_csv(merged.get("controls")) if merged.get("controls") else DEFAULT_CONTROLS
@@ -146,14 +526,40 @@ def main() -> None:
         external_id=merged.get("external_id"),
         external_ids=_validate_external_ids(merged.get("external_ids")),
         simulate=bool(merged.get("simulate")),
+        credential_cache_dir=merged.get("credential_cache"),
+        collector_cache_dir=merged.get("collector_cache"),
+        collector_cache_max_bytes=_validate_worker_count(
+            merged.get("collector_cache_max_mb"),
+            "collector_cache_max_mb",
+            DEFAULT_CACHE_MAX_BYTES // (1024 * 1024),
+        )
+        * 1024
+        * 1024,
+        collector_ttls=_validate_collector_ttls(merged.get("collector_ttls")),
+        max_account_workers=_validate_worker_count(
+            merged.get("max_account_workers"), "max_account_workers"
+        ),
+        role_prefetch=_validate_worker_count(merged.get("role_prefetch"), "role_prefetch", 2),
+        max_region_workers=_validate_worker_count(
+            merged.get("max_region_workers"), "max_region_workers", DEFAULT_REGION_WORKERS
+        ),
+        region_workers=_validate_region_workers(merged.get("region_workers")),
+        max_collector_workers=_validate_worker_count(
+            merged.get("max_collector_workers"), "max_collector_workers", 4
+        ),
+        max_api_rate=_validate_api_rate(merged.get("max_api_rate")),
+        write_telemetry=bool(merged.get("telemetry")),
+        trace_output=merged.get("trace_output"),
+        profile_run=bool(merged.get("profile_run")),
+        profiler=merged.get("profiler") or "auto",
+        evidence_format=_validate_evidence_format(merged.get("evidence_format") or "json"),
+        evidence_schema=_validate_evidence_schema(merged.get("evidence_schema") or "v2"),
+        formats=_validate_formats(merged.get("formats")),
+        account_details=bool(merged.get("account_details")),
+        resume_dir=merged.get("resume"),
+        rerun_dir=args.run_dir if rerun else None,
+        shard=_validate_shard(merged.get("shard")),
+        executor=_validate_executor(merged.get("executor") or "thread"),
     )
 
-    result = run_scan(config)
-    artifacts = result["artifacts"]
-    run_dir = os.path.dirname(artifacts[0]) if artifacts else config.output_dir
-    print(f"Evidence report created in: {run_dir}")
-    for path in artifacts:
-        print(f"- {path}")
-    if result.get("identity_error"):
-        print("Warning: unable to resolve AWS account identity.")
-        print(result["identity_error"])
+    _print_result(run_scan(config), config.output_dir)
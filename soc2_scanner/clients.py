@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from soc2_scanner.telemetry import CallTelemetry
+    from soc2_scanner.throttling import AdaptiveRateLimiter
+    from soc2_scanner.tracing import Tracer
+
+
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+# botocore's adaptive mode retries throttles with backoff and its own
+# client-side rate limiting; the extra attempts keep transient throttles
+# out of the evidence errors.
+DEFAULT_MAX_ATTEMPTS = 8
+
+
+class ClientFactory:
+    """Thread-safe boto3 client pool keyed by (session, service, region).
+
+    Building a client parses the service model and sets up a connection
+    pool, so each combination is built once and then reused. All clients
+    share one botocore Config whose connection pool is sized for the
+    scan's concurrency. With a rate limiter, every new client is attached
+    to its (account, service, region) token bucket; with telemetry or a
+    tracer, its calls are recorded.
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        rate_limiter: Optional["AdaptiveRateLimiter"] = None,
+        telemetry: Optional["CallTelemetry"] = None,
+        tracer: Optional["Tracer"] = None,
+    ) -> None:
+        from botocore.config import Config
+
+        self.config = Config(
+            max_pool_connections=max(max_pool_connections, DEFAULT_MAX_POOL_CONNECTIONS),
+            retries={"mode": "adaptive", "max_attempts": DEFAULT_MAX_ATTEMPTS},
+        )
+        self.rate_limiter = rate_limiter
+        self.telemetry = telemetry
+        self._hooks = [hook for hook in (rate_limiter, telemetry, tracer) if hook is not None]
+        self.created = 0
+        self.reused = 0
+        self._clients: Dict[Tuple[Any, str, Optional[str]], Any] = {}
+        self._session_locks: Dict[Any, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def client(
+        self,
+        session: Any,
+        service: str,
+        region: Optional[str] = None,
+        account_id: Optional[str] = None,
+    ) -> Any:
+        key = (session, service, region)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self.reused += 1
+                return client
+            session_lock = self._session_locks.setdefault(session, threading.Lock())
+        # boto3 sessions are not thread-safe, so client construction is
+        # serialized per session; different sessions build in parallel.
+        with session_lock:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is not None:
+                    self.reused += 1
+                    return client
+            client = session.client(service, region_name=region, config=self.config)
+            for hook in self._hooks:
+                hook.attach(client, account_id, service)
+            with self._lock:
+                self._clients[key] = client
+                self.created += 1
+        return client
+
+    def bind(self, session: Any, account_id: Optional[str] = None) -> "SessionClients":
+        return SessionClients(self, session, account_id)
+
+    def release(self, session: Any) -> None:
+        """Drop every pooled client built from `session`."""
+        with self._lock:
+            for key in [key for key in self._clients if key[0] is session]:
+                del self._clients[key]
+            self._session_locks.pop(session, None)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"created": self.created, "reused": self.reused}
+
+
+class SessionClients:
+    """A session-shaped view of a ClientFactory for one set of credentials.
+
+    Collectors only call `client(service, region_name=...)`, so they accept
+    this in place of a boto3.Session.
+    """
+
+    def __init__(
+        self, factory: ClientFactory, session: Any, account_id: Optional[str] = None
+    ) -> None:
+        self.factory = factory
+        self.session = session
+        self.account_id = account_id
+
+    @property
+    def region_name(self) -> Optional[str]:
+        return self.session.region_name
+
+    def client(self, service_name: str, region_name: Optional[str] = None) -> Any:
+        return self.factory.client(self.session, service_name, region_name, self.account_id)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from soc2_scanner.collectors import COLLECTOR_REGISTRY
+
+
+HOUR = 3600
+
+# Seconds a collector result may be reused across runs. Collectors not listed
+# here (findings, alarms, flow logs, ...) change too often and are always
+# fetched fresh.
+DEFAULT_COLLECTOR_TTLS: Dict[str, int] = {
+    "organizations": 24 * HOUR,
+    "iam": 6 * HOUR,
+    "backup": 12 * HOUR,
+    "waf": 12 * HOUR,
+    "kms": 12 * HOUR,
+    "codebuild": 6 * HOUR,
+    "codepipeline": 6 * HOUR,
+}
+
+DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Provenance of a collector result: "fresh" from AWS or reused from the cache.
+Provenance = Dict[str, Any]
+
+
+def provenance(source: str, fetched_at: str) -> Provenance:
+    return {"source": source, "fetched_at": fetched_at}
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class CollectorCache:
+    """On-disk cache of collector results shared by consecutive runs.
+
+    Entries are keyed by account, collector, region set (for regional
+    collectors) and the collector's registry "version", so bumping the
+    version invalidates every entry of that collector. Each collector has
+    its own time to live (DEFAULT_COLLECTOR_TTLS, overridable per run);
+    results that carry errors are never stored. When the directory grows
+    past `max_bytes`, the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        ttls: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_COLLECTOR_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "stored": 0, "evicted": 0}
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        # name -> (size, last used); mtime doubles as the LRU clock.
+        self._index: Dict[str, Tuple[int, float]] = {}
+        self.rescan()
+
+    def rescan(self) -> None:
+        """Re-read the directory, e.g. after other processes stored entries in it."""
+        index: Dict[str, Tuple[int, float]] = {}
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:
+                    continue
+                index[name] = (stat.st_size, stat.st_mtime)
+        with self._lock:
+            self._index = index
+
+    def ttl(self, key: str) -> int:
+        return self.ttls.get(key, 0)
+
+    def _name(self, account_id: str, key: str, regions: List[str]) -> str:
+        definition = COLLECTOR_REGISTRY[key]
+        scope = sorted(regions) if definition["regional"] else []
+        identity = json.dumps([account_id, key, scope, definition.get("version", 1)])
+        return f"{hashlib.sha256(identity.encode('utf-8')).hexdigest()}.json"
+
+    def load(
+        self, account_id: str, key: str, regions: List[str]
+    ) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return (payload, fetched_at) if a live entry exists."""
+        name = self._name(account_id, key, regions)
+        path = os.path.join(self.directory, name)
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                text = handle.read()
+        except OSError:
+            self._count("misses")
+            return None
+        try:
+            entry = json.loads(text)
+            payload, fetched_at = entry["payload"], entry["fetched_at"]
+            age = (_utc_now() - datetime.fromisoformat(fetched_at)).total_seconds()
+        except (ValueError, KeyError, TypeError):
+            # Truncated or hand-edited: collect afresh and let `store` replace it.
+            self._count("misses")
+            self._remove(name)
+            return None
+        if age > self.ttl(key):
+            self._count("expired")
+            self._remove(name)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self._stats["hits"] += 1
+            self._index[name] = (self._index.get(name, (0, 0.0))[0], _utc_now().timestamp())
+        return payload, fetched_at
+
+    def store(
+        self,
+        account_id: str,
+        key: str,
+        regions: List[str],
+        payload: Dict[str, Any],
+        fetched_at: str,
+    ) -> None:
+        name = self._name(account_id, key, regions)
+        data = json.dumps({"fetched_at": fetched_at, "payload": payload}, sort_keys=True)
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "w", encoding="utf-8") as temp_file:
+                temp_file.write(data)
+            os.replace(temp_path, os.path.join(self.directory, name))
+        except OSError:
+            os.unlink(temp_path)
+            raise
+        with self._lock:
+            self._stats["stored"] += 1
+            self._index[name] = (len(data.encode("utf-8")), _utc_now().timestamp())
+            self._evict()
+
+    def _evict(self) -> None:
+        # Called with the lock held.
+        total = sum(size for size, _ in self._index.values())
+        if total <= self.max_bytes:
+            return
+        for name, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            del self._index[name]
+            total -= size
+            self._stats["evicted"] += 1
+
+    def _remove(self, name: str) -> None:
+        try:
+            os.unlink(os.path.join(self.directory, name))
+        except FileNotFoundError:
+            pass
+        with self._lock:
+            self._index.pop(name, None)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": len(self._index),
+                "bytes": sum(size for size, _ in self._index.values()),
+            }
+
+
+def fetch_through(
+    cache: Optional[CollectorCache],
+    account_id: Optional[str],
+    key: str,
+    regions: List[str],
+    collector: Callable[[], Dict[str, Any]],
+) -> Tuple[Dict[str, Any], Provenance]:
+    """Run `collector`, or reuse its cached result; return the result and its provenance.
+
+    Without a cache, an account or a TTL for `key`, the collector always runs.
+    """
+    if cache is None or not account_id or cache.ttl(key) <= 0:
+        fetched_at = _utc_now().isoformat()
+        return collector(), provenance("fresh", fetched_at)
+    cached = cache.load(account_id, key, regions)
+    if cached is not None:
+        payload, fetched_at = cached
+        return payload, provenance("cache", fetched_at)
+    fetched_at = _utc_now().isoformat()
+    payload = collector()
+    if not payload.get("errors"):
+        cache.store(account_id, key, regions, payload, fetched_at)
+    return payload, provenance("fresh", fetched_at)
+
+
+def with_age(info: Provenance, now: Optional[datetime] = None) -> Provenance:
+    """`info` plus its `age_seconds` at `now`."""
+    now = now or _utc_now()
+    age = (now - datetime.fromisoformat(info["fetched_at"])).total_seconds()
+    return {**info, "age_seconds": max(0, round(age))}
@@ -1,4 +1,6 @@
 __all__ = [
+    "COLLECTOR_REGISTRY",
+    "RegionWorkers",
     "collect_access_analyzer",
     "collect_backup",
     "collect_cloudtrail",
@@ -18,20 +20,66 @@ __all__ = [
     "collect_waf",
 ]
 
-from soc2_scanner.collectors.access_analyzer import collect_access_analyzer
-from soc2_scanner.collectors.backup import collect_backup
-from soc2_scanner.collectors.cloudtrail import collect_cloudtrail
-from soc2_scanner.collectors.cloudwatch import collect_cloudwatch
-from soc2_scanner.collectors.codebuild import collect_codebuild
-from soc2_scanner.collectors.codepipeline import collect_codepipeline
-from soc2_scanner.collectors.config import collect_config
-from soc2_scanner.collectors.config_rules import collect_config_rules
-from soc2_scanner.collectors.guardduty import collect_guardduty
-from soc2_scanner.collectors.iam import collect_iam
-from soc2_scanner.collectors.inspector import collect_inspector
-from soc2_scanner.collectors.kms import collect_kms
-from soc2_scanner.collectors.organizations import collect_organizations
-from soc2_scanner.collectors.securityhub import collect_securityhub
-from soc2_scanner.collectors.ssm import collect_ssm
-from soc2_scanner.collectors.vpc import collect_vpc
-from soc2_scanner.collectors.waf import collect_waf
+import importlib
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict
+
+DEFAULT_REGION_WORKERS = 4
+
+
+@dataclass
+class RegionWorkers:
+    """How many regions each collector may query at once.
+
+    `overrides` maps a collector name (e.g. "cloudtrail") to its own limit.
+    """
+
+    default: int = DEFAULT_REGION_WORKERS
+    overrides: Dict[str, int] = field(default_factory=dict)
+
+    def for_collector(self, collector: str) -> int:
+        return max(1, self.overrides.get(collector, self.default))
+
+# Collectors keyed by the name controls use for them in EvidenceContext.cache.
+# "collector" is a "module:function" reference (or the callable itself); the
+# modules import boto3, so each is only loaded when first resolved.
+# Regional collectors take (session, regions); the rest take (session,).
+# An optional "version" (default 1) is part of the collector cache key: bump
+# it when a collector's payload changes shape.
+COLLECTOR_REGISTRY: Dict[str, Dict[str, Any]] = {
+    "access_analyzer": {"collector": "access_analyzer:collect_access_analyzer", "regional": True},
+    "backup": {"collector": "backup:collect_backup", "regional": True},
+    "cloudtrail": {"collector": "cloudtrail:collect_cloudtrail", "regional": True},
+    "cloudwatch": {"collector": "cloudwatch:collect_cloudwatch", "regional": True},
+    "codebuild": {"collector": "codebuild:collect_codebuild", "regional": True},
+    "codepipeline": {"collector": "codepipeline:collect_codepipeline", "regional": True},
+    "config": {"collector": "config:collect_config", "regional": True},
+    "config_rules": {"collector": "config_rules:collect_config_rules", "regional": True},
+    "guardduty": {"collector": "guardduty:collect_guardduty", "regional": True},
+    "iam": {"collector": "iam:collect_iam", "regional": False},
+    "inspector": {"collector": "inspector:collect_inspector", "regional": True},
+    "kms": {"collector": "kms:collect_kms", "regional": True},
+    "organizations": {"collector": "organizations:collect_organizations", "regional": False},
+    "securityhub": {"collector": "securityhub:collect_securityhub", "regional": True},
+    "ssm": {"collector": "ssm:collect_ssm", "regional": True},
+    "vpc": {"collector": "vpc:collect_vpc", "regional": True},
+    "waf": {"collector": "waf:collect_waf", "regional": True},
+}
+
+
+def resolve_collector(key: str) -> Callable[..., Dict[str, Any]]:
+    """Return the collector function registered under `key`, importing it on first use."""
+    collector = COLLECTOR_REGISTRY[key]["collector"]
+    if isinstance(collector, str):
+        module_name, _, function_name = collector.partition(":")
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        collector = getattr(module, function_name)
+    return collector
+
+
+def __getattr__(name: str) -> Any:
+    # Keeps `from soc2_scanner.collectors import collect_kms` working.
+    for key, definition in COLLECTOR_REGISTRY.items():
+        if definition["collector"] == f"{key}:{name}":
+            return resolve_collector(key)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,32 +3,50 @@
 SOC 2 controls: CC6 (Logical and Physical Access)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
-
-
-def collect_access_analyzer(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "accessanalyzer", region)
+    response, error = safe_call(client.list_analyzers, type="ACCOUNT")
+    if error:
+        return [], [format_error("accessanalyzer", region, error)]
+    analyzers = [
+        {
+            "name": analyzer.get("name"),
+            "region": region,
+            "status": analyzer.get("status"),
+            "type": analyzer.get("type"),
+        }
+        for analyzer in response.get("analyzers", [])
+    ]
+    return analyzers, []
+
+
+def collect_access_analyzer(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     analyzers: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("accessanalyzer", region_name=region)
-        response, error = safe_call(client.list_analyzers, type="ACCOUNT")
-        if error:
-            errors.append(format_error("accessanalyzer", region, error))
-            continue
-        for analyzer in response.get("analyzers", []):
-            analyzers.append(
-                {
-                    "name": analyzer.get("name"),
-                    "region": region,
-                    "status": analyzer.get("status"),
-                    "type": analyzer.get("type"),
-                }
-            )
+    for region_analyzers, region_errors in map_regions(
+        "access_analyzer", regions, partial(_collect_region, session), workers
+    ):
+        analyzers.extend(region_analyzers)
+        errors.extend(region_errors)
 
     return {
         "analyzer_count": len(analyzers),
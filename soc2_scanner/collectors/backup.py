@@ -3,31 +3,49 @@
 SOC 2 controls: CC5 (Control Activities)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
-
-
-def collect_backup(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "backup", region)
+    response, error = safe_call(client.list_backup_plans)
+    if error:
+        return [], [format_error("backup", region, error)]
+    plans = [
+        {
+            "plan_id": plan.get("BackupPlanId"),
+            "name": plan.get("BackupPlanName"),
+            "region": region,
+        }
+        for plan in response.get("BackupPlansList", [])
+    ]
+    return plans, []
+
+
+def collect_backup(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     plans: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("backup", region_name=region)
-        response, error = safe_call(client.list_backup_plans)
-        if error:
-            errors.append(format_error("backup", region, error))
-            continue
-        for plan in response.get("BackupPlansList", []):
-            plans.append(
-                {
-                    "plan_id": plan.get("BackupPlanId"),
-                    "name": plan.get("BackupPlanName"),
-                    "region": region,
-                }
-            )
+    for region_plans, region_errors in map_regions(
+        "backup", regions, partial(_collect_region, session), workers
+    ):
+        plans.extend(region_plans)
+        errors.extend(region_errors)
 
     return {
         "backup_plan_count": len(plans),
@@ -3,48 +3,70 @@
 SOC 2 controls: CC2, CC4 (monitoring and communication)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, paginate_call, safe_call
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    paginate_call,
+    regional_client,
+)
 
 
-def collect_cloudwatch(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[str]]:
+    errors: List[str] = []
+
+    client = regional_client(session, "cloudwatch", region)
+    region_alarms, alarm_error = paginate_call(
+        client, "describe_alarms", "MetricAlarms"
+    )
+    if alarm_error:
+        errors.append(format_error("cloudwatch", region, alarm_error))
+    alarms = [
+        {
+            "name": alarm.get("AlarmName"),
+            "region": region,
+            "state": alarm.get("StateValue"),
+        }
+        for alarm in region_alarms
+    ]
+
+    logs_client = regional_client(session, "logs", region)
+    region_logs, logs_error = paginate_call(
+        logs_client, "describe_log_groups", "logGroups"
+    )
+    if logs_error:
+        errors.append(format_error("cloudwatch-logs", region, logs_error))
+    log_groups = [
+        {
+            "name": group.get("logGroupName"),
+            "region": region,
+            "retention_days": group.get("retentionInDays"),
+        }
+        for group in region_logs
+    ]
+    return alarms, log_groups, errors
+
+
+def collect_cloudwatch(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     alarms: List[Dict[str, Any]] = []
     log_groups: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("cloudwatch", region_name=region)
-        region_alarms, alarm_error = paginate_call(
-            client, "describe_alarms", "MetricAlarms"
-        )
-        if alarm_error:
-            errors.append(format_error("cloudwatch", region, alarm_error))
-        alarms.extend(
-            {
-                "name": alarm.get("AlarmName"),
-                "region": region,
-                "state": alarm.get("StateValue"),
-            }
-            for alarm in region_alarms
-        )
-
-        logs_client = session.client("logs", region_name=region)
-        region_logs, logs_error = paginate_call(
-            logs_client, "describe_log_groups", "logGroups"
-        )
-        if logs_error:
-            errors.append(format_error("cloudwatch-logs", region, logs_error))
-        log_groups.extend(
-            {
-                "name": group.get("logGroupName"),
-                "region": region,
-                "retention_days": group.get("retentionInDays"),
-            }
-            for group in region_logs
-        )
+    for region_alarms, region_logs, region_errors in map_regions(
+        "cloudwatch", regions, partial(_collect_region, session), workers
+    ):
+        alarms.extend(region_alarms)
+        log_groups.extend(region_logs)
+        errors.extend(region_errors)
 
     return {
         "alarm_count": len(alarms),
@@ -3,30 +3,48 @@
 SOC 2 controls: CC8 (Change Management)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
-
-
-def collect_codebuild(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "codebuild", region)
+    response, error = safe_call(client.list_projects)
+    if error:
+        return [], [format_error("codebuild", region, error)]
+    projects = [
+        {
+            "name": name,
+            "region": region,
+        }
+        for name in response.get("projects", [])
+    ]
+    return projects, []
+
+
+def collect_codebuild(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     projects: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("codebuild", region_name=region)
-        response, error = safe_call(client.list_projects)
-        if error:
-            errors.append(format_error("codebuild", region, error))
-            continue
-        for name in response.get("projects", []):
-            projects.append(
-                {
-                    "name": name,
-                    "region": region,
-                }
-            )
+    for region_projects, region_errors in map_regions(
+        "codebuild", regions, partial(_collect_region, session), workers
+    ):
+        projects.extend(region_projects)
+        errors.extend(region_errors)
 
     return {
         "project_count": len(projects),
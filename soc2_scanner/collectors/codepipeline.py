@@ -3,42 +3,64 @@
 SOC 2 controls: CC8 (Change Management)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
 
 
-def collect_codepipeline(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     pipelines: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("codepipeline", region_name=region)
-        response, error = safe_call(client.list_pipelines)
-        if error:
-            errors.append(format_error("codepipeline", region, error))
-            continue
-        for pipeline in response.get("pipelines", []):
-            state, state_error = safe_call(
-                client.get_pipeline_state, name=pipeline.get("name")
-            )
-            if state_error:
-                errors.append(format_error("codepipeline", region, state_error))
-            pipelines.append(
-                {
-                    "name": pipeline.get("name"),
-                    "region": region,
-                    "latest_execution_status": (
-                        state.get("stageStates", [{}])[0]
-                        .get("latestExecution", {})
-                        .get("status")
-                        if state
-                        else None
-                    ),
-                }
-            )
+    client = regional_client(session, "codepipeline", region)
+    response, error = safe_call(client.list_pipelines)
+    if error:
+        errors.append(format_error("codepipeline", region, error))
+        return pipelines, errors
+    for pipeline in response.get("pipelines", []):
+        state, state_error = safe_call(
+            client.get_pipeline_state, name=pipeline.get("name")
+        )
+        if state_error:
+            errors.append(format_error("codepipeline", region, state_error))
+        pipelines.append(
+            {
+                "name": pipeline.get("name"),
+                "region": region,
+                "latest_execution_status": (
+                    state.get("stageStates", [{}])[0]
+                    .get("latestExecution", {})
+                    .get("status")
+                    if state
+                    else None
+                ),
+            }
+        )
+    return pipelines, errors
+
+
+def collect_codepipeline(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
+    pipelines: List[Dict[str, Any]] = []
+    errors: List[str] = []
+
+    for region_pipelines, region_errors in map_regions(
+        "codepipeline", regions, partial(_collect_region, session), workers
+    ):
+        pipelines.extend(region_pipelines)
+        errors.extend(region_errors)
 
     return {
         "pipeline_count": len(pipelines),
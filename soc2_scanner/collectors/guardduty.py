@@ -3,41 +3,57 @@
 SOC 2 controls: CC3 (Risk Assessment)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import safe_call
+from soc2_scanner.collectors.helpers import RegionWorkers, map_regions, regional_client, safe_call
 
 
-def collect_guardduty(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     detectors: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("guardduty", region_name=region)
-        detector_resp, detector_error = safe_call(client.list_detectors)
+    client = regional_client(session, "guardduty", region)
+    detector_resp, detector_error = safe_call(client.list_detectors)
+    if detector_error:
+        errors.append(f"{region}: {detector_error}")
+        return detectors, errors
+    for detector_id in detector_resp.get("DetectorIds", []):
+        detector, detector_error = safe_call(
+            client.get_detector, DetectorId=detector_id
+        )
         if detector_error:
             errors.append(f"{region}: {detector_error}")
-            continue
-        for detector_id in detector_resp.get("DetectorIds", []):
-            detector, detector_error = safe_call(
-                client.get_detector, DetectorId=detector_id
-            )
-            if detector_error:
-                errors.append(f"{region}: {detector_error}")
-            detectors.append(
-                {
-                    "detector_id": detector_id,
-                    "region": region,
-                    "status": detector.get("Status") if detector else None,
-                    "finding_publishing_frequency": detector.get(
-                        "FindingPublishingFrequency"
-                    )
-                    if detector
-                    else None,
-                }
-            )
+        detectors.append(
+            {
+                "detector_id": detector_id,
+                "region": region,
+                "status": detector.get("Status") if detector else None,
+                "finding_publishing_frequency": detector.get(
+                    "FindingPublishingFrequency"
+                )
+                if detector
+                else None,
+            }
+        )
+    return detectors, errors
+
+
+def collect_guardduty(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
+    detectors: List[Dict[str, Any]] = []
+    errors: List[str] = []
+
+    for region_detectors, region_errors in map_regions(
+        "guardduty", regions, partial(_collect_region, session), workers
+    ):
+        detectors.extend(region_detectors)
+        errors.extend(region_errors)
 
     return {
         "detector_count": len(detectors),
@@ -1,7 +1,17 @@
-from typing import Any, List, Optional, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
 from botocore.exceptions import BotoCoreError, ClientError
 
+from soc2_scanner.clients import SessionClients
+from soc2_scanner.collectors import RegionWorkers
+
+
+T = TypeVar("T")
+
+_client_lock = threading.Lock()
+
 
 def safe_call(func, *args, **kwargs) -> Tuple[Optional[Any], Optional[str]]:
     try:
@@ -27,3 +37,30 @@ def paginate_call(
         return items, None
     except (BotoCoreError, ClientError, ValueError) as exc:
         return [], str(exc)
+
+
+def regional_client(session: Any, service: str, region: Optional[str]) -> Any:
+    if isinstance(session, SessionClients):
+        return session.client(service, region_name=region)
+    # boto3 sessions are not thread-safe; clients are, once constructed.
+    with _client_lock:
+        return session.client(service, region_name=region)
+
+
+def map_regions(
+    collector: str,
+    regions: List[str],
+    func: Callable[[str], T],
+    workers: Optional[RegionWorkers] = None,
+) -> List[T]:
+    """Run `func(region)` for every region and return results in region order.
+
+    Regions are fanned out over at most `workers.for_collector(collector)`
+    threads; the result order never depends on completion order, so serial
+    and parallel runs produce identical evidence.
+    """
+    limit = min((workers or RegionWorkers()).for_collector(collector), len(regions))
+    if limit <= 1:
+        return [func(region) for region in regions]
+    with ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"soc2-{collector}") as executor:
+        return list(executor.map(func, regions))
@@ -3,30 +3,47 @@
 SOC 2 controls: CC3 (Risk Assessment)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
 
 
-def collect_inspector(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+def _collect_region(session: boto3.Session, region: str) -> Tuple[Dict[str, Any], List[str]]:
+    errors: List[str] = []
+
+    client = regional_client(session, "inspector2", region)
+    coverage, coverage_error = safe_call(
+        client.list_coverage, filterCriteria={}, maxResults=10
+    )
+    if coverage_error:
+        errors.append(format_error("inspector2", region, coverage_error))
+    region_data = {
+        "region": region,
+        "coverage_count": len(coverage.get("coveredResources", []) if coverage else []),
+    }
+    return region_data, errors
+
+
+def collect_inspector(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     regions_data: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("inspector2", region_name=region)
-        coverage, coverage_error = safe_call(
-            client.list_coverage, filterCriteria={}, maxResults=10
-        )
-        if coverage_error:
-            errors.append(format_error("inspector2", region, coverage_error))
-        regions_data.append(
-            {
-                "region": region,
-                "coverage_count": len(coverage.get("coveredResources", []) if coverage else []),
-            }
-        )
+    for region_data, region_errors in map_regions(
+        "inspector", regions, partial(_collect_region, session), workers
+    ):
+        regions_data.append(region_data)
+        errors.extend(region_errors)
 
     return {
         "coverage_region_count": sum(
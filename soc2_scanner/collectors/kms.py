@@ -3,44 +3,60 @@
 SOC 2 controls: CC6 (Logical and Physical Access)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import safe_call
+from soc2_scanner.collectors.helpers import RegionWorkers, map_regions, regional_client, safe_call
 
 
-def collect_kms(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
     errors: List[str] = []
     keys_sampled: List[Dict[str, Any]] = []
 
-    for region in regions:
-        client = session.client("kms", region_name=region)
-        keys_resp, keys_error = safe_call(client.list_keys, Limit=25)
-        if keys_error:
-            errors.append(f"{region}: {keys_error}")
-            continue
-        for key in keys_resp.get("Keys", []):
-            meta, meta_error = safe_call(client.describe_key, KeyId=key["KeyId"])
-            rotation, rotation_error = safe_call(
-                client.get_key_rotation_status, KeyId=key["KeyId"]
-            )
-            if meta_error:
-                errors.append(f"{region}: {meta_error}")
-            if rotation_error:
-                errors.append(f"{region}: {rotation_error}")
-            metadata = meta.get("KeyMetadata", {}) if meta else {}
-            keys_sampled.append(
-                {
-                    "key_id": key["KeyId"],
-                    "region": region,
-                    "key_manager": metadata.get("KeyManager"),
-                    "key_state": metadata.get("KeyState"),
-                    "rotation_enabled": rotation.get("KeyRotationEnabled")
-                    if rotation
-                    else None,
-                }
-            )
+    client = regional_client(session, "kms", region)
+    keys_resp, keys_error = safe_call(client.list_keys, Limit=25)
+    if keys_error:
+        errors.append(f"{region}: {keys_error}")
+        return keys_sampled, errors
+    for key in keys_resp.get("Keys", []):
+        meta, meta_error = safe_call(client.describe_key, KeyId=key["KeyId"])
+        rotation, rotation_error = safe_call(
+            client.get_key_rotation_status, KeyId=key["KeyId"]
+        )
+        if meta_error:
+            errors.append(f"{region}: {meta_error}")
+        if rotation_error:
+            errors.append(f"{region}: {rotation_error}")
+        metadata = meta.get("KeyMetadata", {}) if meta else {}
+        keys_sampled.append(
+            {
+                "key_id": key["KeyId"],
+                "region": region,
+                "key_manager": metadata.get("KeyManager"),
+                "key_state": metadata.get("KeyState"),
+                "rotation_enabled": rotation.get("KeyRotationEnabled")
+                if rotation
+                else None,
+            }
+        )
+    return keys_sampled, errors
+
+
+def collect_kms(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
+    errors: List[str] = []
+    keys_sampled: List[Dict[str, Any]] = []
+
+    for region_keys, region_errors in map_regions(
+        "kms", regions, partial(_collect_region, session), workers
+    ):
+        keys_sampled.extend(region_keys)
+        errors.extend(region_errors)
 
     return {
         "sampled_key_count": len(keys_sampled),
@@ -3,34 +3,52 @@
 SOC 2 controls: CC7 (System Operations)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, paginate_call
-
-
-def collect_ssm(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    paginate_call,
+    regional_client,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "ssm", region)
+    region_instances, error = paginate_call(
+        client, "describe_instance_information", "InstanceInformationList"
+    )
+    if error:
+        return [], [format_error("ssm", region, error)]
+    instances = [
+        {
+            "instance_id": info.get("InstanceId"),
+            "region": region,
+            "ping_status": info.get("PingStatus"),
+            "platform": info.get("PlatformName"),
+        }
+        for info in region_instances
+    ]
+    return instances, []
+
+
+def collect_ssm(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     instances: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("ssm", region_name=region)
-        region_instances, error = paginate_call(
-            client, "describe_instance_information", "InstanceInformationList"
-        )
-        if error:
-            errors.append(format_error("ssm", region, error))
-            continue
-        instances.extend(
-            {
-                "instance_id": info.get("InstanceId"),
-                "region": region,
-                "ping_status": info.get("PingStatus"),
-                "platform": info.get("PlatformName"),
-            }
-            for info in region_instances
-        )
+    for region_instances, region_errors in map_regions(
+        "ssm", regions, partial(_collect_region, session), workers
+    ):
+        instances.extend(region_instances)
+        errors.extend(region_errors)
 
     return {
         "managed_instance_count": len(instances),
@@ -3,34 +3,52 @@
 SOC 2 controls: CC2 (Communication and Information)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, paginate_call
-
-
-def collect_vpc(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    paginate_call,
+    regional_client,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "ec2", region)
+    region_logs, error = paginate_call(
+        client, "describe_flow_logs", "FlowLogs"
+    )
+    if error:
+        return [], [format_error("ec2", region, error)]
+    flow_logs = [
+        {
+            "flow_log_id": log.get("FlowLogId"),
+            "resource_id": log.get("ResourceId"),
+            "region": region,
+            "log_status": log.get("LogStatus"),
+        }
+        for log in region_logs
+    ]
+    return flow_logs, []
+
+
+def collect_vpc(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     flow_logs: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("ec2", region_name=region)
-        region_logs, error = paginate_call(
-            client, "describe_flow_logs", "FlowLogs"
-        )
-        if error:
-            errors.append(format_error("ec2", region, error))
-            continue
-        flow_logs.extend(
-            {
-                "flow_log_id": log.get("FlowLogId"),
-                "resource_id": log.get("ResourceId"),
-                "region": region,
-                "log_status": log.get("LogStatus"),
-            }
-            for log in region_logs
-        )
+    for region_logs, region_errors in map_regions(
+        "vpc", regions, partial(_collect_region, session), workers
+    ):
+        flow_logs.extend(region_logs)
+        errors.extend(region_errors)
 
     return {
         "flow_log_count": len(flow_logs),
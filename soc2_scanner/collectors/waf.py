@@ -3,33 +3,51 @@
 SOC 2 controls: CC4 (Monitoring Activities)
 """
 
-from typing import Any, Dict, List
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
 
 import boto3
 
-from soc2_scanner.collectors.helpers import format_error, safe_call
-
-
-def collect_waf(session: boto3.Session, regions: List[str]) -> Dict[str, Any]:
+from soc2_scanner.collectors.helpers import (
+    RegionWorkers,
+    format_error,
+    map_regions,
+    regional_client,
+    safe_call,
+)
+
+
+def _collect_region(
+    session: boto3.Session, region: str
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    client = regional_client(session, "wafv2", region)
+    response, error = safe_call(
+        client.list_web_acls, Scope="REGIONAL"
+    )
+    if error:
+        return [], [format_error("wafv2", region, error)]
+    web_acls = [
+        {
+            "name": acl.get("Name"),
+            "id": acl.get("Id"),
+            "region": region,
+        }
+        for acl in response.get("WebACLs", [])
+    ]
+    return web_acls, []
+
+
+def collect_waf(
+    session: boto3.Session, regions: List[str], workers: Optional[RegionWorkers] = None
+) -> Dict[str, Any]:
     web_acls: List[Dict[str, Any]] = []
     errors: List[str] = []
 
-    for region in regions:
-        client = session.client("wafv2", region_name=region)
-        response, error = safe_call(
-            client.list_web_acls, Scope="REGIONAL"
-        )
-        if error:
-            errors.append(format_error("wafv2", region, error))
-            continue
-        for acl in response.get("WebACLs", []):
-            web_acls.append(
-                {
-                    "name": acl.get("Name"),
-                    "id": acl.get("Id"),
-                    "region": region,
-                }
-            )
+    for region_acls, region_errors in map_regions(
+        "waf", regions, partial(_collect_region, session), workers
+    ):
+        web_acls.extend(region_acls)
+        errors.extend(region_errors)
 
     return {
         "web_acl_count": len(web_acls),
@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 
+from soc2_scanner.collector_cache import with_age
 from soc2_scanner.controls import cc1, cc2, cc3, cc4, cc5, cc6, cc7, cc8
 from soc2_scanner.controls.context import EvidenceContext, status_from_findings
 
@@ -12,48 +13,56 @@ CONTROL_REGISTRY: Dict[str, Dict[str, Any]] = {
         "title": cc1.TITLE,
         "language": cc1.CONTROL_LANGUAGE,
         "sources": cc1.SOURCES,
+        "collectors": cc1.COLLECTORS,
         "evaluator": cc1.evaluate,
     },
     cc2.CONTROL_ID: {
         "title": cc2.TITLE,
         "language": cc2.CONTROL_LANGUAGE,
         "sources": cc2.SOURCES,
+        "collectors": cc2.COLLECTORS,
         "evaluator": cc2.evaluate,
     },
     cc3.CONTROL_ID: {
         "title": cc3.TITLE,
         "language": cc3.CONTROL_LANGUAGE,
         "sources": cc3.SOURCES,
+        "collectors": cc3.COLLECTORS,
         "evaluator": cc3.evaluate,
     },
     cc4.CONTROL_ID: {
         "title": cc4.TITLE,
         "language": cc4.CONTROL_LANGUAGE,
         "sources": cc4.SOURCES,
+        "collectors": cc4.COLLECTORS,
         "evaluator": cc4.evaluate,
     },
     cc5.CONTROL_ID: {
         "title": cc5.TITLE,
         "language": cc5.CONTROL_LANGUAGE,
         "sources": cc5.SOURCES,
+        "collectors": cc5.COLLECTORS,
         "evaluator": cc5.evaluate,
     },
     cc6.CONTROL_ID: {
         "title": cc6.TITLE,
         "language": cc6.CONTROL_LANGUAGE,
         "sources": cc6.SOURCES,
+        "collectors": cc6.COLLECTORS,
         "evaluator": cc6.evaluate,
     },
     cc7.CONTROL_ID: {
         "title": cc7.TITLE,
         "language": cc7.CONTROL_LANGUAGE,
         "sources": cc7.SOURCES,
+        "collectors": cc7.COLLECTORS,
         "evaluator": cc7.evaluate,
     },
     cc8.CONTROL_ID: {
         "title": cc8.TITLE,
         "language": cc8.CONTROL_LANGUAGE,
         "sources": cc8.SOURCES,
+        "collectors": cc8.COLLECTORS,
         "evaluator": cc8.evaluate,
     },
 }
@@ -74,6 +83,12 @@ def evaluate_control(control: str, context: EvidenceContext) -> Dict[str, Any]:
 
     data, gaps, errors = definition["evaluator"](context)
     status = status_from_findings(gaps, errors)
+    now = datetime.now(timezone.utc)
+    provenance = {
+        key: with_age(context.provenance[key], now)
+        for key in definition["collectors"]
+        if key in context.provenance
+    }
 
     return {
         "control_id": control,
@@ -81,10 +96,11 @@ def evaluate_control(control: str, context: EvidenceContext) -> Dict[str, Any]:
         "control_language": definition["language"],
         "status": status,
         "evidence_sources": definition["sources"],
-        "collected_at": datetime.now(timezone.utc).isoformat(),
+        "collected_at": now.isoformat(),
         "gaps": gaps,
         "errors": errors,
         "data": data,
+        "data_provenance": provenance,
     }
 
 
@@ -2,12 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 
-from soc2_scanner.collectors import (
-    collect_guardduty,
-    collect_inspector,
-    collect_securityhub,
-)
-from soc2_scanner.controls.context import EvidenceContext, get_cached
+from soc2_scanner.controls.context import EvidenceContext, collect
 
 
 CONTROL_ID = "CC3"
@@ -17,18 +12,13 @@ CONTROL_LANGUAGE = (
     "to achieving those objectives."
 )
 SOURCES = ["Security Hub", "GuardDuty", "Inspector"]
+COLLECTORS = ["securityhub", "guardduty", "inspector"]
 
 
 def evaluate(context: EvidenceContext) -> Tuple[Dict[str, Any], List[str], List[str]]:
-    securityhub_data = get_cached(
-        context, "securityhub", collect_securityhub, context.session, context.regions
-    )
-    guardduty_data = get_cached(
-        context, "guardduty", collect_guardduty, context.session, context.regions
-    )
-    inspector_data = get_cached(
-        context, "inspector", collect_inspector, context.session, context.regions
-    )
+    securityhub_data = collect(context, "securityhub")
+    guardduty_data = collect(context, "guardduty")
+    inspector_data = collect(context, "inspector")
     gaps: List[str] = []
     errors = (
         securityhub_data["errors"]
@@ -2,12 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Tuple
 
-from soc2_scanner.collectors import (
-    collect_access_analyzer,
-    collect_cloudtrail,
-    collect_iam,
-)
-from soc2_scanner.controls.context import EvidenceContext, get_cached
+from soc2_scanner.controls.context import EvidenceContext, collect
 
 
 CONTROL_ID = "CC6"
@@ -17,20 +12,13 @@ CONTROL_LANGUAGE = (
     "systems and data from unauthorized access."
 )
 SOURCES = ["IAM", "Access Analyzer", "CloudTrail"]
+COLLECTORS = ["iam", "access_analyzer", "cloudtrail"]
 
 
 def evaluate(context: EvidenceContext) -> Tuple[Dict[str, Any], List[str], List[str]]:
-    iam_data = get_cached(context, "iam", collect_iam, context.session)
-    access_analyzer_data = get_cached(
-        context,
-        "access_analyzer",
-        collect_access_analyzer,
-        context.session,
-        context.regions,
-    )
-    cloudtrail_data = get_cached(
-        context, "cloudtrail", collect_cloudtrail, context.session, context.regions
-    )
+    iam_data = collect(context, "iam")
+    access_analyzer_data = collect(context, "access_analyzer")
+    cloudtrail_data = collect(context, "cloudtrail")
     gaps: List[str] = []
     errors = iam_data["errors"] + access_analyzer_data["errors"] + cloudtrail_data["errors"]
 
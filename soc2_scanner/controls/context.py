@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
-import boto3
+from soc2_scanner.clients import ClientFactory, SessionClients
+from soc2_scanner.collector_cache import CollectorCache, Provenance, fetch_through
+from soc2_scanner.collectors import COLLECTOR_REGISTRY, RegionWorkers, resolve_collector
+from soc2_scanner.tracing import span
+
+if TYPE_CHECKING:
+    import boto3
 
 
 @dataclass
@@ -11,6 +20,95 @@ class EvidenceContext:
     session: boto3.Session
     regions: List[str]
     cache: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    clients: Optional[SessionClients] = None
+    cache_stats: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    collector_cache: Optional[CollectorCache] = None
+    provenance: Dict[str, Provenance] = field(default_factory=dict)
+    region_workers: Optional[RegionWorkers] = None
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+    _inflight: Dict[str, Future] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if self.clients is None:
+            self.clients = ClientFactory().bind(self.session)
+
+
+class CacheStats:
+    """`EvidenceContext.cache_stats` summed over every account of a run.
+
+    Per collector: `misses` is how often the collector ran, `waits` how
+    often a caller shared an in-flight collection and `hits` how often a
+    finished result was reused.
+    """
+
+    def __init__(self) -> None:
+        self._collectors: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, cache_stats: Dict[str, Dict[str, int]]) -> None:
+        with self._lock:
+            for key, counts in cache_stats.items():
+                totals = self._collectors.setdefault(key, {"hits": 0, "misses": 0, "waits": 0})
+                for name, count in counts.items():
+                    totals[name] += count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            collectors = {key: dict(self._collectors[key]) for key in sorted(self._collectors)}
+        totals = {
+            name: sum(counts[name] for counts in collectors.values())
+            for name in ("hits", "misses", "waits")
+        }
+        return {**totals, "collectors": collectors}
+
+
+def _claim(context: EvidenceContext, key: str) -> Tuple[Future, bool]:
+    """Return the future holding `key` and whether the caller must fill it.
+
+    Exactly one caller per key becomes the leader; everyone else waits on the
+    leader's future. A failed collection stays in `_inflight`, so later callers
+    see the same error instead of re-running the collector.
+    """
+    with context._lock:
+        stats = context.cache_stats.setdefault(key, {"hits": 0, "misses": 0, "waits": 0})
+        if key in context.cache:
+            stats["hits"] += 1
+            future: Future = Future()
+            future.set_result(context.cache[key])
+            return future, False
+        future = context._inflight.get(key)
+        if future is None:
+            stats["misses"] += 1
+            future = Future()
+            context._inflight[key] = future
+            return future, True
+        stats["hits" if future.done() else "waits"] += 1
+        return future, False
+
+
+def _settle(
+    context: EvidenceContext,
+    key: str,
+    future: Future,
+    result: Any = None,
+    error: Optional[BaseException] = None,
+) -> None:
+    with context._lock:
+        if error is None:
+            context.cache[key] = result
+            context._inflight.pop(key, None)
+        elif not isinstance(error, Exception):
+            # Interrupts and cancellations are not collector results; let the
+            # next caller try again.
+            context._inflight.pop(key, None)
+    if error is None:
+        future.set_result(result)
+    else:
+        future.set_exception(error)
 
 
 def get_cached(
@@ -19,9 +117,70 @@ def get_cached(
     collector: Callable[..., Dict[str, Any]],
     *args: Any,
 ) -> Dict[str, Any]:
-    if key not in context.cache:
-        context.cache[key] = collector(*args)
-    return context.cache[key]
+    future, leader = _claim(context, key)
+    if not leader:
+        return future.result()
+    try:
+        result = collector(*args)
+    except BaseException as exc:
+        _settle(context, key, future, error=exc)
+        raise
+    _settle(context, key, future, result=result)
+    return result
+
+
+async def get_cached_async(
+    context: EvidenceContext,
+    key: str,
+    collector: Callable[..., Dict[str, Any]],
+    *args: Any,
+) -> Dict[str, Any]:
+    """Coroutine flavour of `get_cached`; shares the same single-flight slots.
+
+    The collector runs in the loop's default executor, so blocking boto3
+    calls never stall the event loop.
+    """
+    import asyncio
+
+    future, leader = _claim(context, key)
+    if not leader:
+        return await asyncio.wrap_future(future)
+    loop = asyncio.get_running_loop()
+    try:
+        result = await loop.run_in_executor(None, partial(collector, *args))
+    except BaseException as exc:
+        _settle(context, key, future, error=exc)
+        raise
+    _settle(context, key, future, result=result)
+    return result
+
+
+def collect(context: EvidenceContext, key: str) -> Dict[str, Any]:
+    """Return the cached result of the registered collector `key`.
+
+    With a `collector_cache`, results still within their TTL are reused from
+    earlier runs; `context.provenance[key]` records which happened.
+    """
+    definition = COLLECTOR_REGISTRY[key]
+    if definition["regional"]:
+        args = (context.clients, context.regions, context.region_workers)
+    else:
+        args = (context.clients,)
+    account_id = getattr(context.clients, "account_id", None)
+
+    def _run(*collector_args: Any) -> Dict[str, Any]:
+        def _fetch() -> Dict[str, Any]:
+            with span(f"collector:{key}", "collector", account_id):
+                return resolve_collector(key)(*collector_args)
+
+        result, info = fetch_through(
+            context.collector_cache, account_id, key, context.regions, _fetch
+        )
+        with context._lock:
+            context.provenance[key] = info
+        return result
+
+    return get_cached(context, key, _run, *args)
 
 
 def status_from_findings(gaps: List[str], errors: List[str]) -> str:
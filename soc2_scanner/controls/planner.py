@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from soc2_scanner.controls import CONTROL_REGISTRY
+from soc2_scanner.controls.context import EvidenceContext, collect
+
+
+def plan_collectors(controls: List[str]) -> List[str]:
+    """Return the deduplicated collector keys needed by `controls`.
+
+    Keys keep the order in which the controls first ask for them; unknown
+    controls contribute nothing.
+    """
+    keys: List[str] = []
+    for control in controls:
+        definition = CONTROL_REGISTRY.get(control)
+        if not definition:
+            continue
+        for key in definition["collectors"]:
+            if key not in keys:
+                keys.append(key)
+    return keys
+
+
+def prefetch_collectors(
+    context: EvidenceContext, keys: List[str], max_workers: int = 1
+) -> None:
+    """Populate the context cache for `keys` so evaluation never waits on AWS.
+
+    Keys already present in the cache (for example the organizations data
+    collected once from the management account) are not fetched again.
+    """
+    missing = [key for key in keys if key not in context.cache]
+    workers = min(max_workers, len(missing))
+    if workers <= 1:
+        for key in missing:
+            collect(context, key)
+        return
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="soc2-collector") as executor:
+        for future in [executor.submit(collect, context, key) for key in missing]:
+            future.result()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+
+CACHE_KEY_ENV = "SOC2_SCANNER_CREDENTIAL_CACHE_KEY"
+
+# Cached credentials closer than this to expiry are treated as missing, so a
+# reused session never starts a scan about to lose its credentials.
+MIN_REMAINING_LIFETIME = timedelta(minutes=15)
+
+
+class CredentialCache:
+    """Encrypted on-disk cache of assume-role credentials.
+
+    Entries are keyed by role ARN (account and role) plus external ID and
+    encrypted with Fernet using the key in SOC2_SCANNER_CREDENTIAL_CACHE_KEY.
+    Unreadable, undecryptable or nearly expired entries are ignored.
+    """
+
+    def __init__(self, directory: str, key: Optional[str] = None) -> None:
+        try:
+            from cryptography.fernet import Fernet, InvalidToken
+        except ImportError as exc:
+            raise RuntimeError("cryptography is required for the credential cache.") from exc
+        key = key or os.environ.get(CACHE_KEY_ENV)
+        if not key:
+            raise RuntimeError(
+                f"Set {CACHE_KEY_ENV} to a Fernet key to use the credential cache."
+            )
+        self.directory = directory
+        self._fernet = Fernet(key)
+        self._invalid_token = InvalidToken
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    def _path(self, role_arn: str, external_id: Optional[str]) -> str:
+        digest = hashlib.sha256(f"{role_arn}|{external_id or ''}".encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.cred")
+
+    def load(self, role_arn: str, external_id: Optional[str]) -> Optional[Dict[str, str]]:
+        try:
+            with open(self._path(role_arn, external_id), "rb") as handle:
+                metadata = json.loads(self._fernet.decrypt(handle.read()))
+            expiry = datetime.fromisoformat(metadata["expiry_time"])
+        except (OSError, ValueError, KeyError, self._invalid_token):
+            return None
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        if expiry - datetime.now(timezone.utc) < MIN_REMAINING_LIFETIME:
+            return None
+        return metadata
+
+    def store(self, role_arn: str, external_id: Optional[str], metadata: Dict[str, str]) -> None:
+        token = self._fernet.encrypt(json.dumps(metadata, sort_keys=True).encode("utf-8"))
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as temp_file:
+                temp_file.write(token)
+            os.replace(temp_path, self._path(role_arn, external_id))
+        except OSError:
+            os.unlink(temp_path)
+            raise
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from soc2_scanner.evidence_schema import account_record, evidence_document
+from soc2_scanner.hashing import HashingWriter
+
+
+EVIDENCE_FORMATS = ("json", "ndjson")
+EVIDENCE_NDJSON = "evidence.ndjson"
+
+
+def _record(kind: str, body: Dict[str, Any]) -> bytes:
+    line = json.dumps({"record": kind, **body}, sort_keys=True, separators=(",", ":"))
+    return line.encode("utf-8") + b"\n"
+
+
+class NdjsonEvidenceWriter:
+    """Streams evidence.ndjson: one compact JSON record per line.
+
+    The file starts with a "header" record (run metadata known before the
+    scan), gets one "account" record appended as each account finishes, and
+    ends with a "trailer" record (final timestamp and account count).
+    Account records use the schema version named in the header.
+
+    Each account is serialized and flushed on its own, so the writer never
+    holds more than one account's evidence; the SHA-256 is updated with
+    every line instead of re-reading the file afterwards.
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any]) -> None:
+        self.path = path
+        self.account_count = 0
+        self._schema_version = header.get("schema_version")
+        self._handle = HashingWriter(path)
+        self._handle.write(_record("header", header))
+
+    def write_account(self, account: Dict[str, Any]) -> None:
+        self._handle.write(_record("account", account_record(account, self._schema_version)))
+        self._handle.flush()
+        self.account_count += 1
+
+    def close(self, generated_at: str) -> str:
+        """Write the trailer, close the file and return its SHA-256 hex digest."""
+        self._handle.write(
+            _record("trailer", {"generated_at": generated_at, "account_count": self.account_count})
+        )
+        self._handle.close()
+        return self._handle.hexdigest()
+
+
+def report_view(account: Dict[str, Any]) -> Dict[str, Any]:
+    """Return `account` without raw collector payloads.
+
+    Keeps what the Markdown, CSV and PDF reports read (the AWS Config rule
+    counts and sample), so the full evidence can be dropped once streamed.
+    """
+    evidence: List[Dict[str, Any]] = []
+    for entry in account.get("evidence", []):
+        config_rules = entry.get("data", {}).get("config_rules", {})
+        view = {key: value for key, value in entry.items() if key != "data"}
+        view["data"] = {
+            "config_rules": {
+                "noncompliant_count": config_rules.get("noncompliant_count", 0),
+                "rules_sample": config_rules.get("rules_sample", []),
+            }
+        }
+        evidence.append(view)
+    return {**account, "evidence": evidence}
+
+
+def load_evidence(path: str) -> Dict[str, Any]:
+    """Rebuild the evidence.json payload from an evidence.ndjson file."""
+    header: Optional[Dict[str, Any]] = None
+    trailer: Optional[Dict[str, Any]] = None
+    accounts: List[Dict[str, Any]] = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            record = json.loads(line)
+            kind = record.pop("record")
+            if kind == "header":
+                header = record
+            elif kind == "account":
+                accounts.append(record)
+            elif kind == "trailer":
+                trailer = record
+    if header is None or trailer is None:
+        raise ValueError(f"{path} is incomplete: missing header or trailer record.")
+    return evidence_document(header, trailer["generated_at"], accounts)
+
+
+def derive_evidence_json(source: str, target: Optional[str] = None) -> str:
+    """Write the evidence.json equivalent of `source` (next to it by default)."""
+    if target is None:
+        target = os.path.join(os.path.dirname(source), "evidence.json")
+    payload = load_evidence(source)
+    with open(target, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+    return target
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+    if len(args) not in (1, 2):
+        raise SystemExit(
+            "usage: python -m soc2_scanner.evidence_ndjson EVIDENCE_NDJSON [OUTPUT_JSON]"
+        )
+    print(derive_evidence_json(*args))
+
+
+if __name__ == "__main__":
+    main()
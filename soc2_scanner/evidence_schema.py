@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+
+EVIDENCE_SCHEMAS = ("v2", "legacy")
+SCHEMA_VERSION = 2
+
+
+def dedupe_account(account: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the schema v2 shape of `account`.
+
+    Controls evaluated from the same collector share its payload, so each
+    payload is stored once in the account's `collectors` map and every
+    control lists the keys it used in `data_refs`. A payload that differs
+    from the one already stored under its key stays inline in the control's
+    `data`.
+    """
+    collectors: Dict[str, Any] = {}
+    evidence: List[Dict[str, Any]] = []
+    for entry in account.get("evidence", []):
+        refs: List[str] = []
+        inline: Dict[str, Any] = {}
+        for key, payload in entry.get("data", {}).items():
+            stored = collectors.setdefault(key, payload)
+            if stored is payload or stored == payload:
+                refs.append(key)
+            else:
+                inline[key] = payload
+        record = {key: value for key, value in entry.items() if key != "data"}
+        record["data_refs"] = refs
+        if inline:
+            record["data"] = inline
+        evidence.append(record)
+    return {**account, "collectors": collectors, "evidence": evidence}
+
+
+def inline_account(account: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the legacy shape of a schema v2 `account`, with every payload inline."""
+    collectors = account.get("collectors", {})
+    evidence: List[Dict[str, Any]] = []
+    for entry in account.get("evidence", []):
+        record = {key: value for key, value in entry.items() if key != "data_refs"}
+        record["data"] = {
+            **{key: collectors[key] for key in entry.get("data_refs", [])},
+            **entry.get("data", {}),
+        }
+        evidence.append(record)
+    legacy = {key: value for key, value in account.items() if key != "collectors"}
+    legacy["evidence"] = evidence
+    return legacy
+
+
+def account_record(account: Dict[str, Any], schema_version: Optional[int]) -> Dict[str, Any]:
+    """How `account` is serialized under `schema_version` (None is the legacy shape)."""
+    if schema_version == SCHEMA_VERSION:
+        return dedupe_account(account)
+    return account
+
+
+def evidence_document(
+    header: Dict[str, Any], generated_at: str, records: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """The evidence.json payload for already serialized account `records`.
+
+    The layout follows the header's `schema_version`: v2 lists every account
+    under `accounts`; the legacy layout puts the first account's evidence at
+    the top level and lists accounts only when there is more than one (or
+    when the run is a shard, so merging never loses an account's identity).
+    """
+    if header.get("schema_version") == SCHEMA_VERSION:
+        return {**header, "generated_at": generated_at, "accounts": records}
+    return {
+        **header,
+        "generated_at": generated_at,
+        "evidence": records[0]["evidence"] if records else [],
+        "accounts": records if len(records) > 1 or header.get("shard") else [],
+    }
+
+
+def versioned_header(base: Dict[str, Any], schema: str) -> Dict[str, Any]:
+    """`base` run metadata, tagged with the schema version unless `schema` is legacy."""
+    if schema == "legacy":
+        return dict(base)
+    return {**base, "schema_version": SCHEMA_VERSION}
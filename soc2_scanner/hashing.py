@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+
+MANIFEST_FILE = "manifest.sha256"
+HASH_SUFFIX = ".sha256"
+DEFAULT_VERIFY_WORKERS = 4
+
+
+class HashingWriter(io.BufferedIOBase):
+    """Binary file writer that updates a SHA-256 with every write.
+
+    The digest of an artifact is ready as soon as it is closed, so it never
+    has to be read back from disk to be hashed.
+    """
+
+    def __init__(self, path: str) -> None:
+        super().__init__()
+        self.path = path
+        self._sha256 = hashlib.sha256()
+        self._handle = open(path, "wb")
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._sha256.update(data)
+        return self._handle.write(data)
+
+    def tell(self) -> int:
+        return self._handle.tell()
+
+    def flush(self) -> None:
+        if not self.closed:
+            self._handle.flush()
+
+    def close(self) -> None:
+        if not self.closed:
+            super().close()
+            self._handle.close()
+
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def hashing_open(
+    path: str, mode: str = "w", newline: Optional[str] = None
+) -> Tuple[IO[Any], HashingWriter]:
+    """Open `path` for writing ("w" or "wb"); return the handle and its HashingWriter.
+
+    Text handles behave like `open(path, "w", encoding="utf-8", newline=newline)`.
+    """
+    writer = HashingWriter(path)
+    if mode == "wb":
+        return writer, writer
+    if mode != "w":
+        raise ValueError(f"Unsupported mode {mode!r}; use 'w' or 'wb'.")
+    return io.TextIOWrapper(writer, encoding="utf-8", newline=newline), writer
+
+
+def hash_path(path: str) -> str:
+    """SHA-256 of an existing file, hashed from a read-only memory map."""
+    with open(path, "rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+
+
+def format_hash_line(digest: str, name: str) -> str:
+    """One line in `sha256sum` format."""
+    return f"{digest}  {name}\n"
+
+
+class ArtifactManifest:
+    """Digests of the artifacts of one run, written out as manifest.sha256.
+
+    `open` hands out hashing handles and records each digest when the handle
+    is closed; digests computed elsewhere (the NDJSON stream, the summary
+    CSV) are recorded with `add`.
+    """
+
+    def __init__(self) -> None:
+        self._digests: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def open(self, path: str, mode: str = "w", newline: Optional[str] = None) -> Iterator[IO[Any]]:
+        handle, writer = hashing_open(path, mode, newline)
+        with handle:
+            yield handle
+        self.add(path, writer.hexdigest())
+
+    def add(self, path: str, digest: str) -> None:
+        with self._lock:
+            self._digests[path] = digest
+
+    def add_file(self, path: str) -> str:
+        """Record an artifact written by code that cannot use `open`."""
+        digest = hash_path(path)
+        self.add(path, digest)
+        return digest
+
+    def digest(self, path: str) -> str:
+        with self._lock:
+            return self._digests[path]
+
+    def write(self, run_dir: str) -> str:
+        """Write manifest.sha256 for every recorded artifact inside `run_dir`."""
+        with self._lock:
+            entries = sorted(
+                (os.path.relpath(path, run_dir), digest) for path, digest in self._digests.items()
+            )
+        manifest_path = os.path.join(run_dir, MANIFEST_FILE)
+        with open(manifest_path, "w", encoding="utf-8") as handle:
+            for name, digest in entries:
+                if not name.startswith(os.pardir):
+                    handle.write(format_hash_line(digest, name))
+        return manifest_path
+
+
+@dataclass
+class VerifyResult:
+    path: str
+    expected: str
+    actual: Optional[str]
+    source: str
+
+    @property
+    def ok(self) -> bool:
+        return self.actual == self.expected
+
+
+def _read_hash_lines(path: str) -> List[Tuple[str, str]]:
+    entries: List[Tuple[str, str]] = []
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                digest, name = line.rstrip("\n").split("  ", 1)
+                entries.append((digest, name))
+    return entries
+
+
+def _expected_digests(run_dir: str) -> List[Tuple[str, str, str]]:
+    expected: List[Tuple[str, str, str]] = []
+    for name in sorted(os.listdir(run_dir)):
+        if not name.endswith(HASH_SUFFIX):
+            continue
+        for digest, target in _read_hash_lines(os.path.join(run_dir, name)):
+            expected.append((os.path.join(run_dir, target), digest, name))
+    return expected
+
+
+def verify_run(run_dir: str, max_workers: int = DEFAULT_VERIFY_WORKERS) -> List[VerifyResult]:
+    """Check every digest in manifest.sha256 and the per-file .sha256 files.
+
+    Each distinct file is hashed once, from a memory map, with up to
+    `max_workers` files hashed in parallel (hashlib releases the GIL).
+    Missing files are reported with `actual=None`.
+    """
+    if not os.path.isfile(os.path.join(run_dir, MANIFEST_FILE)):
+        raise FileNotFoundError(f"No {MANIFEST_FILE} in {run_dir}.")
+    expected = _expected_digests(run_dir)
+
+    def _hash(path: str) -> Optional[str]:
+        try:
+            return hash_path(path)
+        except FileNotFoundError:
+            return None
+
+    paths = list(dict.fromkeys(path for path, _, _ in expected))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="soc2-verify") as executor:
+        actual = dict(zip(paths, executor.map(_hash, paths)))
+    return [
+        VerifyResult(path=path, expected=digest, actual=actual[path], source=source)
+        for path, digest, source in expected
+    ]
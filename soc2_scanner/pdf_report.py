@@ -0,0 +1,430 @@
+from __future__ import annotations
+
+import io
+import os
+from functools import lru_cache
+from typing import IO, Any, Dict, Iterator, List, Optional, Sequence
+
+from soc2_scanner.rollup import status_columns
+
+
+# Per-account detail PDFs rendered per worker task. Each account is its own
+# reportlab build, so memory is bounded by one account, not the organization.
+PDF_CHUNK_ACCOUNTS = 20
+
+TITLE = "SOC 2 Evidence Summary"
+
+# Matrix cell text and background per control status.
+STATUS_CELLS = {
+    "pass": ("Pass", "#DCFCE7"),
+    "fail": ("Fail", "#FEE2E2"),
+    "needs_review": ("Review", "#FEF3C7"),
+    "not_scanned": ("-", "#F3F4F6"),
+}
+
+
+@lru_cache(maxsize=None)
+def _styles() -> Any:
+    """The report stylesheet, built once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name="Small", parent=styles["BodyText"], fontSize=9))
+    styles.add(
+        ParagraphStyle(
+            name="SmallWrap",
+            parent=styles["Small"],
+            wordWrap="CJK",
+            leading=11,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="Subtitle",
+            parent=styles["Title"],
+            fontSize=14,
+            leading=18,
+            textColor=colors.HexColor("#374151"),
+            spaceBefore=4,
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="MetaLabel",
+            parent=styles["BodyText"],
+            fontSize=9,
+            textColor=colors.HexColor("#6B7280"),
+        )
+    )
+    styles.add(
+        ParagraphStyle(
+            name="MetaValue",
+            parent=styles["BodyText"],
+            fontSize=9,
+            textColor=colors.HexColor("#111827"),
+        )
+    )
+    return styles
+
+
+def _build(story: List[Any], attribution: str, title: str = TITLE) -> bytes:
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import LETTER
+    from reportlab.platypus import SimpleDocTemplate
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=LETTER,
+        rightMargin=36,
+        leftMargin=36,
+        topMargin=36,
+        bottomMargin=36,
+        title=title,
+    )
+
+    def _draw_footer(canvas, doc_instance) -> None:
+        canvas.saveState()
+        canvas.setFont("Helvetica", 8)
+        canvas.setFillColor(colors.HexColor("#6B7280"))
+        canvas.drawString(36, 18, attribution)
+        canvas.drawRightString(LETTER[0] - 36, 18, f"Page {canvas.getPageNumber()}")
+        canvas.restoreState()
+
+    doc.build(story, onFirstPage=_draw_footer, onLaterPages=_draw_footer)
+    return buffer.getvalue()
+
+
+def _cover_story(cover: Dict[str, Any], attribution: str) -> List[Any]:
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+
+    styles = _styles()
+    story: List[Any] = []
+
+    story.append(Paragraph(TITLE, styles["Title"]))
+    story.append(Paragraph("AWS Evidence Collection Report", styles["Subtitle"]))
+    story.append(Spacer(1, 14))
+
+    meta_rows = [
+        [
+            Paragraph("Run ID", styles["MetaLabel"]),
+            Paragraph(cover["run_id"], styles["MetaValue"]),
+            Paragraph("Generated (UTC)", styles["MetaLabel"]),
+            Paragraph(cover["generated_at"], styles["MetaValue"]),
+        ],
+        [
+            Paragraph("Account ID", styles["MetaLabel"]),
+            Paragraph(cover["account_id"], styles["MetaValue"]),
+            Paragraph("Caller ARN", styles["MetaLabel"]),
+            Paragraph(cover["caller_arn"], styles["MetaValue"]),
+        ],
+        [
+            Paragraph("Regions", styles["MetaLabel"]),
+            Paragraph(", ".join(cover["regions"]), styles["MetaValue"]),
+            Paragraph("Controls", styles["MetaLabel"]),
+            Paragraph(", ".join(cover["controls"]), styles["MetaValue"]),
+        ],
+        [
+            Paragraph("Account count", styles["MetaLabel"]),
+            Paragraph(str(cover["account_count"]), styles["MetaValue"]),
+            Paragraph("Report scope", styles["MetaLabel"]),
+            Paragraph("SOC 2 Security (TSP 2017)", styles["MetaValue"]),
+        ],
+        [
+            Paragraph("Attribution", styles["MetaLabel"]),
+            Paragraph(attribution, styles["MetaValue"]),
+            Paragraph("", styles["MetaLabel"]),
+            Paragraph("", styles["MetaValue"]),
+        ],
+    ]
+    meta_table = Table(meta_rows, colWidths=[80, 185, 80, 185])
+    meta_table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F9FAFB")),
+                ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
+                ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#E5E7EB")),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 8),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 8),
+                ("TOPPADDING", (0, 0), (-1, -1), 6),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
+            ]
+        )
+    )
+    story.append(meta_table)
+    story.append(Spacer(1, 14))
+
+    story.append(Paragraph("Notes", styles["Heading2"]))
+    story.append(Paragraph(cover["narrative"], styles["BodyText"]))
+    story.append(Spacer(1, 12))
+    return story
+
+
+def _account_story(account: Dict[str, Any]) -> List[Any]:
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+
+    styles = _styles()
+    story: List[Any] = []
+    story.append(Paragraph(f"Account {account.get('account_id')}", styles["Heading2"]))
+    if account.get("account_name"):
+        story.append(Paragraph(f"Name: {account.get('account_name')}", styles["Normal"]))
+    if account.get("identity_error"):
+        story.append(Paragraph(f"Identity error: {account.get('identity_error')}", styles["Normal"]))
+    story.append(Spacer(1, 12))
+
+    table_data = [
+        [
+            "Control",
+            "Title",
+            "Status",
+            "Gaps",
+            "Errors",
+            "Noncompliant Rules",
+        ]
+    ]
+    for control in account["controls"]:
+        table_data.append(
+            [
+                control["control_id"],
+                control["title"],
+                control["status"],
+                str(control["gap_count"]),
+                str(control["error_count"]),
+                str(control["noncompliant_count"]),
+            ]
+        )
+
+    table = Table(table_data, repeatRows=1)
+    table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1F2937")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 9),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+            ]
+        )
+    )
+    story.append(table)
+    story.append(Spacer(1, 12))
+
+    for control in account["controls"]:
+        story.append(Paragraph(f"{control['control_id']} Details", styles["Heading3"]))
+        if control.get("control_language"):
+            story.append(
+                Paragraph(
+                    f"<b>Control description:</b> {control['control_language']}",
+                    styles["Small"],
+                )
+            )
+        story.append(Paragraph(f"<b>Status:</b> {control['status_text']}", styles["Small"]))
+        story.append(Paragraph(control["summary"], styles["Small"]))
+        story.append(Paragraph(f"Collected at: {control.get('collected_at')}", styles["Small"]))
+        if control.get("provenance"):
+            story.append(Paragraph(f"Data: {control['provenance']}", styles["Small"]))
+        if control.get("origin"):
+            story.append(Paragraph(f"Origin: {control['origin']}", styles["Small"]))
+        if control["issue_rows"]:
+            detail_table = [
+                ["Type", "Finding", "Recommendation"],
+            ]
+            for row in control["issue_rows"]:
+                detail_table.append(
+                    [
+                        Paragraph(row["type"], styles["Small"]),
+                        Paragraph(row["item"], styles["SmallWrap"]),
+                        Paragraph(row["recommendation"], styles["SmallWrap"]),
+                    ]
+                )
+            detail = Table(detail_table, repeatRows=1, colWidths=[60, 300, 160])
+            detail.setStyle(
+                TableStyle(
+                    [
+                        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#111827")),
+                        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                        ("FONTSIZE", (0, 0), (-1, -1), 9),
+                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                        ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
+                    ]
+                )
+            )
+            story.append(Spacer(1, 6))
+            story.append(detail)
+        story.append(Spacer(1, 8))
+    return story
+
+
+def _account_title(account: Dict[str, Any]) -> str:
+    name = account.get("account_name")
+    return f"Account {account.get('account_id')}" + (f" ({name})" if name else "")
+
+
+def _header_table(rows: List[List[Any]], col_widths: Optional[List[float]] = None) -> Any:
+    from reportlab.lib import colors
+    from reportlab.platypus import Table, TableStyle
+
+    table = Table(rows, repeatRows=1, colWidths=col_widths)
+    table.setStyle(
+        TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1F2937")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+                ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, -1), 8),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ]
+        )
+    )
+    return table
+
+
+def _matrix_table(rollup: Dict[str, Any]) -> Any:
+    from reportlab.lib import colors
+    from reportlab.platypus import Paragraph
+
+    styles = _styles()
+    controls = rollup["controls"]
+    control_width = min(60.0, 330.0 / max(1, len(controls)))
+    rows: List[List[Any]] = [["Account", "Name", *controls]]
+    cell_styles = []
+    for row_index, row in enumerate(rollup["matrix"], start=1):
+        cells: List[Any] = [
+            str(row["account_id"]),
+            Paragraph(row["account_name"] or "", styles["SmallWrap"]),
+        ]
+        for column, status in enumerate(row["statuses"], start=2):
+            text, background = STATUS_CELLS.get(status, (status, "#FFFFFF"))
+            cells.append(text)
+            cell = (column, row_index)
+            cell_styles.append(("BACKGROUND", cell, cell, colors.HexColor(background)))
+        rows.append(cells)
+    table = _header_table(rows, [80, 130, *[control_width] * len(controls)])
+    table.setStyle(cell_styles + [("ALIGN", (2, 0), (-1, -1), "CENTER")])
+    return table
+
+
+def _rollup_story(rollup: Dict[str, Any], details: Optional[str]) -> List[Any]:
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = _styles()
+    story: List[Any] = [Paragraph("Control Status by Control", styles["Heading2"])]
+    statuses = status_columns(rollup["status_counts"])
+    rows: List[List[Any]] = [
+        ["Control", *[status.replace("_", " ").capitalize() for status in statuses]]
+    ]
+    for control in rollup["controls"]:
+        counts = rollup["status_counts"][control]
+        rows.append([control, *[str(counts.get(status, 0)) for status in statuses]])
+    story.append(_header_table(rows))
+    story.append(Spacer(1, 12))
+
+    story.append(Paragraph("Top Gaps", styles["Heading2"]))
+    if rollup["top_gaps"]:
+        rows = [["Gap", "Accounts", "Controls", "Recommendation"]]
+        for gap in rollup["top_gaps"]:
+            rows.append(
+                [
+                    Paragraph(gap["gap"], styles["SmallWrap"]),
+                    str(gap["account_count"]),
+                    ", ".join(gap["controls"]),
+                    Paragraph(gap["recommendation"], styles["SmallWrap"]),
+                ]
+            )
+        story.append(_header_table(rows, [190, 50, 70, 230]))
+    else:
+        story.append(Paragraph("No gaps were found.", styles["Small"]))
+    story.append(Spacer(1, 12))
+
+    story.append(Paragraph("Error Hotspots", styles["Heading2"]))
+    if rollup["error_hotspots"]:
+        rows = [["Control", "Error", "Accounts", "Example accounts"]]
+        for hotspot in rollup["error_hotspots"]:
+            rows.append(
+                [
+                    hotspot["control_id"] or "Account access",
+                    Paragraph(hotspot["error"], styles["SmallWrap"]),
+                    str(hotspot["account_count"]),
+                    Paragraph(", ".join(hotspot["accounts_sample"]), styles["SmallWrap"]),
+                ]
+            )
+        story.append(_header_table(rows, [80, 230, 50, 180]))
+    else:
+        story.append(Paragraph("No errors were reported.", styles["Small"]))
+    story.append(Spacer(1, 12))
+
+    story.append(Paragraph("Control Status Matrix", styles["Heading2"]))
+    if details:
+        note = f"Per-account detail is in {details}/&lt;account_id&gt;.pdf."
+        story.append(Paragraph(note, styles["Small"]))
+    story.append(Spacer(1, 6))
+    story.append(_matrix_table(rollup))
+    return story
+
+
+def write_summary_pdf(
+    handle: IO[bytes],
+    cover: Dict[str, Any],
+    rollup: Dict[str, Any],
+    attribution: str,
+    details: Optional[str] = None,
+) -> None:
+    """Write the organization summary PDF to `handle`.
+
+    `cover` carries the run metadata and narrative and `rollup` is an
+    OrgRollup summary. `details` names the directory holding per-account
+    PDFs, when they were written.
+    """
+    from reportlab.platypus import PageBreak
+
+    story = _cover_story(cover, attribution)
+    story.append(PageBreak())
+    story.extend(_rollup_story(rollup, details))
+    handle.write(_build(story, attribution))
+
+
+def render_accounts(accounts: Sequence[Dict[str, Any]], attribution: str) -> List[bytes]:
+    """Build one detail PDF per account; returns their bytes in order."""
+    return [
+        _build(_account_story(account), attribution, f"{TITLE} - {_account_title(account)}")
+        for account in accounts
+    ]
+
+
+def _chunks(accounts: Sequence[Dict[str, Any]], size: int) -> List[Sequence[Dict[str, Any]]]:
+    return [accounts[start : start + size] for start in range(0, len(accounts), size)]
+
+
+def account_pdfs(
+    accounts: Sequence[Dict[str, Any]], attribution: str, max_workers: Optional[int] = None
+) -> Iterator[bytes]:
+    """Yield the detail PDF of each account, in order.
+
+    Each account is a plain view built by the scanner (controls with their
+    issue rows). Accounts are laid out in chunks of PDF_CHUNK_ACCOUNTS, in
+    worker processes when there is more than one chunk.
+    """
+    chunks = _chunks(accounts, PDF_CHUNK_ACCOUNTS)
+    workers = min(len(chunks), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from render_accounts(chunk, attribution)
+        return
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    # spawn rather than fork: the scan leaves worker threads (and their locks) behind.
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        for rendered in executor.map(render_accounts, chunks, [attribution] * len(chunks)):
+            yield from rendered
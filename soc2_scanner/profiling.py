@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import io
+import os
+import threading
+from typing import Any, Dict, List
+
+
+PROFILE_STATS_FILE = "profile.pstats"
+PROFILE_SUMMARY_FILE = "profile_summary.txt"
+DEFAULT_TOP_N = 30
+
+
+class PhaseTimer:
+    """Accumulates wall and CPU time per named phase of a run.
+
+    CPU time is process-wide, so a phase that waits on worker threads (the
+    account scan) is charged with the CPU those workers burn.
+    """
+
+    def __init__(self) -> None:
+        self._phases: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, wall: float, cpu: float) -> None:
+        with self._lock:
+            phase = self._phases.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0})
+            phase["calls"] += 1
+            phase["wall"] += wall
+            phase["cpu"] += cpu
+
+    def summary(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "name": name,
+                    "calls": int(phase["calls"]),
+                    "wall_seconds": round(phase["wall"], 6),
+                    "cpu_seconds": round(phase["cpu"], 6),
+                }
+                for name, phase in self._phases.items()
+            ]
+
+
+class CProfileProfiler:
+    """Deterministic profiler covering the calling thread and every thread it starts.
+
+    `threading.setprofile` hands each new thread a hook whose first call
+    swaps in a fresh cProfile.Profile for that thread; the per-thread
+    profiles are merged when the stats are written.
+    """
+
+    name = "cprofile"
+
+    def __init__(self) -> None:
+        import cProfile
+
+        self._profile_class = cProfile.Profile
+        self._main = cProfile.Profile()
+        self._threads: List[Any] = []
+        self._lock = threading.Lock()
+
+    def _start_thread(self, frame: Any, event: str, arg: Any) -> None:
+        profile = self._profile_class()
+        with self._lock:
+            self._threads.append(profile)
+        profile.enable()
+
+    def start(self) -> None:
+        threading.setprofile(self._start_thread)
+        self._main.enable()
+
+    def stop(self) -> None:
+        self._main.disable()
+        threading.setprofile(None)
+
+    def write(self, run_dir: str, top_n: int = DEFAULT_TOP_N) -> List[str]:
+        import pstats
+
+        stats = pstats.Stats(self._main)
+        with self._lock:
+            for profile in self._threads:
+                stats.add(profile)
+        stats_path = os.path.join(run_dir, PROFILE_STATS_FILE)
+        stats.dump_stats(stats_path)
+
+        buffer = io.StringIO()
+        stats.stream = buffer
+        buffer.write(f"Top {top_n} functions by cumulative time\n\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top_n)
+        buffer.write(f"\nTop {top_n} functions by internal time\n\n")
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(top_n)
+        summary_path = os.path.join(run_dir, PROFILE_SUMMARY_FILE)
+        with open(summary_path, "w", encoding="utf-8") as handle:
+            handle.write(buffer.getvalue())
+        return [stats_path, summary_path]
+
+
+class PyinstrumentProfiler:
+    """Statistical profiler backed by pyinstrument.
+
+    pyinstrument samples the calling thread only, so it misses the account,
+    role and region pool threads; choose it explicitly to profile the main
+    thread's own work.
+    """
+
+    name = "pyinstrument"
+
+    def __init__(self) -> None:
+        try:
+            from pyinstrument import Profiler
+        except ImportError as exc:
+            raise RuntimeError("pyinstrument is required for the pyinstrument profiler.") from exc
+        self._profiler = Profiler()
+
+    def start(self) -> None:
+        self._profiler.start()
+
+    def stop(self) -> None:
+        self._profiler.stop()
+
+    def write(self, run_dir: str, top_n: int = DEFAULT_TOP_N) -> List[str]:
+        from pyinstrument.renderers import PStatsRenderer
+
+        stats_path = os.path.join(run_dir, PROFILE_STATS_FILE)
+        # PStatsRenderer returns marshal bytes decoded with surrogateescape.
+        data = self._profiler.output(PStatsRenderer())
+        with open(stats_path, "wb") as handle:
+            if isinstance(data, str):
+                data = data.encode("utf-8", "surrogateescape")
+            handle.write(data)
+
+        summary_path = os.path.join(run_dir, PROFILE_SUMMARY_FILE)
+        with open(summary_path, "w", encoding="utf-8") as handle:
+            handle.write(self._profiler.output_text(unicode=True, color=False))
+        return [stats_path, summary_path]
+
+
+PROFILERS = {
+    CProfileProfiler.name: CProfileProfiler,
+    PyinstrumentProfiler.name: PyinstrumentProfiler,
+}
+
+
+def create_profiler(name: str = "auto") -> Any:
+    """Return a profiler by name; "auto" is cProfile, which sees every worker thread."""
+    if name == "auto":
+        name = CProfileProfiler.name
+    if name not in PROFILERS:
+        raise ValueError(f"Unknown profiler {name!r}; choose from auto, {', '.join(PROFILERS)}.")
+    return PROFILERS[name]()
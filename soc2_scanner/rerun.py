@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
+
+from soc2_scanner.collector_cache import provenance
+from soc2_scanner.evidence_ndjson import EVIDENCE_NDJSON, load_evidence
+from soc2_scanner.evidence_schema import SCHEMA_VERSION, inline_account
+
+if TYPE_CHECKING:
+    from soc2_scanner.checkpoints import AccountScan
+    from soc2_scanner.controls import EvidenceContext
+
+
+EVIDENCE_JSON = "evidence.json"
+
+# Entry origins in a rerun: evaluated again by this run, or copied from the
+# run it reran (or whichever run evaluated it before that).
+RERUN = "rerun"
+CARRIED_OVER = "carried_over"
+
+# Provenance source of collector results reused from the previous run.
+PREVIOUS_RUN = "previous_run"
+
+
+def load_run_evidence(run_dir: str) -> Dict[str, Any]:
+    """The evidence payload of a finished run, from evidence.json or evidence.ndjson."""
+    json_path = os.path.join(run_dir, EVIDENCE_JSON)
+    if os.path.exists(json_path):
+        with open(json_path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    ndjson_path = os.path.join(run_dir, EVIDENCE_NDJSON)
+    if os.path.exists(ndjson_path):
+        return load_evidence(ndjson_path)
+    raise FileNotFoundError(
+        f"No {EVIDENCE_JSON} or {EVIDENCE_NDJSON} in {run_dir}; a rerun needs the evidence "
+        "of the run it repeats."
+    )
+
+
+def run_accounts(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Every account of an evidence payload, with collector payloads inline, in either schema."""
+    if payload.get("schema_version") == SCHEMA_VERSION:
+        return [inline_account(account) for account in payload.get("accounts", [])]
+    if payload.get("accounts"):
+        return list(payload["accounts"])
+    return [
+        {
+            "account_id": payload.get("account_id"),
+            "account_name": None,
+            "caller_arn": payload.get("caller_arn"),
+            "identity_error": payload.get("identity_error"),
+            "evidence": payload.get("evidence", []),
+        }
+    ]
+
+
+def _failed(entry: Dict[str, Any]) -> bool:
+    return entry.get("status") == "needs_review" and bool(entry.get("errors"))
+
+
+def failed_controls(account: Dict[str, Any], controls: List[str]) -> List[str]:
+    """Controls of `account` to evaluate again: all of them if its role could not be
+    assumed, otherwise those that need review because of collection errors."""
+    if account.get("identity_error"):
+        return list(controls)
+    evaluated = {entry.get("control_id"): entry for entry in account.get("evidence", [])}
+    return [
+        control for control in controls if control not in evaluated or _failed(evaluated[control])
+    ]
+
+
+def _with_origin(entry: Dict[str, Any], source: str, run_id: Optional[str]) -> Dict[str, Any]:
+    return {**entry, "origin": {"source": source, "run_id": run_id}}
+
+
+class RerunPlan:
+    """Which accounts and controls of a previous run to evaluate again.
+
+    Accounts whose role could not be assumed are scanned in full; other
+    accounts only re-evaluate the controls that need review because of
+    errors, and of those only the collectors that failed run again (the rest
+    are reused from the previous run). Everything else is carried over, and
+    each entry of the merged evidence records its `origin`.
+    """
+
+    def __init__(self, payload: Dict[str, Any]) -> None:
+        self.source_run_id: Optional[str] = payload.get("run_id")
+        self.controls: List[str] = list(payload.get("controls", []))
+        self.regions: List[str] = list(payload.get("regions", []))
+        self.organization_error: Optional[str] = payload.get("organization_error")
+        self.shard: Optional[Dict[str, Any]] = payload.get("shard")
+        self.accounts = {account["account_id"]: account for account in run_accounts(payload)}
+        self._failed = {
+            account_id: failed_controls(account, self.controls)
+            for account_id, account in self.accounts.items()
+        }
+
+    @property
+    def account_ids(self) -> List[str]:
+        return list(self.accounts)
+
+    def account_map(self) -> Dict[str, str]:
+        return {
+            account_id: account.get("account_name") or ""
+            for account_id, account in self.accounts.items()
+        }
+
+    def controls_for(self, account_id: str) -> List[str]:
+        return self._failed.get(account_id, [])
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "source_run_id": self.source_run_id,
+            "accounts": sum(1 for controls in self._failed.values() if controls),
+            "controls": sum(len(controls) for controls in self._failed.values()),
+        }
+
+    def seed(self, context: EvidenceContext, account_id: str) -> None:
+        """Put the previous run's error-free collector results for `account_id` into `context`."""
+        previous = self.accounts.get(account_id, {})
+        if previous.get("identity_error"):
+            return
+        for entry in previous.get("evidence", []):
+            for key, payload in entry.get("data", {}).items():
+                if key in context.cache or payload.get("errors"):
+                    continue
+                context.cache[key] = payload
+                info = entry.get("data_provenance", {}).get(key)
+                if info:
+                    context.provenance[key] = provenance(PREVIOUS_RUN, info["fetched_at"])
+
+    def carry_over(self, account_id: str) -> Dict[str, Any]:
+        previous = self.accounts[account_id]
+        return {
+            **previous,
+            "evidence": [
+                _with_origin(
+                    entry, CARRIED_OVER, entry.get("origin", {}).get("run_id", self.source_run_id)
+                )
+                for entry in previous.get("evidence", [])
+            ],
+        }
+
+    def merge(self, account_id: str, fresh: Dict[str, Any], run_id: str) -> Dict[str, Any]:
+        """The previous account with the re-evaluated entries of `fresh` in place."""
+        previous = self.accounts[account_id]
+        if fresh.get("identity_error"):
+            # Still unreachable: keep whatever evidence the previous run had.
+            return fresh if previous.get("identity_error") else self.carry_over(account_id)
+        carried = {
+            entry.get("control_id"): entry for entry in self.carry_over(account_id)["evidence"]
+        }
+        rerun = {
+            entry["control_id"]: _with_origin(entry, RERUN, run_id) for entry in fresh["evidence"]
+        }
+        evidence = [
+            rerun.get(control) or carried[control]
+            for control in self.controls
+            if control in rerun or control in carried
+        ]
+        return {**fresh, "evidence": evidence}
+
+
+def rerun_scan(
+    plan: RerunPlan,
+    account_ids: List[str],
+    scan: AccountScan,
+    run_id: str,
+    on_settled: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield the merged result of every account in order, scanning only those with failures.
+
+    Accounts without failed controls are carried over without contacting
+    them. Results are merged as they settle, before `on_settled` sees them.
+    """
+    positions = [
+        index for index, account_id in enumerate(account_ids) if plan.controls_for(account_id)
+    ]
+    pending = set(positions)
+    merged: Dict[int, Dict[str, Any]] = {}
+
+    def _settled(position: int, account: Dict[str, Any]) -> None:
+        index = positions[position]
+        merged[position] = result = plan.merge(account_ids[index], account, run_id)
+        if on_settled is not None:
+            on_settled(index, result)
+
+    scanned = scan([account_ids[index] for index in positions], _settled)
+    try:
+        position = 0
+        for index, account_id in enumerate(account_ids):
+            if index in pending:
+                next(scanned)
+                yield merged.pop(position)
+                position += 1
+            else:
+                account = plan.carry_over(account_id)
+                if on_settled is not None:
+                    on_settled(index, account)
+                yield account
+    finally:
+        scanned.close()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+TOP_GAPS = 10
+TOP_ERROR_HOTSPOTS = 10
+HOTSPOT_ACCOUNT_SAMPLE = 5
+
+# Matrix cell for a control an account has no result for (e.g. its role
+# could not be assumed).
+NOT_SCANNED = "not_scanned"
+
+# Status columns every report shows, in this order.
+STATUS_COLUMNS = ("pass", "fail", "needs_review", NOT_SCANNED)
+
+
+def status_columns(status_counts: Dict[str, Dict[str, int]]) -> List[str]:
+    """`STATUS_COLUMNS`, then any other status in `status_counts`, e.g. "unknown"."""
+    present = {status for counts in status_counts.values() for status in counts}
+    return [*STATUS_COLUMNS, *sorted(present.difference(STATUS_COLUMNS))]
+
+
+class OrgRollup:
+    """Organization-level view of a run, aggregated in a single pass over the accounts.
+
+    Feed each account result to `add_account`; `summary()` then returns the
+    control status matrix (one row per account, one cell per control),
+    status counts per control, the gaps that affect the most accounts, and
+    the errors that recur across the most accounts. Nothing per-control is
+    kept beyond statuses and counters, so the roll-up stays small for
+    thousands of accounts.
+
+    `recommend_gap` maps a gap to its recommendation and `error_label`
+    groups raw AWS errors into a readable category for the hotspot list.
+    """
+
+    def __init__(
+        self,
+        controls: List[str],
+        recommend_gap: Callable[[str], str] = str,
+        error_label: Callable[[str], str] = str,
+    ) -> None:
+        self.controls = list(controls)
+        self._recommend_gap = recommend_gap
+        self._error_label = error_label
+        self._rows: List[Dict[str, Any]] = []
+        self._status_counts: Dict[str, Counter] = {control: Counter() for control in controls}
+        self._gap_accounts: Dict[str, set] = {}
+        self._gap_controls: Dict[str, set] = {}
+        self._error_accounts: Dict[Tuple[Optional[str], str], set] = {}
+        self._error_example: Dict[Tuple[Optional[str], str], str] = {}
+
+    def add_account(self, account: Dict[str, Any]) -> None:
+        account_id = account.get("account_id")
+        statuses: Dict[str, str] = {}
+        for entry in account.get("evidence", []):
+            control_id = entry.get("control_id")
+            statuses[control_id] = entry.get("status") or "unknown"
+            for gap in entry.get("gaps", []):
+                self._gap_accounts.setdefault(gap, set()).add(account_id)
+                self._gap_controls.setdefault(gap, set()).add(control_id)
+            for error in entry.get("errors", []):
+                self._add_error(control_id, error, account_id)
+        if account.get("identity_error"):
+            self._add_error(None, account["identity_error"], account_id)
+        for control in self.controls:
+            self._status_counts[control][statuses.get(control, NOT_SCANNED)] += 1
+        self._rows.append(
+            {
+                "account_id": account_id,
+                "account_name": account.get("account_name"),
+                "identity_error": account.get("identity_error"),
+                "statuses": [statuses.get(control, NOT_SCANNED) for control in self.controls],
+            }
+        )
+
+    def _add_error(self, control_id: Optional[str], error: str, account_id: str) -> None:
+        key = (control_id, self._error_label(error))
+        self._error_accounts.setdefault(key, set()).add(account_id)
+        self._error_example.setdefault(key, error)
+
+    @property
+    def account_count(self) -> int:
+        return len(self._rows)
+
+    def top_gaps(self, limit: int = TOP_GAPS) -> List[Dict[str, Any]]:
+        ranked = sorted(self._gap_accounts.items(), key=lambda item: (-len(item[1]), item[0]))
+        return [
+            {
+                "gap": gap,
+                "account_count": len(accounts),
+                "controls": sorted(self._gap_controls[gap]),
+                "recommendation": self._recommend_gap(gap),
+            }
+            for gap, accounts in ranked[:limit]
+        ]
+
+    def error_hotspots(self, limit: int = TOP_ERROR_HOTSPOTS) -> List[Dict[str, Any]]:
+        ranked = sorted(
+            self._error_accounts.items(),
+            key=lambda item: (-len(item[1]), item[0][0] or "", item[0][1]),
+        )
+        return [
+            {
+                "control_id": control_id,
+                "error": label,
+                "account_count": len(accounts),
+                "accounts_sample": sorted(str(account) for account in accounts)[
+                    :HOTSPOT_ACCOUNT_SAMPLE
+                ],
+                "example": self._error_example[(control_id, label)],
+            }
+            for (control_id, label), accounts in ranked[:limit]
+        ]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "controls": self.controls,
+            "account_count": self.account_count,
+            "matrix": self._rows,
+            "status_counts": {
+                control: dict(counts) for control, counts in self._status_counts.items()
+            },
+            "top_gaps": self.top_gaps(),
+            "error_hotspots": self.error_hotspots(),
+        }
+
+
+def build_rollup(
+    accounts: Iterable[Dict[str, Any]],
+    controls: List[str],
+    recommend_gap: Callable[[str], str] = str,
+    error_label: Callable[[str], str] = str,
+) -> Dict[str, Any]:
+    """Aggregate `accounts` into an OrgRollup summary."""
+    rollup = OrgRollup(controls, recommend_gap, error_label)
+    for account in accounts:
+        rollup.add_account(account)
+    return rollup.summary()
@@ -3,17 +3,76 @@ from __future__ import annotations
 import hashlib
 import json
 import os
-from dataclasses import dataclass, field
+import threading
+import time
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple
-
-import boto3
-import pandas as pd
-from botocore.exceptions import BotoCoreError, ClientError
-
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from soc2_scanner.checkpoints import AccountScan, CheckpointStore, checkpointed_scan
+from soc2_scanner.collector_cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    CollectorCache,
+    Provenance,
+    fetch_through,
+)
 from soc2_scanner.controls import CONTROL_REGISTRY, EvidenceContext, evaluate_control
-from soc2_scanner.controls.context import status_from_findings
-from soc2_scanner.collectors import collect_organizations
+from soc2_scanner.controls.context import CacheStats, status_from_findings
+from soc2_scanner.controls.planner import plan_collectors, prefetch_collectors
+from soc2_scanner.credential_cache import CredentialCache
+from soc2_scanner.evidence_ndjson import EVIDENCE_NDJSON, NdjsonEvidenceWriter, report_view
+from soc2_scanner.evidence_schema import account_record, evidence_document, versioned_header
+from soc2_scanner.hashing import (
+    HASH_SUFFIX,
+    MANIFEST_FILE,
+    ArtifactManifest,
+    format_hash_line,
+    hashing_open,
+    verify_run,
+)
+from soc2_scanner.profiling import (
+    PROFILE_STATS_FILE,
+    PROFILE_SUMMARY_FILE,
+    PhaseTimer,
+    create_profiler,
+)
+from soc2_scanner.rerun import (
+    CARRIED_OVER,
+    PREVIOUS_RUN,
+    RerunPlan,
+    load_run_evidence,
+    rerun_scan,
+)
+from soc2_scanner.rollup import build_rollup, status_columns
+from soc2_scanner.sharding import Shard, merge_shards, select_shard, shard_header
+from soc2_scanner.summary_csv import SummaryCsvWriter
+from soc2_scanner.telemetry import CallTelemetry
+from soc2_scanner.throttling import DEFAULT_MAX_API_RATE, AdaptiveRateLimiter
+from soc2_scanner.tracing import Tracer, active_tracer, span, timing_phases, tracing
+from soc2_scanner.clients import ClientFactory
+from soc2_scanner.collectors import (
+    COLLECTOR_REGISTRY,
+    DEFAULT_REGION_WORKERS,
+    RegionWorkers,
+    resolve_collector,
+)
+
+if TYPE_CHECKING:
+    import boto3
+
+
+# boto3 and botocore are imported on the code paths that need them, so
+# `--help` and `--simulate` start without loading them.
+def __getattr__(name: str) -> Any:
+    # Keeps `soc2_scanner.scanner.boto3` addressable, e.g. for mock.patch.
+    if name == "boto3":
+        import boto3
+
+        return boto3
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
@@ -28,6 +87,39 @@ class ScanConfig:
     external_id: Optional[str] = None
     external_ids: Dict[str, str] = field(default_factory=dict)
     simulate: bool = False
+    credential_cache_dir: Optional[str] = None
+    collector_cache_dir: Optional[str] = None
+    collector_cache_max_bytes: int = DEFAULT_CACHE_MAX_BYTES
+    collector_ttls: Dict[str, int] = field(default_factory=dict)
+    max_account_workers: int = 1
+    role_prefetch: int = 2
+    max_region_workers: int = DEFAULT_REGION_WORKERS
+    region_workers: Dict[str, int] = field(default_factory=dict)
+    max_collector_workers: int = 4
+    max_api_rate: float = DEFAULT_MAX_API_RATE
+    write_telemetry: bool = False
+    trace_output: Optional[str] = None
+    profile_run: bool = False
+    profiler: str = "auto"
+    evidence_format: str = "json"
+    evidence_schema: str = "v2"
+    formats: List[str] = field(default_factory=lambda: list(REPORT_WRITERS))
+    account_details: bool = False
+    resume_dir: Optional[str] = None
+    rerun_dir: Optional[str] = None
+    shard: Optional[Shard] = None
+    executor: str = "thread"
+
+    def __post_init__(self) -> None:
+        for collector in self.region_workers:
+            if collector not in COLLECTOR_REGISTRY:
+                raise ValueError(f"region_workers has an unknown collector: {collector}.")
+
+
+EXECUTORS = ("thread", "process")
+SUMMARY_CSV = "evidence_summary.csv"
+COMPLETENESS_FILE = "run_completeness.json"
+ACCOUNT_DETAILS_DIR = "accounts"
 
 
 def _utc_timestamp() -> str:
@@ -42,22 +134,69 @@ def _ensure_output_dir(output_dir: str) -> None:
     os.makedirs(output_dir, exist_ok=True)
 
 
-def _hash_file(path: str) -> str:
-    hasher = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(8192), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+def _start_run(config: ScanConfig) -> Tuple[str, str, Optional[Dict[str, Any]]]:
+    """Return the run ID, its directory and, with --resume, the checkpointed run state."""
+    if config.resume_dir:
+        run_dir = os.path.normpath(config.resume_dir)
+        state = CheckpointStore(run_dir).load_state()
+        if bool(state.get("simulate")) != config.simulate:
+            raise ValueError(
+                f"{run_dir} was {'' if state.get('simulate') else 'not '}a simulated run; "
+                "resume it with the same --simulate setting."
+            )
+        return state["run_id"], run_dir, state
+    _ensure_output_dir(config.output_dir)
+    run_id = _run_id()
+    run_dir = os.path.join(config.output_dir, run_id)
+    _ensure_output_dir(run_dir)
+    return run_id, run_dir, None
+
 
+def _run_state(
+    config: ScanConfig,
+    header: Dict[str, Any],
+    account_ids: List[str],
+    account_map: Dict[str, str],
+) -> Dict[str, Any]:
+    """What --resume needs to continue the same scan."""
+    return {
+        "run_id": header["run_id"],
+        "simulate": config.simulate,
+        "controls": config.controls,
+        "regions": header["regions"],
+        "accounts": account_ids,
+        "account_map": account_map,
+        "header": header,
+        "rerun_dir": config.rerun_dir,
+    }
 
-def _write_hash_file(target_path: str) -> str:
-    digest = _hash_file(target_path)
-    hash_path = f"{target_path}.sha256"
-    with open(hash_path, "w", encoding="utf-8") as handle:
-        handle.write(f"{digest}  {os.path.basename(target_path)}\n")
+
+def _write_hash_file(target_path: str, manifest: ArtifactManifest) -> str:
+    # The digest was computed while the artifact was written.
+    hash_path = f"{target_path}{HASH_SUFFIX}"
+    with span(f"hash:{os.path.basename(target_path)}", "writer"), open(
+        hash_path, "w", encoding="utf-8"
+    ) as handle:
+        handle.write(format_hash_line(manifest.digest(target_path), os.path.basename(target_path)))
     return hash_path
 
 
+def _open_ndjson_evidence(
+    config: ScanConfig, run_dir: str, header: Dict[str, Any]
+) -> Optional[NdjsonEvidenceWriter]:
+    if config.evidence_format != "ndjson":
+        return None
+    return NdjsonEvidenceWriter(os.path.join(run_dir, EVIDENCE_NDJSON), header)
+
+
+REMEDIATION_RULE_MAP = {
+    "securityhub-access-keys-rotated-dcc5e306": (
+        "Rotate or deactivate IAM access keys that exceed your rotation policy. "
+        "Remove unused keys and enforce MFA/SSO for users."
+    )
+}
+
+
 def _gap_recommendation_map() -> Dict[str, str]:
     return {
         "AWS Organizations is not enabled.": (
@@ -203,6 +342,40 @@ def _format_status_value(status: str) -> str:
     return status.replace("_", " ").title()
 
 
+def _format_age(seconds: int) -> str:
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes = remainder // 60
+    if hours:
+        return f"{hours}h {minutes}m"
+    if minutes:
+        return f"{minutes}m"
+    return f"{int(seconds)}s"
+
+
+def _provenance_text(entry: Dict[str, Any]) -> str:
+    """Where each collector result of `entry` came from, e.g. "iam (cached, 2h 5m old)"."""
+    parts = []
+    for key, info in entry.get("data_provenance", {}).items():
+        age = _format_age(info.get("age_seconds", 0))
+        if info.get("source") == "cache":
+            parts.append(f"{key} (cached, {age} old)")
+        elif info.get("source") == PREVIOUS_RUN:
+            parts.append(f"{key} (previous run, {age} old)")
+        else:
+            parts.append(f"{key} (fresh)")
+    return ", ".join(parts)
+
+
+def _origin_text(entry: Dict[str, Any]) -> str:
+    """How a rerun came by `entry`; empty outside reruns."""
+    origin = entry.get("origin")
+    if not origin:
+        return ""
+    if origin.get("source") == CARRIED_OVER:
+        return f"carried over from run {origin.get('run_id')}"
+    return f"re-evaluated in run {origin.get('run_id')}"
+
+
 def _simulate_account_ids(config: ScanConfig) -> Tuple[List[str], Dict[str, str]]:
     if config.account_ids:
         account_ids = [str(item) for item in config.account_ids]
@@ -256,6 +429,7 @@ def _simulate_evidence_entry(control: str, account_id: str) -> Dict[str, Any]:
 
     status = status_from_findings(gaps, errors)
     config_rules = _simulate_config_rules(seed)
+    collected_at = _utc_timestamp()
 
     return {
         "control_id": control,
@@ -263,92 +437,287 @@ def _simulate_evidence_entry(control: str, account_id: str) -> Dict[str, Any]:
         "control_language": language,
         "status": status,
         "evidence_sources": sources,
-        "collected_at": _utc_timestamp(),
+        "collected_at": collected_at,
         "gaps": gaps,
         "errors": errors,
         "data": {"config_rules": config_rules},
+        "data_provenance": {
+            "config_rules": {"source": "fresh", "fetched_at": collected_at, "age_seconds": 0}
+        },
     }
 
 
-def _run_simulated_scan(config: ScanConfig) -> Dict[str, Any]:
-    _ensure_output_dir(config.output_dir)
-    run_id = _run_id()
-    run_dir = os.path.join(config.output_dir, run_id)
-    _ensure_output_dir(run_dir)
+def _simulate_account(
+    controls: List[str], account_id: str, account_map: Dict[str, str]
+) -> Dict[str, Any]:
+    return {
+        "account_id": account_id,
+        "account_name": account_map.get(account_id),
+        "caller_arn": f"arn:aws:sts::{account_id}:assumed-role/simulated/session",
+        "identity_error": None,
+        "evidence": [_simulate_evidence_entry(control, account_id) for control in controls],
+    }
 
+
+# State of an account worker (a pool thread or process), set by its initializer.
+_worker: Dict[str, Any] = {}
+
+
+def _init_simulate_worker(
+    config: ScanConfig, account_map: Dict[str, str], plan: Optional[RerunPlan]
+) -> None:
+    _worker.update(config=config, account_map=account_map, plan=plan)
+
+
+def _simulate_in_worker(account_id: str) -> Dict[str, Any]:
+    config, plan = _worker["config"], _worker["plan"]
+    controls = plan.controls_for(account_id) if plan is not None else config.controls
+    return _simulate_account(controls, account_id, _worker["account_map"])
+
+
+def _account_pool(
+    config: ScanConfig, initializer: Callable[..., None], initargs: Tuple[Any, ...]
+) -> Executor:
+    """The pool account scans run on: threads, or with --executor process, processes."""
+    if config.executor == "process":
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # spawn rather than fork: the parent has threads (and their locks) running.
+        return ProcessPoolExecutor(
+            max_workers=config.max_account_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    return ThreadPoolExecutor(
+        max_workers=config.max_account_workers,
+        thread_name_prefix="soc2-account",
+        initializer=initializer,
+        initargs=initargs,
+    )
+
+
+class _OrderedWindow:
+    """Admits accounts into a bounded window and hands back results in account order.
+
+    `results(start)` calls `start(index)` on a feeder thread once a slot is
+    free; the work started must end in `resolve` or `reject` for that index,
+    from any thread. A slot is only freed once its result has been yielded
+    and dropped, so at most `size` results are held however many accounts
+    there are, even behind a slow account. `settle(index, raw)`, if given, turns a raw result into
+    the account's result as it is resolved, in completion order; an
+    exception from it rejects the account. A rejected account's exception
+    is re-raised when its result is reached.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        size: int,
+        settle: Optional[Callable[[int, Any], Dict[str, Any]]] = None,
+    ) -> None:
+        self._slots = threading.Semaphore(size)
+        self._outcomes: List[Optional[Future]] = [Future() for _ in range(count)]
+        self._settle = settle
+        # Set once the caller stops reading results.
+        self.stopped = threading.Event()
+
+    def resolve(self, index: int, raw: Any) -> None:
+        if self._settle is not None:
+            try:
+                raw = self._settle(index, raw)
+            except BaseException as exc:
+                self.reject(index, exc)
+                return
+        self._outcomes[index].set_result(raw)
+
+    def reject(self, index: int, exc: BaseException) -> None:
+        self._outcomes[index].set_exception(exc)
+
+    def resolve_future(self, index: int, future: Future) -> None:
+        try:
+            raw = future.result()
+        except BaseException as exc:
+            self.reject(index, exc)
+            return
+        self.resolve(index, raw)
+
+    def results(self, start: Callable[[int], None]) -> Iterator[Dict[str, Any]]:
+        def _feed() -> None:
+            for index in range(len(self._outcomes)):
+                self._slots.acquire()
+                if self.stopped.is_set():
+                    return
+                try:
+                    start(index)
+                except BaseException as exc:
+                    # A broken pool fails this account; the rest are not started.
+                    self.reject(index, exc)
+                    return
+
+        feeder = threading.Thread(target=_feed, name="soc2-account-feeder", daemon=True)
+        feeder.start()
+        try:
+            for index in range(len(self._outcomes)):
+                yield self._take(index)
+                self._slots.release()
+        finally:
+            # Stop feeding new accounts if the caller bails out early; the
+            # release wakes a feeder blocked on the window.
+            self.stopped.set()
+            self._slots.release()
+            feeder.join()
+
+    def _take(self, index: int) -> Dict[str, Any]:
+        """Wait for the result at `index` and stop holding it."""
+        outcome = self._outcomes[index]
+        try:
+            return outcome.result()
+        finally:
+            self._outcomes[index] = None
+
+
+def _ordered_results(
+    executor: Executor,
+    account_ids: List[str],
+    task: Callable[[str], Any],
+    window_size: int,
+    settle: Callable[[int, Any], Dict[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    """Run `task(account_id)` on `executor`, yielding results in account order.
+
+    At most `window_size` accounts are in flight or waiting to be yielded.
+    `settle(index, raw)` runs in the parent as each task finishes (see
+    `_OrderedWindow`).
+    """
+    window = _OrderedWindow(len(account_ids), window_size, settle)
+
+    def _start(index: int) -> None:
+        future = executor.submit(task, account_ids[index])
+        future.add_done_callback(partial(window.resolve_future, index))
+
+    yield from window.results(_start)
+
+
+def _shard_field(
+    config: ScanConfig,
+    state: Optional[Dict[str, Any]],
+    plan: Optional[RerunPlan],
+    account_ids: List[str],
+) -> Optional[Dict[str, Any]]:
+    """The evidence header "shard" field of this run, if it is one shard of a scan.
+
+    Resumed runs and reruns keep the shard of the run they continue.
+    """
+    if state is not None:
+        return state["header"].get("shard")
+    if plan is not None:
+        return plan.shard
+    if config.shard is None:
+        return None
+    return shard_header(config.shard, account_ids)
+
+
+def _with_rerun(scan: AccountScan, plan: Optional[RerunPlan], run_id: str) -> AccountScan:
+    """`scan`, or with a rerun plan, `scan` limited to the failed accounts and merged."""
+    if plan is None:
+        return scan
+    return lambda ids, on_settled: rerun_scan(plan, ids, scan, run_id, on_settled)
+
+
+def _run_simulated_scan(
+    config: ScanConfig,
+    manifest: ArtifactManifest,
+    run_id: str,
+    run_dir: str,
+    state: Optional[Dict[str, Any]] = None,
+    plan: Optional[RerunPlan] = None,
+    profiler: Optional[Any] = None,
+    phases: Optional[PhaseTimer] = None,
+) -> Dict[str, Any]:
     regions = config.regions or ["us-east-1"]
-    account_ids, account_map = _simulate_account_ids(config)
+    if state is not None:
+        account_ids, account_map = state["accounts"], state["account_map"]
+    elif plan is not None:
+        account_ids, account_map = plan.account_ids, plan.account_map()
+    else:
+        account_ids, account_map = _simulate_account_ids(config)
     primary_account_id = account_ids[0] if account_ids else "123456789012"
+    shard = _shard_field(config, state, plan, account_ids)
+    if shard is not None and state is None and plan is None:
+        account_ids = select_shard(account_ids, config.shard)
     identity = {
         "account_id": primary_account_id,
         "arn": f"arn:aws:sts::{primary_account_id}:assumed-role/simulated/session",
         "identity_error": None,
     }
-    organization_error: Optional[str] = None
+    organization_error = plan.organization_error if plan is not None else None
 
-    account_results: List[Dict[str, Any]] = []
-    for account_id in account_ids:
-        evidence_entries = [_simulate_evidence_entry(control, account_id) for control in config.controls]
-        account_results.append(
+    checkpoints = CheckpointStore(run_dir)
+    if state is not None:
+        evidence_header = state["header"]
+    else:
+        evidence_header = versioned_header(
             {
-                "account_id": account_id,
-                "account_name": account_map.get(account_id),
-                "caller_arn": f"arn:aws:sts::{account_id}:assumed-role/simulated/session",
+                "run_id": run_id,
+                "controls": config.controls,
+                "regions": regions,
+                "account_id": identity["account_id"],
+                "caller_arn": identity["arn"],
                 "identity_error": None,
-                "evidence": evidence_entries,
-            }
+                "organization_error": organization_error,
+                "attribution": _report_attribution(),
+            },
+            config.evidence_schema,
         )
+        if plan is not None:
+            evidence_header["rerun_of"] = plan.source_run_id
+        if shard is not None:
+            evidence_header["shard"] = shard
+        checkpoints.write_state(_run_state(config, evidence_header, account_ids, account_map))
+    ndjson = _open_ndjson_evidence(config, run_dir, evidence_header)
+
+    def _simulate(
+        ids: List[str], on_settled: Callable[[int, Dict[str, Any]], None]
+    ) -> Iterator[Dict[str, Any]]:
+        if config.executor == "process" or config.max_account_workers > 1:
+
+            def _settle(position: int, account: Dict[str, Any]) -> Dict[str, Any]:
+                on_settled(position, account)
+                return account
+
+            with _account_pool(
+                config, _init_simulate_worker, (config, account_map, plan)
+            ) as pool:
+                yield from _ordered_results(
+                    pool, ids, _simulate_in_worker, config.max_account_workers, _settle
+                )
+            return
+        for position, account_id in enumerate(ids):
+            controls = plan.controls_for(account_id) if plan is not None else config.controls
+            account = _simulate_account(controls, account_id, account_map)
+            on_settled(position, account)
+            yield account
 
-    primary_evidence = account_results[0]["evidence"] if account_results else []
-
-    payload = {
-        "generated_at": _utc_timestamp(),
-        "run_id": run_id,
-        "controls": config.controls,
-        "regions": regions,
-        "account_id": identity["account_id"],
-        "caller_arn": identity["arn"],
-        "identity_error": None,
-        "organization_error": organization_error,
-        "attribution": _report_attribution(),
-        "evidence": primary_evidence,
-        "accounts": account_results if len(account_results) > 1 else [],
-    }
-
-    json_path = os.path.join(run_dir, "evidence.json")
-    with open(json_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
-
-    csv_path = os.path.join(run_dir, "evidence_summary.csv")
-    summary_rows: List[Dict[str, Any]] = []
-    for account in account_results:
-        for entry in account.get("evidence", []):
-            config_rules = entry.get("data", {}).get("config_rules", {})
-            noncompliant_rules = [
-                rule.get("name")
-                for rule in config_rules.get("rules_sample", [])
-                if rule.get("compliance") == "NON_COMPLIANT"
-            ]
-            noncompliant_rules_sample = ", ".join(noncompliant_rules[:10])
-            summary_rows.append(
-                {
-                    "account_id": account.get("account_id"),
-                    "account_name": account.get("account_name"),
-                    "control_id": entry.get("control_id"),
-                    "title": entry.get("title"),
-                    "status": entry.get("status"),
-                    "gap_count": len(entry.get("gaps", [])),
-                    "error_count": len(entry.get("errors", [])),
-                    "noncompliant_rule_count": config_rules.get("noncompliant_count", 0),
-                    "noncompliant_rules_sample": noncompliant_rules_sample,
-                }
-            )
-    summary_df = pd.DataFrame(summary_rows)
-    summary_df.to_csv(csv_path, index=False)
-
-    hash_path = _write_hash_file(json_path)
+    account_results: List[Dict[str, Any]] = []
+    restored: List[str] = []
+    with span("scan_accounts", "run"):
+        for account in checkpointed_scan(
+            checkpoints, account_ids, _with_rerun(_simulate, plan, run_id), restored
+        ):
+            if ndjson is not None:
+                ndjson.write_account(account)
+                account = report_view(account)
+            account_results.append(account)
+
+    schema_version = evidence_header.get("schema_version")
+    payload = evidence_document(
+        evidence_header,
+        _utc_timestamp(),
+        [account_record(account, schema_version) for account in account_results],
+    )
 
-    completeness_path = os.path.join(run_dir, "run_completeness.json")
     completeness_payload = {
         "run_id": run_id,
         "generated_at": payload["generated_at"],
@@ -359,352 +728,474 @@ def _run_simulated_scan(config: ScanConfig) -> Dict[str, Any]:
         "identity_error": None,
         "organization_error": organization_error,
         "account_count": len(account_results),
+        "restored_accounts": len(restored),
+        "rerun": plan.summary() if plan is not None else None,
+        "executor": config.executor,
         "attribution": _report_attribution(),
         "narrative": (
             "This simulated run generates example evidence without contacting AWS. "
             "Noncompliant values are synthetic and for demonstration only."
         ),
-        "artifacts": {
-            "evidence_json": os.path.basename(json_path),
-            "evidence_csv": os.path.basename(csv_path),
-            "evidence_hash": os.path.basename(hash_path),
-        },
+        "artifacts": _artifact_index(config),
     }
-    with open(completeness_path, "w", encoding="utf-8") as handle:
-        json.dump(completeness_payload, handle, indent=2, sort_keys=True)
-    completeness_hash = _write_hash_file(completeness_path)
 
-    summary_path = os.path.join(run_dir, "report_summary.md")
-    remediation_rule_map = {
-        "securityhub-access-keys-rotated-dcc5e306": (
-            "Rotate or deactivate IAM access keys that exceed your rotation policy. "
-            "Remove unused keys and enforce MFA/SSO for users."
+    artifacts = _write_reports(
+        config,
+        run_dir,
+        payload,
+        account_results,
+        completeness_payload,
+        manifest,
+        ndjson,
+        profiler=profiler,
+        phases=phases,
+    )
+    checkpoints.remove()
+    return {"artifacts": artifacts, "identity_error": None}
+
+
+@dataclass(frozen=True)
+class ReportSnapshot:
+    """Everything the report writers read, fixed once the scan has finished.
+
+    Writers run concurrently on threads and treat it as read-only.
+    """
+
+    run_dir: str
+    payload: Dict[str, Any]
+    account_results: Tuple[Dict[str, Any], ...]
+    narrative: str
+    artifact_names: Tuple[str, ...]
+    rollup: Optional[Dict[str, Any]] = None
+    account_details: bool = False
+
+
+ArtifactDigests = List[Tuple[str, str]]
+
+
+def _write_evidence_json(snapshot: ReportSnapshot) -> ArtifactDigests:
+    json_path = os.path.join(snapshot.run_dir, "evidence.json")
+    handle, hashing = hashing_open(json_path)
+    with handle:
+        json.dump(snapshot.payload, handle, indent=2, sort_keys=True)
+    return [(json_path, hashing.hexdigest())]
+
+
+def _write_summary_csv(snapshot: ReportSnapshot) -> ArtifactDigests:
+    csv_path = os.path.join(snapshot.run_dir, SUMMARY_CSV)
+    with SummaryCsvWriter(csv_path) as summary_csv:
+        for account in snapshot.account_results:
+            summary_csv.write_account(account)
+    return [(csv_path, summary_csv.hexdigest())]
+
+
+def _markdown_rollup_lines(rollup: Dict[str, Any]) -> List[str]:
+    controls = rollup["controls"]
+    statuses = status_columns(rollup["status_counts"])
+    lines = [
+        "## Control Status by Control",
+        "",
+        "| Control | " + " | ".join(_format_status_value(status) for status in statuses) + " |",
+        "| --- |" + " --- |" * len(statuses),
+    ]
+    for control in controls:
+        counts = rollup["status_counts"][control]
+        lines.append(
+            f"| {control} | " + " | ".join(str(counts.get(status, 0)) for status in statuses) + " |"
         )
-    }
 
+    lines.extend(["", "## Top Gaps", ""])
+    if rollup["top_gaps"]:
+        lines.append("| Gap | Accounts | Controls | Recommendation |")
+        lines.append("| --- | --- | --- | --- |")
+        for gap in rollup["top_gaps"]:
+            lines.append(
+                f"| {gap['gap']} | {gap['account_count']} | {', '.join(gap['controls'])} "
+                f"| {gap['recommendation']} |"
+            )
+    else:
+        lines.append("No gaps were found.")
+
+    lines.extend(["", "## Error Hotspots", ""])
+    if rollup["error_hotspots"]:
+        lines.append("| Control | Error | Accounts | Example accounts | Example |")
+        lines.append("| --- | --- | --- | --- | --- |")
+        for hotspot in rollup["error_hotspots"]:
+            lines.append(
+                f"| {hotspot['control_id'] or 'Account access'} | {hotspot['error']} "
+                f"| {hotspot['account_count']} | {', '.join(hotspot['accounts_sample'])} "
+                f"| {hotspot['example']} |"
+            )
+    else:
+        lines.append("No errors were reported.")
+
+    lines.extend(
+        [
+            "",
+            "## Control Status Matrix",
+            "",
+            "| Account | Name | " + " | ".join(controls) + " |",
+            "| --- | --- |" + " --- |" * len(controls),
+        ]
+    )
+    for row in rollup["matrix"]:
+        cells = [_format_status_value(status) for status in row["statuses"]]
+        lines.append(
+            f"| {row['account_id']} | {row['account_name'] or ''} | " + " | ".join(cells) + " |"
+        )
+    lines.append("")
+    return lines
+
+
+def _write_markdown_summary(snapshot: ReportSnapshot) -> ArtifactDigests:
+    payload = snapshot.payload
     summary_lines = [
         "# SOC 2 Evidence Summary",
         "",
-        f"- Run ID: {run_id}",
+        f"- Run ID: {payload['run_id']}",
         f"- Generated at (UTC): {payload['generated_at']}",
         f"- Account ID: {payload['account_id']}",
         f"- Caller ARN: {payload['caller_arn']}",
-        f"- Regions: {', '.join(regions)}",
-        f"- Controls: {', '.join(config.controls)}",
-        f"- Account count: {len(account_results)}",
+        f"- Regions: {', '.join(payload['regions'])}",
+        f"- Controls: {', '.join(payload['controls'])}",
+        f"- Account count: {len(snapshot.account_results)}",
         f"- Attribution: {_report_attribution()}",
         "",
         "## Notes",
-        completeness_payload["narrative"],
+        snapshot.narrative,
         "",
-        "## Control Results",
     ]
-
-    for account in account_results:
+    summary_lines.extend(_markdown_rollup_lines(snapshot.rollup))
+    if snapshot.account_details:
         summary_lines.extend(
+            [f"Per-account detail is in `{ACCOUNT_DETAILS_DIR}/<account_id>.md`.", ""]
+        )
+
+    summary_lines.append("## Artifacts")
+    summary_lines.extend(f"- {name}" for name in snapshot.artifact_names)
+    summary_path = os.path.join(snapshot.run_dir, "report_summary.md")
+    handle, hashing = hashing_open(summary_path)
+    with handle:
+        handle.write("\n".join(summary_lines).strip() + "\n")
+    return [(summary_path, hashing.hexdigest())]
+
+
+def _markdown_account_lines(account: Dict[str, Any]) -> List[str]:
+    lines = [f"# Account {account.get('account_id')}", ""]
+    if account.get("account_name"):
+        lines.append(f"- Name: {account.get('account_name')}")
+    if account.get("identity_error"):
+        lines.append(f"- Identity error: {account.get('identity_error')}")
+    lines.append("")
+
+    for entry in account.get("evidence", []):
+        lines.extend(
             [
-                "",
-                f"### Account {account.get('account_id')}",
+                f"## {entry.get('control_id')} - {entry.get('title')}",
+                f"- **Status:** {_format_status_value(entry.get('status', 'unknown'))}",
+                f"- **Control description:** {entry.get('control_language')}",
+                f"- Summary: {_control_summary(entry)}",
+                f"- Collected at: {entry.get('collected_at')}",
             ]
         )
-        if account.get("account_name"):
-            summary_lines.append(f"- Name: {account.get('account_name')}")
-        if account.get("identity_error"):
-            summary_lines.append(f"- Identity error: {account.get('identity_error')}")
-        summary_lines.append("")
-
-        for entry in account.get("evidence", []):
-            summary_lines.extend(
-                [
-                    f"#### {entry.get('control_id')} - {entry.get('title')}",
-                    f"- **Status:** {_format_status_value(entry.get('status', 'unknown'))}",
-                    f"- **Control description:** {entry.get('control_language')}",
-                    f"- Summary: {_control_summary(entry)}",
-                    f"- Collected at: {entry.get('collected_at')}",
-                ]
-            )
+        if entry.get("data_provenance"):
+            lines.append(f"- Data: {_provenance_text(entry)}")
+        if entry.get("origin"):
+            lines.append(f"- Origin: {_origin_text(entry)}")
+
+        issue_rows = _build_issue_rows(entry, REMEDIATION_RULE_MAP)
+        if issue_rows:
+            lines.append("")
+            lines.append("| Type | Finding | Recommendation |")
+            lines.append("| --- | --- | --- |")
+            for row in issue_rows:
+                lines.append(f"| {row['type']} | {row['item']} | {row['recommendation']} |")
+        lines.append("")
+    return lines
+
+
+def _account_detail_paths(snapshot: ReportSnapshot, extension: str) -> List[str]:
+    details_dir = os.path.join(snapshot.run_dir, ACCOUNT_DETAILS_DIR)
+    _ensure_output_dir(details_dir)
+    names = [
+        account.get("account_id") or f"account-{index + 1}"
+        for index, account in enumerate(snapshot.account_results)
+    ]
+    return [os.path.join(details_dir, f"{name}{extension}") for name in names]
 
-            issue_rows = _build_issue_rows(entry, remediation_rule_map)
-            if issue_rows:
-                summary_lines.append("")
-                summary_lines.append("| Type | Finding | Recommendation |")
-                summary_lines.append("| --- | --- | --- |")
-                for row in issue_rows:
-                    summary_lines.append(
-                        f"| {row['type']} | {row['item']} | {row['recommendation']} |"
-                    )
-            summary_lines.append("")
-
-    summary_lines.extend(
-        [
-            "## Artifacts",
-            f"- evidence.json",
-            f"- evidence_summary.csv",
-            f"- evidence.json.sha256",
-            f"- run_completeness.json",
-            f"- run_completeness.json.sha256",
-        ]
-    )
-    with open(summary_path, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(summary_lines).strip() + "\n")
-    summary_hash = _write_hash_file(summary_path)
-    pdf_path = _write_pdf_summary(run_dir, payload, account_results, completeness_payload)
-    pdf_hash = _write_hash_file(pdf_path) if pdf_path else None
 
-    return {
-        "artifacts": [
-            json_path,
-            csv_path,
-            hash_path,
-            completeness_path,
-            completeness_hash,
-            summary_path,
-            summary_hash,
-            *(path for path in [pdf_path, pdf_hash] if path),
-        ],
-        "identity_error": None,
-    }
+def _write_markdown_details(snapshot: ReportSnapshot) -> ArtifactDigests:
+    paths = _account_detail_paths(snapshot, ".md")
+
+    def _write(path: str, account: Dict[str, Any]) -> Tuple[str, str]:
+        handle, hashing = hashing_open(path)
+        with handle:
+            handle.write("\n".join(_markdown_account_lines(account)).strip() + "\n")
+        return path, hashing.hexdigest()
+
+    with ThreadPoolExecutor(max_workers=4, thread_name_prefix="soc2-detail") as executor:
+        return list(executor.map(_write, paths, snapshot.account_results))
 
 
-def _write_pdf_summary(
+def _artifact_index(config: ScanConfig, telemetry_path: Optional[str] = None) -> Dict[str, str]:
+    """The run_completeness.json "artifacts" map for the selected formats."""
+    artifacts: Dict[str, str] = {}
+    if "json" in config.formats:
+        if config.evidence_format == "ndjson":
+            artifacts["evidence_ndjson"] = EVIDENCE_NDJSON
+        else:
+            artifacts["evidence_json"] = "evidence.json"
+    if "csv" in config.formats:
+        artifacts["evidence_csv"] = SUMMARY_CSV
+    if "json" in config.formats:
+        evidence_name = artifacts.get("evidence_ndjson") or artifacts["evidence_json"]
+        artifacts["evidence_hash"] = f"{evidence_name}{HASH_SUFFIX}"
+    artifacts["manifest"] = MANIFEST_FILE
+    if telemetry_path:
+        artifacts["telemetry_json"] = os.path.basename(telemetry_path)
+    if config.account_details and any(name in config.formats for name in ("md", "pdf")):
+        artifacts["account_details"] = f"{ACCOUNT_DETAILS_DIR}/"
+    return artifacts
+
+
+def _artifact_names(artifacts: Dict[str, str]) -> Tuple[str, ...]:
+    """Artifact list for report_summary.md, in the order it has always used."""
+    names = [
+        artifacts.get("evidence_json") or artifacts.get("evidence_ndjson"),
+        artifacts.get("evidence_csv"),
+        artifacts.get("evidence_hash"),
+        COMPLETENESS_FILE,
+        f"{COMPLETENESS_FILE}{HASH_SUFFIX}",
+        artifacts["manifest"],
+        artifacts.get("telemetry_json"),
+        artifacts.get("account_details"),
+    ]
+    return tuple(name for name in names if name)
+
+
+def _render_reports(
+    snapshot: ReportSnapshot, formats: List[str], manifest: ArtifactManifest
+) -> Tuple[List[str], List[Dict[str, Any]]]:
+    """Run the writers for `formats` concurrently from one snapshot.
+
+    Per-account detail writers run alongside the summaries when the snapshot
+    asks for them. Returns the written artifacts (summaries with their
+    .sha256 files; detail files are covered by the manifest alone) and one
+    timing entry per writer.
+    """
+    writers = [
+        (name, "summary", spec["writer"], spec["span"], spec.get("hash_file"))
+        for name, spec in ((name, REPORT_WRITERS[name]) for name in formats)
+    ]
+    if snapshot.account_details:
+        writers.extend(
+            (name, "accounts", spec["details"], f"{spec['span']}_accounts", False)
+            for name, spec in ((name, REPORT_WRITERS[name]) for name in formats)
+            if spec.get("details")
+        )
+
+    def _render(writer: Any, span_name: str) -> Tuple[ArtifactDigests, float]:
+        start = time.perf_counter()
+        with span(span_name, "writer"):
+            outputs = writer(snapshot)
+        return outputs, time.perf_counter() - start
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, len(writers)), thread_name_prefix="soc2-writer"
+    ) as executor:
+        futures = [
+            executor.submit(_render, writer, span_name) for _, _, writer, span_name, _ in writers
+        ]
+        results = [future.result() for future in futures]
+
+    artifacts: List[str] = []
+    timings: List[Dict[str, Any]] = []
+    for (name, scope, _, _, hash_file), (outputs, seconds) in zip(writers, results):
+        for path, digest in outputs:
+            manifest.add(path, digest)
+            artifacts.append(path)
+            if hash_file:
+                artifacts.append(_write_hash_file(path, manifest))
+        timings.append(
+            {
+                "format": name,
+                "scope": scope,
+                "seconds": round(seconds, 6),
+                "artifacts": [os.path.relpath(path, snapshot.run_dir) for path, _ in outputs],
+            }
+        )
+    return artifacts, timings
+
+
+def _write_reports(
+    config: ScanConfig,
     run_dir: str,
     payload: Dict[str, Any],
     account_results: List[Dict[str, Any]],
     completeness_payload: Dict[str, Any],
-) -> Optional[str]:
-    try:
-        from reportlab.lib import colors
-        from reportlab.lib.pagesizes import LETTER
-        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-        from reportlab.platypus import (
-            PageBreak,
-            Paragraph,
-            SimpleDocTemplate,
-            Spacer,
-            Table,
-            TableStyle,
-        )
-    except ImportError:
-        return None
-
-    pdf_path = os.path.join(run_dir, "report_summary.pdf")
-    doc = SimpleDocTemplate(
-        pdf_path,
-        pagesize=LETTER,
-        rightMargin=36,
-        leftMargin=36,
-        topMargin=36,
-        bottomMargin=36,
-        title="SOC 2 Evidence Summary",
-    )
-    styles = getSampleStyleSheet()
-    styles.add(ParagraphStyle(name="Small", parent=styles["BodyText"], fontSize=9))
-    styles.add(
-        ParagraphStyle(
-            name="SmallWrap",
-            parent=styles["Small"],
-            wordWrap="CJK",
-            leading=11,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="Subtitle",
-            parent=styles["Title"],
-            fontSize=14,
-            leading=18,
-            textColor=colors.HexColor("#374151"),
-            spaceBefore=4,
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaLabel",
-            parent=styles["BodyText"],
-            fontSize=9,
-            textColor=colors.HexColor("#6B7280"),
-        )
-    )
-    styles.add(
-        ParagraphStyle(
-            name="MetaValue",
-            parent=styles["BodyText"],
-            fontSize=9,
-            textColor=colors.HexColor("#111827"),
-        )
+    manifest: ArtifactManifest,
+    ndjson: Optional[NdjsonEvidenceWriter],
+    streamed: Optional[List[str]] = None,
+    profiler: Optional[Any] = None,
+    phases: Optional[PhaseTimer] = None,
+) -> List[str]:
+    """Write the selected report formats, then run_completeness.json; return all artifacts.
+
+    `streamed` lists artifacts already written during the scan (the summary
+    CSV); their formats are not rendered again.
+    """
+    artifacts: List[str] = []
+    rendered = set(config.formats)
+    if ndjson is not None:
+        with span("write_ndjson", "writer"):
+            manifest.add(ndjson.path, ndjson.close(payload["generated_at"]))
+        artifacts.extend([ndjson.path, _write_hash_file(ndjson.path, manifest)])
+        rendered.discard("json")
+    artifacts.extend(streamed or [])
+    if streamed:
+        rendered.discard("csv")
+
+    rollup: Optional[Dict[str, Any]] = None
+    if rendered & {"md", "pdf"}:
+        # One pass over the accounts feeds both the Markdown and PDF summaries.
+        with span("rollup", "writer"):
+            rollup = build_rollup(
+                account_results,
+                config.controls,
+                _recommendation_for_gap,
+                _friendly_error_message,
+            )
+    snapshot = ReportSnapshot(
+        run_dir=run_dir,
+        payload=payload,
+        account_results=tuple(account_results),
+        narrative=completeness_payload["narrative"],
+        artifact_names=_artifact_names(completeness_payload["artifacts"]),
+        rollup=rollup,
+        account_details=config.account_details,
     )
-    story = []
-    remediation_rule_map = {
-        "securityhub-access-keys-rotated-dcc5e306": (
-            "Rotate or deactivate IAM access keys that exceed your rotation policy. "
-            "Remove unused keys and enforce MFA/SSO for users."
+    formats = [name for name in config.formats if name in rendered]
+    report_artifacts, timings = _render_reports(snapshot, formats, manifest)
+    artifacts.extend(report_artifacts)
+
+    completeness_payload["formats"] = list(config.formats)
+    completeness_payload["writers"] = timings
+    # Written last so the profile section can cover the other writers.
+    if phases is not None:
+        completeness_payload["profile"] = _profile_section(profiler, phases)
+    completeness_path = os.path.join(run_dir, COMPLETENESS_FILE)
+    with span("write_run_completeness", "writer"), manifest.open(completeness_path) as handle:
+        json.dump(completeness_payload, handle, indent=2, sort_keys=True)
+    artifacts.extend([completeness_path, _write_hash_file(completeness_path, manifest)])
+    return artifacts
+
+
+def _pdf_account_view(account: Dict[str, Any]) -> Dict[str, Any]:
+    """The plain data the PDF lays out for one account (picklable for worker processes)."""
+    controls = []
+    for entry in account.get("evidence", []):
+        config_rules = entry.get("data", {}).get("config_rules", {})
+        controls.append(
+            {
+                "control_id": entry.get("control_id"),
+                "title": entry.get("title"),
+                "status": entry.get("status"),
+                "gap_count": len(entry.get("gaps", [])),
+                "error_count": len(entry.get("errors", [])),
+                "noncompliant_count": config_rules.get("noncompliant_count", 0),
+                "control_language": entry.get("control_language"),
+                "status_text": _format_status_value(entry.get("status", "unknown")),
+                "summary": _control_summary(entry),
+                "collected_at": entry.get("collected_at"),
+                "provenance": _provenance_text(entry),
+                "origin": _origin_text(entry),
+                "issue_rows": _build_issue_rows(entry, REMEDIATION_RULE_MAP),
+            }
         )
+    return {
+        "account_id": account.get("account_id"),
+        "account_name": account.get("account_name"),
+        "identity_error": account.get("identity_error"),
+        "controls": controls,
     }
 
-    story.append(Paragraph("SOC 2 Evidence Summary", styles["Title"]))
-    story.append(Paragraph("AWS Evidence Collection Report", styles["Subtitle"]))
-    story.append(Spacer(1, 14))
 
-    meta_rows = [
-        [
-            Paragraph("Run ID", styles["MetaLabel"]),
-            Paragraph(payload["run_id"], styles["MetaValue"]),
-            Paragraph("Generated (UTC)", styles["MetaLabel"]),
-            Paragraph(payload["generated_at"], styles["MetaValue"]),
-        ],
-        [
-            Paragraph("Account ID", styles["MetaLabel"]),
-            Paragraph(payload["account_id"], styles["MetaValue"]),
-            Paragraph("Caller ARN", styles["MetaLabel"]),
-            Paragraph(payload["caller_arn"], styles["MetaValue"]),
-        ],
-        [
-            Paragraph("Regions", styles["MetaLabel"]),
-            Paragraph(", ".join(payload["regions"]), styles["MetaValue"]),
-            Paragraph("Controls", styles["MetaLabel"]),
-            Paragraph(", ".join(payload["controls"]), styles["MetaValue"]),
-        ],
-        [
-            Paragraph("Account count", styles["MetaLabel"]),
-            Paragraph(str(len(account_results)), styles["MetaValue"]),
-            Paragraph("Report scope", styles["MetaLabel"]),
-            Paragraph("SOC 2 Security (TSP 2017)", styles["MetaValue"]),
-        ],
-        [
-            Paragraph("Attribution", styles["MetaLabel"]),
-            Paragraph(_report_attribution(), styles["MetaValue"]),
-            Paragraph("", styles["MetaLabel"]),
-            Paragraph("", styles["MetaValue"]),
-        ],
-    ]
-    meta_table = Table(meta_rows, colWidths=[80, 185, 80, 185])
-    meta_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#F9FAFB")),
-                ("BOX", (0, 0), (-1, -1), 0.5, colors.HexColor("#D1D5DB")),
-                ("INNERGRID", (0, 0), (-1, -1), 0.25, colors.HexColor("#E5E7EB")),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 8),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 8),
-                ("TOPPADDING", (0, 0), (-1, -1), 6),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 6),
-            ]
-        )
-    )
-    story.append(meta_table)
-    story.append(Spacer(1, 14))
-
-    story.append(Paragraph("Notes", styles["Heading2"]))
-    story.append(Paragraph(completeness_payload["narrative"], styles["BodyText"]))
-    story.append(Spacer(1, 12))
-
-    for account in account_results:
-        story.append(PageBreak())
-        story.append(Paragraph(f"Account {account.get('account_id')}", styles["Heading2"]))
-        if account.get("account_name"):
-            story.append(Paragraph(f"Name: {account.get('account_name')}", styles["Normal"]))
-        if account.get("identity_error"):
-            story.append(Paragraph(f"Identity error: {account.get('identity_error')}", styles["Normal"]))
-        story.append(Spacer(1, 12))
-
-        table_data = [
-            [
-                "Control",
-                "Title",
-                "Status",
-                "Gaps",
-                "Errors",
-                "Noncompliant Rules",
-            ]
-        ]
-        for entry in account.get("evidence", []):
-            config_rules = entry.get("data", {}).get("config_rules", {})
-            noncompliant_count = config_rules.get("noncompliant_count", 0)
-            table_data.append(
-                [
-                    entry.get("control_id"),
-                    entry.get("title"),
-                    entry.get("status"),
-                    str(len(entry.get("gaps", []))),
-                    str(len(entry.get("errors", []))),
-                    str(noncompliant_count),
-                ]
-            )
+def _write_pdf_summary(snapshot: ReportSnapshot) -> ArtifactDigests:
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        return []
+    from soc2_scanner.pdf_report import write_summary_pdf
 
-        table = Table(table_data, repeatRows=1)
-        table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#1F2937")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 9),
-                    ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
+    payload = snapshot.payload
+    cover = {
+        "run_id": payload["run_id"],
+        "generated_at": payload["generated_at"],
+        "account_id": payload["account_id"],
+        "caller_arn": payload["caller_arn"],
+        "regions": payload["regions"],
+        "controls": payload["controls"],
+        "account_count": len(snapshot.account_results),
+        "narrative": snapshot.narrative,
+    }
+    pdf_path = os.path.join(snapshot.run_dir, "report_summary.pdf")
+    handle, hashing = hashing_open(pdf_path, "wb")
+    with handle:
+        write_summary_pdf(
+            handle,
+            cover,
+            snapshot.rollup,
+            _report_attribution(),
+            ACCOUNT_DETAILS_DIR if snapshot.account_details else None,
         )
-        story.append(table)
-        story.append(Spacer(1, 12))
-
-        for entry in account.get("evidence", []):
-            story.append(Paragraph(f"{entry.get('control_id')} Details", styles["Heading3"]))
-            if entry.get("control_language"):
-                story.append(
-                    Paragraph(
-                        f"<b>Control description:</b> {entry.get('control_language')}",
-                        styles["Small"],
-                    )
-                )
-            status_text = _format_status_value(entry.get("status", "unknown"))
-            story.append(Paragraph(f"<b>Status:</b> {status_text}", styles["Small"]))
-            story.append(Paragraph(_control_summary(entry), styles["Small"]))
-            story.append(Paragraph(f"Collected at: {entry.get('collected_at')}", styles["Small"]))
-            issue_rows = _build_issue_rows(entry, remediation_rule_map)
-            if issue_rows:
-                detail_table = [
-                    ["Type", "Finding", "Recommendation"],
-                ]
-                for row in issue_rows:
-                    detail_table.append(
-                        [
-                            Paragraph(row["type"], styles["Small"]),
-                            Paragraph(row["item"], styles["SmallWrap"]),
-                            Paragraph(row["recommendation"], styles["SmallWrap"]),
-                        ]
-                    )
-                detail = Table(detail_table, repeatRows=1, colWidths=[60, 300, 160])
-                detail.setStyle(
-                    TableStyle(
-                        [
-                            ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#111827")),
-                            ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                            ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
-                            ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                            ("FONTSIZE", (0, 0), (-1, -1), 9),
-                            ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                            ("WORDWRAP", (0, 0), (-1, -1), "CJK"),
-                        ]
-                    )
-                )
-                story.append(Spacer(1, 6))
-                story.append(detail)
-            story.append(Spacer(1, 8))
+    return [(pdf_path, hashing.hexdigest())]
 
-    def _draw_footer(canvas, doc_instance) -> None:
-        canvas.saveState()
-        canvas.setFont("Helvetica", 8)
-        canvas.setFillColor(colors.HexColor("#6B7280"))
-        canvas.drawString(36, 18, _report_attribution())
-        canvas.restoreState()
 
-    doc.build(story, onFirstPage=_draw_footer, onLaterPages=_draw_footer)
-    return pdf_path
+def _write_pdf_details(snapshot: ReportSnapshot) -> ArtifactDigests:
+    try:
+        import reportlab  # noqa: F401
+    except ImportError:
+        return []
+    from soc2_scanner.pdf_report import account_pdfs
+
+    paths = _account_detail_paths(snapshot, ".pdf")
+    accounts = [_pdf_account_view(account) for account in snapshot.account_results]
+    outputs: ArtifactDigests = []
+    for path, data in zip(paths, account_pdfs(accounts, _report_attribution())):
+        handle, hashing = hashing_open(path, "wb")
+        with handle:
+            handle.write(data)
+        outputs.append((path, hashing.hexdigest()))
+    return outputs
+
+
+# Report formats, in the order they are written. "json" is the evidence
+# document (evidence.ndjson instead with --evidence-format ndjson, streamed
+# during the scan, as is the summary CSV of a live scan). Writers take a
+# ReportSnapshot and return (path, sha256) pairs. "details" writers produce
+# the per-account files under accounts/ and only run with --account-details;
+# the PDF one spreads its layout over worker processes (see pdf_report).
+REPORT_WRITERS: Dict[str, Dict[str, Any]] = {
+    "json": {"writer": _write_evidence_json, "span": "write_json", "hash_file": True},
+    "csv": {"writer": _write_summary_csv, "span": "write_csv"},
+    "md": {
+        "writer": _write_markdown_summary,
+        "details": _write_markdown_details,
+        "span": "write_markdown",
+        "hash_file": True,
+    },
+    "pdf": {
+        "writer": _write_pdf_summary,
+        "details": _write_pdf_details,
+        "span": "write_pdf",
+        "hash_file": True,
+    },
+}
 
 
 def _get_account_identity(session: boto3.Session) -> Dict[str, Optional[str]]:
+    from botocore.exceptions import BotoCoreError, ClientError
+
     try:
         sts = session.client("sts")
         identity = sts.get_caller_identity()
@@ -741,33 +1232,40 @@ def _assume_role_session(
     account_id: str,
     role_name: str,
     external_id: Optional[str],
-) -> Tuple[Optional[boto3.Session], Optional[str]]:
+    sts_client: Optional[Any] = None,
+    credential_cache: Optional[CredentialCache] = None,
+) -> Tuple[Optional[boto3.Session], Optional[str], Optional[str]]:
+    """Return (session, assumed-role ARN, error) for `account_id`."""
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    from soc2_scanner.sessions import assume_role_session
+
     try:
-        sts = base_session.client("sts")
-        assume_kwargs: Dict[str, Any] = {
-            "RoleArn": f"arn:aws:iam::{account_id}:role/{role_name}",
-            "RoleSessionName": "soc2-scanner",
-        }
-        if external_id:
-            assume_kwargs["ExternalId"] = external_id
-        response = sts.assume_role(**assume_kwargs)
-        credentials = response["Credentials"]
-        return (
-            boto3.Session(
-                aws_access_key_id=credentials["AccessKeyId"],
-                aws_secret_access_key=credentials["SecretAccessKey"],
-                aws_session_token=credentials["SessionToken"],
-                region_name=base_session.region_name,
-            ),
-            None,
+        session, arn = assume_role_session(
+            sts_client or base_session.client("sts"),
+            f"arn:aws:iam::{account_id}:role/{role_name}",
+            external_id=external_id,
+            region_name=base_session.region_name,
+            credential_cache=credential_cache,
         )
+        return session, arn, None
     except (BotoCoreError, ClientError) as exc:
-        return None, str(exc)
+        return None, None, str(exc)
+
+
+def _identity_from_arn(arn: Optional[str]) -> Optional[Dict[str, Optional[str]]]:
+    # arn:aws:sts::123456789012:assumed-role/RoleName/session
+    parts = arn.split(":") if arn else []
+    if len(parts) < 6 or not parts[4]:
+        return None
+    return {"account_id": parts[4], "arn": arn, "identity_error": None}
 
 
 def _list_org_accounts(
     session: boto3.Session,
 ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    from botocore.exceptions import BotoCoreError, ClientError
+
     try:
         client = session.client("organizations")
         paginator = client.get_paginator("list_accounts")
@@ -779,46 +1277,555 @@ def _list_org_accounts(
         return [], str(exc)
 
 
+def collect_organizations(session: Any) -> Dict[str, Any]:
+    return resolve_collector("organizations")(session)
+
+
 def _needs_org_cache(controls: List[str]) -> bool:
     return any(control in {"CC1", "CC5"} for control in controls)
 
 
 def _build_evidence_entries(
-    controls: List[str], context: EvidenceContext
+    controls: List[str], context: EvidenceContext, max_collector_workers: int = 1
 ) -> List[Dict[str, Any]]:
+    account_id = getattr(context.clients, "account_id", None)
+    with span("prefetch_collectors", "account", account_id):
+        prefetch_collectors(context, plan_collectors(controls), max_collector_workers)
     entries = []
     for control in controls:
-        entries.append(evaluate_control(control, context))
+        with span(f"evaluate:{control}", "control", account_id):
+            entries.append(evaluate_control(control, context))
     return entries
 
 
-def run_scan(config: ScanConfig) -> Dict[str, Any]:
-    if config.simulate:
-        return _run_simulated_scan(config)
+@dataclass
+class _ScanRun:
+    """Run-wide state shared by every account scan."""
+
+    config: ScanConfig
+    session: boto3.Session
+    identity: Dict[str, Optional[str]]
+    regions: List[str]
+    account_map: Dict[str, str]
+    clients: ClientFactory
+    org_cache: Optional[Dict[str, Any]] = None
+    sts_client: Optional[Any] = None
+    credential_cache: Optional[CredentialCache] = None
+    collector_cache: Optional[CollectorCache] = None
+    org_provenance: Optional[Provenance] = None
+    rerun: Optional[RerunPlan] = None
+    cache_stats: CacheStats = field(default_factory=CacheStats)
+    # With --executor process: the latest stats of each worker process, by pid.
+    worker_stats: Dict[int, Dict[str, Any]] = field(default_factory=dict)
+
+
+@dataclass
+class _PreparedAccount:
+    account_id: str
+    session: Optional[boto3.Session]
+    identity: Dict[str, Optional[str]]
+    assume_error: Optional[str] = None
 
-    _ensure_output_dir(config.output_dir)
-    run_id = _run_id()
-    run_dir = os.path.join(config.output_dir, run_id)
-    _ensure_output_dir(run_dir)
 
+def _account_failure(run: _ScanRun, account_id: str, error: Optional[str]) -> Dict[str, Any]:
+    return {
+        "account_id": account_id,
+        "account_name": run.account_map.get(account_id),
+        "caller_arn": None,
+        "identity_error": error,
+        "evidence": [],
+    }
+
+
+def _prepare_account(run: _ScanRun, account_id: str) -> _PreparedAccount:
+    """Assume the account's role and resolve its identity."""
+    config = run.config
+    if account_id == run.identity["account_id"]:
+        return _PreparedAccount(account_id, run.session, run.identity)
+
+    account_external_id = config.external_ids.get(account_id) or config.external_id
+    with span("assume_role", "account", account_id):
+        account_session, assumed_arn, assume_error = _assume_role_session(
+            run.session,
+            account_id,
+            config.role_name,
+            account_external_id,
+            run.sts_client,
+            run.credential_cache,
+        )
+    if not account_session:
+        return _PreparedAccount(
+            account_id,
+            None,
+            {"account_id": account_id, "arn": None, "identity_error": assume_error},
+            assume_error,
+        )
+    # The assumed-role ARN already names the account; only fall back to
+    # GetCallerIdentity when STS did not report it.
+    account_identity = _identity_from_arn(assumed_arn)
+    if account_identity is None:
+        with span("identity", "account", account_id):
+            account_identity = _get_account_identity(account_session)
+    return _PreparedAccount(account_id, account_session, account_identity)
+
+
+def _evaluate_account(run: _ScanRun, prepared: _PreparedAccount) -> Dict[str, Any]:
+    config = run.config
+    context = EvidenceContext(
+        session=prepared.session,
+        regions=run.regions,
+        clients=run.clients.bind(prepared.session, prepared.account_id),
+        collector_cache=run.collector_cache,
+        region_workers=RegionWorkers(config.max_region_workers, config.region_workers),
+    )
+    if run.org_cache is not None:
+        context.cache["organizations"] = run.org_cache
+        context.provenance["organizations"] = run.org_provenance
+    controls = config.controls
+    if run.rerun is not None:
+        controls = run.rerun.controls_for(prepared.account_id)
+        run.rerun.seed(context, prepared.account_id)
+    try:
+        with span("scan_account", "account", prepared.account_id):
+            evidence_entries = _build_evidence_entries(
+                controls, context, config.max_collector_workers
+            )
+    finally:
+        run.clients.release(prepared.session)
+        run.cache_stats.add(context.cache_stats)
+    return {
+        "account_id": prepared.identity["account_id"],
+        "account_name": run.account_map.get(prepared.account_id),
+        "caller_arn": prepared.identity["arn"],
+        "identity_error": prepared.identity["identity_error"] or prepared.assume_error,
+        "evidence": evidence_entries,
+    }
+
+
+def _scan_accounts(
+    run: _ScanRun,
+    account_ids: List[str],
+    on_settled: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Scan `account_ids`, yielding results in account order as they finish.
+
+    Role assumption runs as a separate stage ahead of evaluation, limited to
+    `role_prefetch` accounts beyond the busy evaluation workers. Accounts whose
+    role cannot be assumed are settled straight away and never take an
+    evaluation slot. AWS errors stay on the failing account; any other
+    exception is re-raised when that account's result is reached.
+    `on_settled(index, result)` runs on the worker thread as soon as an
+    account has its result, in whatever order accounts finish.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    config = run.config
+
+    def _settle(index: int, result: Dict[str, Any]) -> Dict[str, Any]:
+        if on_settled is not None:
+            on_settled(index, result)
+        return result
+
+    window = _OrderedWindow(
+        len(account_ids), config.max_account_workers + config.role_prefetch, _settle
+    )
+
+    # The assume pool is entered last so it shuts down first: a role
+    # assumption still running at shutdown can then hand its account to a
+    # scan pool that is still open.
+    with ThreadPoolExecutor(
+        max_workers=config.max_account_workers, thread_name_prefix="soc2-account"
+    ) as scan_pool, ThreadPoolExecutor(
+        max_workers=max(1, config.role_prefetch), thread_name_prefix="soc2-assume"
+    ) as assume_pool:
+
+        def _evaluate(index: int, prepared: _PreparedAccount) -> None:
+            try:
+                result = _evaluate_account(run, prepared)
+            except (BotoCoreError, ClientError) as exc:
+                result = _account_failure(run, prepared.account_id, str(exc))
+            except BaseException as exc:
+                window.reject(index, exc)
+                return
+            window.resolve(index, result)
+
+        def _prepare(index: int) -> None:
+            account_id = account_ids[index]
+            try:
+                prepared = _prepare_account(run, account_id)
+            except (BotoCoreError, ClientError) as exc:
+                window.resolve(index, _account_failure(run, account_id, str(exc)))
+                return
+            except BaseException as exc:
+                window.reject(index, exc)
+                return
+            if prepared.session is None:
+                window.resolve(index, _account_failure(run, account_id, prepared.assume_error))
+                return
+            if window.stopped.is_set():
+                # The caller stopped reading results; nobody waits for this one.
+                window.reject(index, RuntimeError("account scan stopped"))
+                return
+            scan_pool.submit(_evaluate, index, prepared)
+
+        yield from window.results(lambda index: assume_pool.submit(_prepare, index))
+
+
+def _init_account_worker(
+    config: ScanConfig,
+    identity: Dict[str, Optional[str]],
+    regions: List[str],
+    account_map: Dict[str, str],
+    org_cache: Optional[Dict[str, Any]],
+    org_provenance: Optional[Provenance],
+    plan: Optional[RerunPlan],
+) -> None:
+    """Give a worker process its own boto3 session, clients, limiter, caches and tracer."""
+    import boto3
     session = boto3.Session(
         profile_name=config.profile,
         region_name=config.regions[0] if config.regions else None,
     )
+    tracer = Tracer() if config.trace_output else None
+    run = _ScanRun(
+        config=config,
+        session=session,
+        identity=identity,
+        regions=regions,
+        account_map=account_map,
+        clients=ClientFactory(
+            max_pool_connections=config.max_collector_workers * config.max_region_workers,
+            rate_limiter=AdaptiveRateLimiter(config.max_api_rate),
+            telemetry=CallTelemetry(),
+            tracer=tracer,
+        ),
+        org_cache=org_cache,
+        org_provenance=org_provenance,
+        rerun=plan,
+    )
+    if config.credential_cache_dir:
+        run.credential_cache = CredentialCache(config.credential_cache_dir)
+    if config.collector_cache_dir:
+        run.collector_cache = CollectorCache(
+            config.collector_cache_dir, config.collector_cache_max_bytes, config.collector_ttls
+        )
+    run.sts_client = session.client("sts")
+    _worker.update(run=run, tracer=tracer)
+
+
+def _worker_stats(run: _ScanRun) -> Dict[str, Any]:
+    """The run-wide counters of one worker process so far (see `_run_stats`)."""
+    return {
+        "client_pool": run.clients.stats(),
+        "throttling": run.clients.rate_limiter.stats(),
+        "collector_cache": run.collector_cache.stats() if run.collector_cache else None,
+        "evidence_cache": run.cache_stats.stats(),
+    }
+
+
+def _scan_account_in_worker(account_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Scan one account in a worker process.
+
+    Return its result and a report for the parent: the account's API call
+    metrics and trace spans, and the worker's counters so far.
+    """
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    run: _ScanRun = _worker["run"]
+    tracer: Optional[Tracer] = _worker["tracer"]
+    with tracing(tracer):
+        try:
+            prepared = _prepare_account(run, account_id)
+            if prepared.session is None:
+                result = _account_failure(run, account_id, prepared.assume_error)
+            else:
+                result = _evaluate_account(run, prepared)
+        except (BotoCoreError, ClientError) as exc:
+            result = _account_failure(run, account_id, str(exc))
+    report = {
+        "pid": os.getpid(),
+        "telemetry": run.clients.telemetry.take(account_id),
+        "spans": tracer.take(account_id) if tracer is not None else [],
+        "stats": _worker_stats(run),
+    }
+    return result, report
+
+
+def _scan_accounts_in_processes(
+    run: _ScanRun,
+    account_ids: List[str],
+    on_settled: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """`_scan_accounts` on worker processes (--executor process).
+
+    Each worker assumes roles and evaluates controls with its own boto3
+    session, clients, rate limiter and caches, one account at a time, and
+    sends back each result with a report: the parent merges its API call
+    metrics and trace spans straight away, and its counters into
+    `run.worker_stats` (see `_run_stats`). Up to `role_prefetch` extra
+    accounts are queued beyond the busy workers.
+    """
+    config = run.config
+    tracer = active_tracer()
+
+    def _settle(index: int, raw: Tuple[Dict[str, Any], Dict[str, Any]]) -> Dict[str, Any]:
+        result, report = raw
+        if run.clients.telemetry is not None:
+            run.clients.telemetry.absorb(report["telemetry"])
+        if tracer is not None:
+            tracer.absorb(account_ids[index], report["spans"])
+        run.worker_stats[report["pid"]] = report["stats"]
+        if on_settled is not None:
+            on_settled(index, result)
+        return result
+
+    initargs = (
+        config,
+        run.identity,
+        run.regions,
+        run.account_map,
+        run.org_cache,
+        run.org_provenance,
+        run.rerun,
+    )
+    with _account_pool(config, _init_account_worker, initargs) as pool:
+        yield from _ordered_results(
+            pool,
+            account_ids,
+            _scan_account_in_worker,
+            config.max_account_workers + config.role_prefetch,
+            _settle,
+        )
+
+
+def _run_stats(run: _ScanRun) -> Dict[str, Any]:
+    """Client pool, throttling and cache counters of the run, worker processes included.
+
+    Worker counters are cumulative, so the latest report of each worker is
+    added to the parent's own.
+    """
+    workers = list(run.worker_stats.values())
+    client_pool = run.clients.stats()
+    throttling = run.clients.rate_limiter.stats()
+    evidence_cache = CacheStats()
+    evidence_cache.add(run.cache_stats.stats()["collectors"])
+    for stats in workers:
+        for name in client_pool:
+            client_pool[name] += stats["client_pool"][name]
+        for name in ("calls", "retries", "throttles"):
+            throttling[name] += stats["throttling"][name]
+        throttling["buckets"] += stats["throttling"]["buckets"]
+        evidence_cache.add(stats["evidence_cache"]["collectors"])
+    throttling["buckets"].sort(
+        key=lambda bucket: (str(bucket["account_id"]), bucket["service"], str(bucket["region"]))
+    )
+    collector_cache: Optional[Dict[str, Any]] = None
+    if run.collector_cache is not None:
+        if workers:
+            # Workers stored entries the parent's index has not seen.
+            run.collector_cache.rescan()
+        collector_cache = run.collector_cache.stats()
+        for stats in workers:
+            for name in ("hits", "misses", "expired", "stored", "evicted"):
+                collector_cache[name] += stats["collector_cache"][name]
+    return {
+        "client_pool": client_pool,
+        "throttling": throttling,
+        "collector_cache": collector_cache,
+        "evidence_cache": evidence_cache.stats(),
+    }
+
+
+def _profile_section(profiler: Any, phases: PhaseTimer) -> Dict[str, Any]:
+    return {
+        "profiler": profiler.name,
+        "phases": phases.summary(),
+        "artifacts": [PROFILE_STATS_FILE, PROFILE_SUMMARY_FILE],
+    }
+
+
+def run_scan(config: ScanConfig) -> Dict[str, Any]:
+    tracer = Tracer() if config.trace_output else None
+    profiler = create_profiler(config.profiler) if config.profile_run else None
+    phases = PhaseTimer() if profiler is not None else None
+    manifest = ArtifactManifest()
+    if profiler is not None:
+        profiler.start()
+    try:
+        with tracing(tracer), timing_phases(phases), span("run_scan", "scan"):
+            result = _run_scan(config, manifest, profiler, phases)
+    finally:
+        if profiler is not None:
+            profiler.stop()
+        if tracer is not None:
+            tracer.write(config.trace_output)
+    run_dir = os.path.dirname(result["artifacts"][0])
+    if profiler is not None:
+        for path in profiler.write(run_dir):
+            manifest.add_file(path)
+            result["artifacts"].append(path)
+    result["artifacts"].append(manifest.write(run_dir))
+    return result
+
+
+def run_merge(run_dirs: List[str], config: ScanConfig) -> Dict[str, Any]:
+    """Merge the run directories of every shard of a scan into one new run.
+
+    The result has the same evidence, summaries and manifest as if one host
+    had scanned all accounts. Each shard directory must pass verification
+    first. `config` supplies the output directory and report options;
+    controls and regions come from the shards.
+    """
+    with span("verify_shards", "run"):
+        for run_dir in run_dirs:
+            failed = [result for result in verify_run(run_dir) if not result.ok]
+            if failed:
+                raise ValueError(
+                    f"{run_dir} fails verification ({os.path.basename(failed[0].path)}); "
+                    "refusing to merge it."
+                )
+    with span("load_shards", "run"):
+        payloads = [load_run_evidence(run_dir) for run_dir in run_dirs]
+    shard_dirs = {id(payload): run_dir for payload, run_dir in zip(payloads, run_dirs)}
+    run_id = _run_id()
+    evidence_header, accounts, shards = merge_shards(payloads, run_id)
+    config = replace(
+        config, controls=evidence_header["controls"], regions=evidence_header["regions"]
+    )
+
+    shard_runs: List[Dict[str, Any]] = []
+    narrative = ""
+    for shard in shards:
+        completeness_path = os.path.join(shard_dirs[id(shard)], COMPLETENESS_FILE)
+        with open(completeness_path, "r", encoding="utf-8") as handle:
+            completeness = json.load(handle)
+        narrative = narrative or completeness.get("narrative", "")
+        shard_runs.append(
+            {
+                "index": shard["shard"]["index"],
+                "run_id": shard.get("run_id"),
+                "account_count": completeness.get("account_count"),
+                "generated_at": shard.get("generated_at"),
+            }
+        )
 
-    identity = _get_account_identity(session)
+    _ensure_output_dir(config.output_dir)
+    run_dir = os.path.join(config.output_dir, run_id)
+    _ensure_output_dir(run_dir)
+    manifest = ArtifactManifest()
+    ndjson = _open_ndjson_evidence(config, run_dir, evidence_header)
+    account_results: List[Dict[str, Any]] = []
+    for account in accounts:
+        if ndjson is not None:
+            ndjson.write_account(account)
+            account = report_view(account)
+        account_results.append(account)
+
+    schema_version = evidence_header.get("schema_version")
+    payload = evidence_document(
+        evidence_header,
+        _utc_timestamp(),
+        [account_record(account, schema_version) for account in account_results],
+    )
+    completeness_payload = {
+        "run_id": run_id,
+        "generated_at": payload["generated_at"],
+        "account_id": payload.get("account_id"),
+        "caller_arn": payload.get("caller_arn"),
+        "regions": config.regions,
+        "controls": config.controls,
+        "identity_error": payload.get("identity_error"),
+        "organization_error": payload.get("organization_error"),
+        "account_count": len(account_results),
+        "shards": shard_runs,
+        "attribution": _report_attribution(),
+        "narrative": narrative,
+        "artifacts": _artifact_index(config),
+    }
+    artifacts = _write_reports(
+        config, run_dir, payload, account_results, completeness_payload, manifest, ndjson
+    )
+    artifacts.append(manifest.write(run_dir))
+    return {"artifacts": artifacts, "identity_error": payload.get("identity_error")}
+
+
+def _run_scan(
+    config: ScanConfig,
+    manifest: ArtifactManifest,
+    profiler: Optional[Any] = None,
+    phases: Optional[PhaseTimer] = None,
+) -> Dict[str, Any]:
+    run_id, run_dir, state = _start_run(config)
+    if state is not None:
+        # The resumed run must scan exactly what the interrupted one did.
+        config = replace(
+            config,
+            controls=state["controls"],
+            regions=state["regions"],
+            rerun_dir=state.get("rerun_dir"),
+        )
+    plan: Optional[RerunPlan] = None
+    if config.rerun_dir:
+        with span("load_rerun_plan", "run"):
+            plan = RerunPlan(load_run_evidence(config.rerun_dir))
+        config = replace(config, controls=plan.controls, regions=plan.regions)
+    if config.simulate:
+        return _run_simulated_scan(
+            config, manifest, run_id, run_dir, state, plan, profiler, phases
+        )
+
+    import boto3
+
+    with span("session", "run"):
+        session = boto3.Session(
+            profile_name=config.profile,
+            region_name=config.regions[0] if config.regions else None,
+        )
+
+    with span("identity", "run"):
+        identity = _get_account_identity(session)
     regions = _resolve_regions(session, config.regions)
     account_results: List[Dict[str, Any]] = []
     organization_error: Optional[str] = None
 
+    telemetry = CallTelemetry()
+    clients = ClientFactory(
+        max_pool_connections=config.max_collector_workers * config.max_region_workers,
+        rate_limiter=AdaptiveRateLimiter(config.max_api_rate),
+        telemetry=telemetry,
+        tracer=active_tracer(),
+    )
+
+    collector_cache: Optional[CollectorCache] = None
+    if config.collector_cache_dir:
+        collector_cache = CollectorCache(
+            config.collector_cache_dir,
+            config.collector_cache_max_bytes,
+            config.collector_ttls,
+        )
+
     org_cache: Optional[Dict[str, Any]] = None
+    org_provenance: Optional[Provenance] = None
     if _needs_org_cache(config.controls):
-        org_cache = collect_organizations(session)
+        with span("collect_organizations", "run"):
+            org_cache, org_provenance = fetch_through(
+                collector_cache,
+                identity["account_id"],
+                "organizations",
+                regions,
+                lambda: collect_organizations(clients.bind(session, identity["account_id"])),
+            )
 
     account_ids: List[str] = []
     account_map: Dict[str, str] = {}
-    if config.all_accounts:
-        org_accounts, org_error = _list_org_accounts(session)
+    if state is not None:
+        account_ids, account_map = state["accounts"], state["account_map"]
+    elif plan is not None:
+        account_ids, account_map = plan.account_ids, plan.account_map()
+        organization_error = plan.organization_error
+    elif config.all_accounts:
+        with span("list_org_accounts", "run"):
+            org_accounts, org_error = _list_org_accounts(session)
         if org_error:
             organization_error = org_error
         for account in org_accounts:
@@ -833,99 +1840,95 @@ def run_scan(config: ScanConfig) -> Dict[str, Any]:
     if not account_ids:
         account_ids = [identity["account_id"] or ""]
 
-    for account_id in dict.fromkeys(account_ids):
-        if not account_id:
-            continue
-        if account_id == identity["account_id"]:
-            account_session = session
-            account_identity = identity
-            assume_error = None
-        else:
-            account_external_id = config.external_ids.get(account_id) or config.external_id
-            account_session, assume_error = _assume_role_session(
-                session, account_id, config.role_name, account_external_id
-            )
-            if account_session:
-                account_identity = _get_account_identity(account_session)
-            else:
-                account_identity = {"account_id": account_id, "arn": None, "identity_error": assume_error}
-
-        if not account_session:
-            account_results.append(
-                {
-                    "account_id": account_id,
-                    "account_name": account_map.get(account_id),
-                    "caller_arn": None,
-                    "identity_error": assume_error,
-                    "evidence": [],
-                }
-            )
-            continue
-
-        context = EvidenceContext(session=account_session, regions=regions)
-        if org_cache is not None:
-            context.cache["organizations"] = org_cache
-        evidence_entries = _build_evidence_entries(config.controls, context)
-        account_results.append(
+    pending = [account_id for account_id in dict.fromkeys(account_ids) if account_id]
+    shard = _shard_field(config, state, plan, pending)
+    if shard is not None and state is None and plan is None:
+        pending = select_shard(pending, config.shard)
+
+    run = _ScanRun(
+        config=config,
+        session=session,
+        identity=identity,
+        regions=regions,
+        account_map=account_map,
+        clients=clients,
+        org_cache=org_cache,
+        collector_cache=collector_cache,
+        org_provenance=org_provenance,
+        rerun=plan,
+    )
+    if config.credential_cache_dir:
+        run.credential_cache = CredentialCache(config.credential_cache_dir)
+    # boto3 sessions are not thread-safe, so the STS client used for role
+    # assumption is created here and shared (clients are thread-safe).
+    if any(account_id != identity["account_id"] for account_id in pending):
+        run.sts_client = session.client("sts")
+
+    checkpoints = CheckpointStore(run_dir)
+    if state is not None:
+        evidence_header = state["header"]
+        organization_error = evidence_header["organization_error"]
+    else:
+        evidence_header = versioned_header(
             {
-                "account_id": account_identity["account_id"],
-                "account_name": account_map.get(account_id),
-                "caller_arn": account_identity["arn"],
-                "identity_error": account_identity["identity_error"] or assume_error,
-                "evidence": evidence_entries,
-            }
+                "run_id": run_id,
+                "controls": config.controls,
+                "regions": regions,
+                "account_id": identity["account_id"],
+                "caller_arn": identity["arn"],
+                "identity_error": identity["identity_error"],
+                "organization_error": organization_error,
+                "attribution": _report_attribution(),
+            },
+            config.evidence_schema,
         )
+        if plan is not None:
+            evidence_header["rerun_of"] = plan.source_run_id
+        if shard is not None:
+            evidence_header["shard"] = shard
+        checkpoints.write_state(_run_state(config, evidence_header, pending, account_map))
+    ndjson = _open_ndjson_evidence(config, run_dir, evidence_header)
+    restored: List[str] = []
+
+    # Summary rows (and NDJSON evidence records) are streamed as each account
+    # finishes, so neither needs the whole organization in memory at once;
+    # in NDJSON mode only the report view of each account is kept.
+    stream_csv = "csv" in config.formats
+    csv_path = os.path.join(run_dir, SUMMARY_CSV)
+    scan_accounts = _scan_accounts_in_processes if config.executor == "process" else _scan_accounts
+    with span("scan_accounts", "run"), (
+        SummaryCsvWriter(csv_path) if stream_csv else nullcontext()
+    ) as summary_csv:
+        for account in checkpointed_scan(
+            checkpoints,
+            pending,
+            _with_rerun(lambda ids, settled: scan_accounts(run, ids, settled), plan, run_id),
+            restored,
+        ):
+            if summary_csv is not None:
+                summary_csv.write_account(account)
+            if ndjson is not None:
+                ndjson.write_account(account)
+                account = report_view(account)
+            account_results.append(account)
+    if summary_csv is not None:
+        manifest.add(csv_path, summary_csv.hexdigest())
+
+    schema_version = evidence_header.get("schema_version")
+    payload = evidence_document(
+        evidence_header,
+        _utc_timestamp(),
+        [account_record(account, schema_version) for account in account_results],
+    )
 
-    primary_evidence = account_results[0]["evidence"] if account_results else []
-
-    payload = {
-        "generated_at": _utc_timestamp(),
-        "run_id": run_id,
-        "controls": config.controls,
-        "regions": regions,
-        "account_id": identity["account_id"],
-        "caller_arn": identity["arn"],
-        "identity_error": identity["identity_error"],
-        "organization_error": organization_error,
-        "attribution": _report_attribution(),
-        "evidence": primary_evidence,
-        "accounts": account_results if len(account_results) > 1 else [],
-    }
-
-    json_path = os.path.join(run_dir, "evidence.json")
-    with open(json_path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2, sort_keys=True)
-
-    csv_path = os.path.join(run_dir, "evidence_summary.csv")
-    summary_rows: List[Dict[str, Any]] = []
-    for account in account_results:
-        for entry in account.get("evidence", []):
-            config_rules = entry.get("data", {}).get("config_rules", {})
-            noncompliant_rules = [
-                rule.get("name")
-                for rule in config_rules.get("rules_sample", [])
-                if rule.get("compliance") == "NON_COMPLIANT"
-            ]
-            noncompliant_rules_sample = ", ".join(noncompliant_rules[:10])
-            summary_rows.append(
-                {
-                    "account_id": account.get("account_id"),
-                    "account_name": account.get("account_name"),
-                    "control_id": entry.get("control_id"),
-                    "title": entry.get("title"),
-                    "status": entry.get("status"),
-                    "gap_count": len(entry.get("gaps", [])),
-                    "error_count": len(entry.get("errors", [])),
-                    "noncompliant_rule_count": config_rules.get("noncompliant_count", 0),
-                    "noncompliant_rules_sample": noncompliant_rules_sample,
-                }
-            )
-    summary_df = pd.DataFrame(summary_rows)
-    summary_df.to_csv(csv_path, index=False)
-
-    hash_path = _write_hash_file(json_path)
+    telemetry_summary = telemetry.summary()
+    run_stats = _run_stats(run)
+    telemetry_path: Optional[str] = None
+    if config.write_telemetry:
+        telemetry_path = os.path.join(run_dir, "telemetry.json")
+        with manifest.open(telemetry_path) as handle:
+            json.dump(telemetry_summary, handle, indent=2, sort_keys=True)
 
-    completeness_path = os.path.join(run_dir, "run_completeness.json")
     completeness_payload = {
         "run_id": run_id,
         "generated_at": payload["generated_at"],
@@ -936,109 +1939,36 @@ def run_scan(config: ScanConfig) -> Dict[str, Any]:
         "identity_error": payload["identity_error"],
         "organization_error": organization_error,
         "account_count": len(account_results),
+        "restored_accounts": len(restored),
+        "rerun": plan.summary() if plan is not None else None,
+        "executor": config.executor,
+        "client_pool": run_stats["client_pool"],
+        "evidence_cache": run_stats["evidence_cache"],
+        "throttling": run_stats["throttling"],
+        "telemetry": telemetry_summary,
+        "collector_cache": run_stats["collector_cache"],
         "attribution": _report_attribution(),
         "narrative": (
             "NON_COMPLIANT values reflect AWS Config/Security Hub rule failures, "
             "not a direct SOC 2 determination. They are supporting evidence that "
             "may indicate control gaps and require review."
         ),
-        "artifacts": {
-            "evidence_json": os.path.basename(json_path),
-            "evidence_csv": os.path.basename(csv_path),
-            "evidence_hash": os.path.basename(hash_path),
-        },
-    }
-    with open(completeness_path, "w", encoding="utf-8") as handle:
-        json.dump(completeness_payload, handle, indent=2, sort_keys=True)
-    completeness_hash = _write_hash_file(completeness_path)
-
-    summary_path = os.path.join(run_dir, "report_summary.md")
-    remediation_rule_map = {
-        "securityhub-access-keys-rotated-dcc5e306": (
-            "Rotate or deactivate IAM access keys that exceed your rotation policy. "
-            "Remove unused keys and enforce MFA/SSO for users."
-        )
+        "artifacts": _artifact_index(config, telemetry_path),
     }
 
-    summary_lines = [
-        "# SOC 2 Evidence Summary",
-        "",
-        f"- Run ID: {run_id}",
-        f"- Generated at (UTC): {payload['generated_at']}",
-        f"- Account ID: {payload['account_id']}",
-        f"- Caller ARN: {payload['caller_arn']}",
-        f"- Regions: {', '.join(regions)}",
-        f"- Controls: {', '.join(config.controls)}",
-        f"- Account count: {len(account_results)}",
-        f"- Attribution: {_report_attribution()}",
-        "",
-        "## Notes",
-        completeness_payload["narrative"],
-        "",
-        "## Control Results",
-    ]
-
-    for account in account_results:
-        summary_lines.extend(
-            [
-                "",
-                f"### Account {account.get('account_id')}",
-            ]
-        )
-        if account.get("account_name"):
-            summary_lines.append(f"- Name: {account.get('account_name')}")
-        if account.get("identity_error"):
-            summary_lines.append(f"- Identity error: {account.get('identity_error')}")
-        summary_lines.append("")
-
-        for entry in account.get("evidence", []):
-            summary_lines.extend(
-                [
-                    f"#### {entry.get('control_id')} - {entry.get('title')}",
-                    f"- **Status:** {_format_status_value(entry.get('status', 'unknown'))}",
-                    f"- **Control description:** {entry.get('control_language')}",
-                    f"- Summary: {_control_summary(entry)}",
-                    f"- Collected at: {entry.get('collected_at')}",
-                ]
-            )
-
-            issue_rows = _build_issue_rows(entry, remediation_rule_map)
-            if issue_rows:
-                summary_lines.append("")
-                summary_lines.append("| Type | Finding | Recommendation |")
-                summary_lines.append("| --- | --- | --- |")
-                for row in issue_rows:
-                    summary_lines.append(
-                        f"| {row['type']} | {row['item']} | {row['recommendation']} |"
-                    )
-            summary_lines.append("")
-
-    summary_lines.extend(
-        [
-            "## Artifacts",
-            f"- evidence.json",
-            f"- evidence_summary.csv",
-            f"- evidence.json.sha256",
-            f"- run_completeness.json",
-            f"- run_completeness.json.sha256",
-        ]
+    artifacts = _write_reports(
+        config,
+        run_dir,
+        payload,
+        account_results,
+        completeness_payload,
+        manifest,
+        ndjson,
+        streamed=[csv_path] if stream_csv else [],
+        profiler=profiler,
+        phases=phases,
     )
-    with open(summary_path, "w", encoding="utf-8") as handle:
-        handle.write("\n".join(summary_lines).strip() + "\n")
-    summary_hash = _write_hash_file(summary_path)
-    pdf_path = _write_pdf_summary(run_dir, payload, account_results, completeness_payload)
-    pdf_hash = _write_hash_file(pdf_path) if pdf_path else None
-
-    return {
-        "artifacts": [
-            json_path,
-            csv_path,
-            hash_path,
-            completeness_path,
-            completeness_hash,
-            summary_path,
-            summary_hash,
-            *(path for path in [pdf_path, pdf_hash] if path),
-        ],
-        "identity_error": identity["identity_error"],
-    }
+    checkpoints.remove()
+    if telemetry_path:
+        artifacts.append(telemetry_path)
+    return {"artifacts": artifacts, "identity_error": identity["identity_error"]}
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+import boto3
+import botocore.session
+from botocore.credentials import Credentials, RefreshableCredentials
+
+if TYPE_CHECKING:
+    from soc2_scanner.credential_cache import CredentialCache
+
+
+ROLE_SESSION_NAME = "soc2-scanner"
+
+
+_shared_lock = threading.Lock()
+_shared_components: Optional[Dict[str, Any]] = None
+# Set once the installed botocore turns out not to have the internals below.
+_shared_unsupported = False
+
+
+def _load_shared_components() -> Dict[str, Any]:
+    """Build the process-wide botocore components once and warm them.
+
+    The data loader memoizes every service model and endpoint file it reads,
+    so sharing it means each JSON file is parsed once per process instead of
+    once per account session.
+    """
+    global _shared_components
+    with _shared_lock:
+        if _shared_components is None:
+            template = botocore.session.get_session()
+            # Resolving the endpoint resolver loads endpoints.json into the
+            # loader cache; later sessions get it for free.
+            _shared_components = {
+                "data_loader": template.get_component("data_loader"),
+                "response_parser_factory": template.get_component("response_parser_factory"),
+                "endpoint_resolver": template._get_internal_component("endpoint_resolver"),
+                "exceptions_factory": template._get_internal_component("exceptions_factory"),
+            }
+        return _shared_components
+
+
+def _shared_session(
+    credentials: Optional[Credentials], **kwargs: Any
+) -> Optional[boto3.Session]:
+    """A boto3 session on the shared botocore components, or None if unsupported.
+
+    This is the only place that touches private botocore and boto3
+    attributes. If any of them is missing, it returns None from then on and
+    callers fall back to a plain boto3.Session.
+    """
+    global _shared_unsupported
+    if _shared_unsupported:
+        return None
+    try:
+        components = _load_shared_components()
+        core = botocore.session.get_session()
+        core.register_component("data_loader", components["data_loader"])
+        core.register_component("response_parser_factory", components["response_parser_factory"])
+        # botocore keeps these two out of the public component registry; they
+        # are stateless apart from their caches, which is what we want to share.
+        core._internal_components.register_component(
+            "endpoint_resolver", components["endpoint_resolver"]
+        )
+        core._internal_components.register_component(
+            "exceptions_factory", components["exceptions_factory"]
+        )
+        if credentials is not None:
+            # botocore has no public setter for a session's credentials.
+            core._credentials = credentials
+        session = boto3.Session(botocore_session=core, **kwargs)
+        # boto3 appends its own data directory to the loader on every
+        # Session(); with a shared loader that would grow the search path
+        # per account.
+        search_paths = session._loader.search_paths
+    except AttributeError:
+        _shared_unsupported = True
+        return None
+    with _shared_lock:
+        search_paths[:] = list(dict.fromkeys(search_paths))
+    return session
+
+
+def new_session(
+    aws_access_key_id: Optional[str] = None,
+    aws_secret_access_key: Optional[str] = None,
+    aws_session_token: Optional[str] = None,
+    region_name: Optional[str] = None,
+    credentials: Optional[Credentials] = None,
+) -> boto3.Session:
+    """Create a boto3 session that reuses the process-wide model caches.
+
+    `credentials` (e.g. refreshable assumed-role credentials) replace the
+    static keys. Where the model caches cannot be shared, this is a plain
+    boto3.Session holding the current keys of `credentials`.
+    """
+    keys = {
+        "aws_access_key_id": aws_access_key_id,
+        "aws_secret_access_key": aws_secret_access_key,
+        "aws_session_token": aws_session_token,
+    }
+    session = _shared_session(
+        credentials, region_name=region_name, **({} if credentials is not None else keys)
+    )
+    if session is not None:
+        return session
+    if credentials is not None:
+        frozen = credentials.get_frozen_credentials()
+        keys = {
+            "aws_access_key_id": frozen.access_key,
+            "aws_secret_access_key": frozen.secret_key,
+            "aws_session_token": frozen.token,
+        }
+    return boto3.Session(region_name=region_name, **keys)
+
+
+def assume_role_session(
+    sts_client: Any,
+    role_arn: str,
+    external_id: Optional[str] = None,
+    region_name: Optional[str] = None,
+    credential_cache: Optional["CredentialCache"] = None,
+) -> Tuple[boto3.Session, Optional[str]]:
+    """Return a session whose assumed-role credentials refresh themselves.
+
+    botocore calls back into STS shortly before the credentials expire, so
+    long scans keep working past the one-hour role session limit. With a
+    credential cache, still-valid credentials from an earlier run are used
+    without calling STS, and every refresh is written back to the cache.
+    STS errors from the initial assumption propagate to the caller.
+
+    Also returns the assumed-role ARN reported by STS (None for cache entries
+    written before it was recorded), which identifies the account without a
+    GetCallerIdentity call.
+    """
+
+    def _refresh() -> Dict[str, str]:
+        assume_kwargs: Dict[str, Any] = {
+            "RoleArn": role_arn,
+            "RoleSessionName": ROLE_SESSION_NAME,
+        }
+        if external_id:
+            assume_kwargs["ExternalId"] = external_id
+        response = sts_client.assume_role(**assume_kwargs)
+        credentials = response["Credentials"]
+        expiration = credentials["Expiration"]
+        metadata = {
+            "access_key": credentials["AccessKeyId"],
+            "secret_key": credentials["SecretAccessKey"],
+            "token": credentials["SessionToken"],
+            "expiry_time": expiration.isoformat()
+            if hasattr(expiration, "isoformat")
+            else str(expiration),
+            "assumed_role_arn": response.get("AssumedRoleUser", {}).get("Arn"),
+        }
+        if credential_cache is not None:
+            credential_cache.store(role_arn, external_id, metadata)
+        return metadata
+
+    metadata = credential_cache.load(role_arn, external_id) if credential_cache else None
+    if metadata is None:
+        metadata = _refresh()
+
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=metadata,
+        refresh_using=_refresh,
+        method="assume-role",
+    )
+    return (
+        new_session(region_name=region_name, credentials=credentials),
+        metadata.get("assumed_role_arn"),
+    )
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from soc2_scanner.rerun import run_accounts
+
+
+# (index, count): shard `index` (1-based) of `count`.
+Shard = Tuple[int, int]
+
+# Evidence header fields a merged run takes from its first shard.
+MERGED_HEADER_FIELDS = (
+    "controls",
+    "regions",
+    "account_id",
+    "caller_arn",
+    "identity_error",
+    "attribution",
+    "schema_version",
+)
+
+
+def parse_shard(value: str) -> Shard:
+    """Parse "i/N" (1 <= i <= N)."""
+    index, separator, count = str(value).partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        shard = (0, 0)
+    if not separator or not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"shard must look like i/N with 1 <= i <= N, got {value!r}.")
+    return shard
+
+
+def shard_of(account_id: str, count: int) -> int:
+    """The 1-based shard `account_id` belongs to; stable across hosts and Python versions."""
+    digest = hashlib.sha256(account_id.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def select_shard(account_ids: List[str], shard: Shard) -> List[str]:
+    index, count = shard
+    return [account_id for account_id in account_ids if shard_of(account_id, count) == index]
+
+
+def shard_header(shard: Shard, account_ids: List[str]) -> Dict[str, Any]:
+    """The evidence header "shard" field: which shard this is, and the account list it
+    was cut from, in order, so `merge` can restore the single-host order."""
+    return {"index": shard[0], "count": shard[1], "account_ids": account_ids}
+
+
+def merge_shards(
+    payloads: List[Dict[str, Any]], run_id: str
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Combine the evidence of every shard of one scan.
+
+    Return the merged evidence header, the accounts in single-host order and
+    the shard payloads sorted by index. Raise ValueError unless `payloads`
+    are exactly shards 1..N of the same scan, each with all of its accounts.
+    """
+    for payload in payloads:
+        if not payload.get("shard"):
+            raise ValueError(f"Run {payload.get('run_id')} was not scanned with --shard.")
+    shards = sorted(payloads, key=lambda payload: payload["shard"]["index"])
+    first = shards[0]
+    count = first["shard"]["count"]
+    indices = [payload["shard"]["index"] for payload in shards]
+    if indices != list(range(1, count + 1)) or any(
+        payload["shard"]["count"] != count for payload in shards
+    ):
+        raise ValueError(f"Expected shards 1..{count} exactly once each, got {indices}.")
+    for payload in shards[1:]:
+        for key in ("controls", "regions", "schema_version"):
+            if payload.get(key) != first.get(key):
+                raise ValueError(
+                    f"Shard {payload['shard']['index']} has different {key} than shard 1."
+                )
+        if payload["shard"]["account_ids"] != first["shard"]["account_ids"]:
+            raise ValueError(
+                f"Shard {payload['shard']['index']} was cut from a different account list."
+            )
+
+    order = first["shard"]["account_ids"]
+    by_id: Dict[str, Dict[str, Any]] = {}
+    for payload in shards:
+        index = payload["shard"]["index"]
+        # An empty legacy-schema shard still has a (placeholder) top-level account.
+        accounts = run_accounts(payload) if select_shard(order, (index, count)) else []
+        for account in accounts:
+            account_id = account["account_id"]
+            if shard_of(account_id, count) != index or account_id in by_id:
+                raise ValueError(f"Account {account_id} does not belong to shard {index}.")
+            by_id[account_id] = account
+    missing = [account_id for account_id in order if account_id not in by_id]
+    if missing or len(by_id) != len(order):
+        raise ValueError(f"Shard runs are incomplete; missing accounts: {', '.join(missing)}.")
+
+    organization_error: Optional[str] = next(
+        (payload["organization_error"] for payload in shards if payload.get("organization_error")),
+        None,
+    )
+    header = {"run_id": run_id}
+    header.update({key: first[key] for key in MERGED_HEADER_FIELDS if key in first})
+    header["organization_error"] = organization_error
+    return header, [by_id[account_id] for account_id in order], shards
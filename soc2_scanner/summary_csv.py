@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import csv
+import os
+from typing import Any, Dict, Iterator, List
+
+from soc2_scanner.hashing import hashing_open
+
+
+SUMMARY_COLUMNS = [
+    "account_id",
+    "account_name",
+    "control_id",
+    "title",
+    "status",
+    "gap_count",
+    "error_count",
+    "noncompliant_rule_count",
+    "noncompliant_rules_sample",
+]
+
+
+def summary_rows(account: Dict[str, Any]) -> Iterator[List[Any]]:
+    """Yield one evidence_summary.csv row per control result of `account`."""
+    for entry in account.get("evidence", []):
+        config_rules = entry.get("data", {}).get("config_rules", {})
+        noncompliant_rules = [
+            rule.get("name")
+            for rule in config_rules.get("rules_sample", [])
+            if rule.get("compliance") == "NON_COMPLIANT"
+        ]
+        yield [
+            account.get("account_id"),
+            account.get("account_name"),
+            entry.get("control_id"),
+            entry.get("title"),
+            entry.get("status"),
+            len(entry.get("gaps", [])),
+            len(entry.get("errors", [])),
+            config_rules.get("noncompliant_count", 0),
+            ", ".join(noncompliant_rules[:10]),
+        ]
+
+
+class SummaryCsvWriter:
+    """Streams evidence_summary.csv one account at a time.
+
+    The output is byte-identical to the `DataFrame.to_csv(index=False)` it
+    replaces: minimal quoting, `os.linesep` line endings, None written as an
+    empty field, the header written with the first row, and a summary
+    without rows written as a single empty line. The SHA-256 of the file is
+    available from `hexdigest()` once it is closed.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.row_count = 0
+        self._handle, self._hashing = hashing_open(path, newline="")
+        self._writer = csv.writer(self._handle, lineterminator=os.linesep)
+
+    def write_account(self, account: Dict[str, Any]) -> None:
+        for row in summary_rows(account):
+            if not self.row_count:
+                self._writer.writerow(SUMMARY_COLUMNS)
+            self._writer.writerow(row)
+            self.row_count += 1
+
+    def close(self) -> None:
+        if self._handle.closed:
+            return
+        if not self.row_count:
+            self._handle.write(os.linesep)
+        self._handle.close()
+
+    def hexdigest(self) -> str:
+        return self._hashing.hexdigest()
+
+    def __enter__(self) -> "SummaryCsvWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
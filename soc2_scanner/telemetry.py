@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from soc2_scanner.throttling import is_throttle_response
+
+
+TelemetryKey = Tuple[Optional[str], str, str, Optional[str]]
+
+_STARTED = "soc2_scanner_started"
+_OPERATION = "soc2_scanner_operation"
+
+
+def _percentile(ordered: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class _OperationStats:
+    __slots__ = ("latencies", "retries", "throttles", "errors", "response_bytes")
+
+    def __init__(self) -> None:
+        self.latencies: List[float] = []
+        self.retries = 0
+        self.throttles = 0
+        self.errors: Dict[str, int] = {}
+        self.response_bytes = 0
+
+
+class CallTelemetry:
+    """Per-API-call metrics gathered from botocore client events.
+
+    `attach` hooks a client so every call is recorded under (account,
+    service, operation, region): latency from `before-call` to `after-call`
+    (including retries and rate-limiter waits), retry attempts, throttled
+    attempts, error codes and response body size.
+    """
+
+    def __init__(self) -> None:
+        self._operations: Dict[TelemetryKey, _OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, key: TelemetryKey) -> _OperationStats:
+        stats = self._operations.get(key)
+        if stats is None:
+            stats = self._operations[key] = _OperationStats()
+        return stats
+
+    def attach(self, client: Any, account_id: Optional[str], service: str) -> None:
+        region = client.meta.region_name
+
+        def _key(operation_name: str) -> TelemetryKey:
+            return (account_id, service, operation_name, region)
+
+        def _before_call(model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+            # after-call-error only gets the exception and this context.
+            context[_OPERATION] = model.name
+            context[_STARTED] = time.perf_counter()
+
+        def _after_call(
+            http_response: Any,
+            parsed: Dict[str, Any],
+            model: Any,
+            context: Dict[str, Any],
+            **kwargs: Any,
+        ) -> None:
+            elapsed = time.perf_counter() - context.get(_STARTED, time.perf_counter())
+            metadata = parsed.get("ResponseMetadata", {})
+            error_code = parsed.get("Error", {}).get("Code")
+            body = getattr(http_response, "content", None) or b""
+            with self._lock:
+                stats = self._stats(_key(model.name))
+                stats.latencies.append(elapsed)
+                stats.retries += metadata.get("RetryAttempts", 0)
+                stats.response_bytes += len(body)
+                if error_code:
+                    stats.errors[error_code] = stats.errors.get(error_code, 0) + 1
+
+        def _after_call_error(
+            exception: BaseException, context: Dict[str, Any], **kwargs: Any
+        ) -> None:
+            operation_name = context.get(_OPERATION)
+            if operation_name is None:
+                return
+            elapsed = time.perf_counter() - context.get(_STARTED, time.perf_counter())
+            error_code = type(exception).__name__
+            with self._lock:
+                stats = self._stats(_key(operation_name))
+                stats.latencies.append(elapsed)
+                stats.errors[error_code] = stats.errors.get(error_code, 0) + 1
+
+        def _needs_retry(response: Any = None, operation: Any = None, **kwargs: Any) -> None:
+            if operation is not None and is_throttle_response(response):
+                with self._lock:
+                    self._stats(_key(operation.name)).throttles += 1
+
+        events = client.meta.events
+        events.register("before-call", _before_call)
+        events.register("after-call", _after_call)
+        events.register("after-call-error", _after_call_error)
+        events.register("needs-retry", _needs_retry)
+
+    def take(self, account_id: Optional[str]) -> List[Tuple[TelemetryKey, _OperationStats]]:
+        """Remove and return the raw metrics recorded for `account_id` (see `absorb`)."""
+        with self._lock:
+            keys = [key for key in self._operations if key[0] == account_id]
+            return [(key, self._operations.pop(key)) for key in keys]
+
+    def absorb(self, records: List[Tuple[TelemetryKey, _OperationStats]]) -> None:
+        """Add metrics taken from another CallTelemetry, e.g. one in a worker process."""
+        with self._lock:
+            for key, other in records:
+                stats = self._stats(key)
+                stats.latencies.extend(other.latencies)
+                stats.retries += other.retries
+                stats.throttles += other.throttles
+                for code, count in other.errors.items():
+                    stats.errors[code] = stats.errors.get(code, 0) + count
+                stats.response_bytes += other.response_bytes
+
+    def summary(self) -> Dict[str, Any]:
+        """Aggregate metrics, slowest operations (by total time) first."""
+        operations: List[Dict[str, Any]] = []
+        with self._lock:
+            for (account_id, service, operation, region), stats in self._operations.items():
+                latencies = sorted(stats.latencies)
+                operations.append(
+                    {
+                        "account_id": account_id,
+                        "service": service,
+                        "operation": operation,
+                        "region": region,
+                        "count": len(latencies),
+                        "total_ms": round(sum(latencies) * 1000, 3),
+                        "p50_ms": round(_percentile(latencies, 50) * 1000, 3),
+                        "p95_ms": round(_percentile(latencies, 95) * 1000, 3),
+                        "p99_ms": round(_percentile(latencies, 99) * 1000, 3),
+                        "retries": stats.retries,
+                        "throttles": stats.throttles,
+                        "errors": dict(stats.errors),
+                        "response_bytes": stats.response_bytes,
+                    }
+                )
+        operations.sort(
+            key=lambda item: (
+                -item["total_ms"],
+                str(item["account_id"]),
+                item["service"],
+                item["operation"],
+                str(item["region"]),
+            )
+        )
+        return {
+            "call_count": sum(item["count"] for item in operations),
+            "total_ms": round(sum(item["total_ms"] for item in operations), 3),
+            "operations": operations,
+        }
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+
+DEFAULT_MAX_API_RATE = 20.0
+MIN_API_RATE = 0.5
+
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "BandwidthLimitExceeded",
+        "EC2ThrottledException",
+        "LimitExceededException",
+        "PriorRequestNotComplete",
+        "ProvisionedThroughputExceededException",
+        "RequestLimitExceeded",
+        "RequestThrottled",
+        "RequestThrottledException",
+        "SlowDown",
+        "Throttling",
+        "ThrottlingException",
+        "TooManyRequestsException",
+    }
+)
+
+LimiterKey = Tuple[Optional[str], str, Optional[str]]
+
+
+def is_throttle_response(response: Any) -> bool:
+    """Return True if a botocore (http_response, parsed) pair is a throttle."""
+    if not response:
+        return False
+    http_response, parsed = response
+    if getattr(http_response, "status_code", None) == 429:
+        return True
+    code = (parsed or {}).get("Error", {}).get("Code")
+    return code in THROTTLE_ERROR_CODES
+
+
+class TokenBucket:
+    """Token bucket whose refill rate follows AIMD.
+
+    Every successful response adds roughly one request per second of rate
+    per second of traffic; every throttle halves it. The bucket holds at
+    most one second of tokens, so bursts stay close to the current rate.
+    """
+
+    def __init__(
+        self, max_rate: float, min_rate: float = MIN_API_RATE, increase: float = 1.0
+    ) -> None:
+        self.max_rate = max_rate
+        self.min_rate = min(min_rate, max_rate)
+        self.increase = increase
+        self.rate = max_rate
+        self.calls = 0
+        self.attempts = 0
+        self.throttles = 0
+        self._tokens = max(1.0, max_rate)
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token for one HTTP attempt, sleeping until one is due."""
+        with self._lock:
+            self.attempts += 1
+            now = time.monotonic()
+            capacity = max(1.0, self.rate)
+            self._tokens = min(capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # Reserve the token even when the bucket is empty; callers queue
+            # up behind each other instead of racing for the next refill.
+            self._tokens -= 1.0
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+    def record_call(self) -> None:
+        with self._lock:
+            self.calls += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def record_throttle(self) -> None:
+        with self._lock:
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate / 2)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "retries": max(0, self.attempts - self.calls),
+                "throttles": self.throttles,
+                "rate": round(self.rate, 2),
+            }
+
+
+class AdaptiveRateLimiter:
+    """Shares one AIMD token bucket per (account, service, region).
+
+    `attach` hooks a botocore client's events: every HTTP attempt (retries
+    included) takes a token, and every response feeds the bucket's rate.
+    Clients for the same account, service and region share a bucket, so
+    concurrent collectors and regions back off together.
+    """
+
+    def __init__(self, max_rate: float = DEFAULT_MAX_API_RATE) -> None:
+        self.max_rate = max_rate
+        self._buckets: Dict[LimiterKey, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, account_id: Optional[str], service: str, region: Optional[str]) -> TokenBucket:
+        key = (account_id, service, region)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.max_rate)
+            return bucket
+
+    def attach(self, client: Any, account_id: Optional[str], service: str) -> None:
+        bucket = self.bucket(account_id, service, client.meta.region_name)
+
+        def _before_call(**kwargs: Any) -> None:
+            bucket.record_call()
+
+        def _before_send(**kwargs: Any) -> None:
+            bucket.acquire()
+
+        def _needs_retry(response: Any = None, **kwargs: Any) -> None:
+            if is_throttle_response(response):
+                bucket.record_throttle()
+            elif response is not None:
+                bucket.record_success()
+
+        events = client.meta.events
+        events.register("before-call", _before_call)
+        events.register("before-send", _before_send)
+        events.register("needs-retry", _needs_retry)
+
+    def stats(self) -> Dict[str, Any]:
+        """Totals plus the buckets that saw retries or throttles."""
+        with self._lock:
+            items = sorted(self._buckets.items(), key=lambda item: tuple(map(str, item[0])))
+        totals = {"calls": 0, "retries": 0, "throttles": 0}
+        throttled: List[Dict[str, Any]] = []
+        for (account_id, service, region), bucket in items:
+            bucket_stats = bucket.stats()
+            for name in totals:
+                totals[name] += bucket_stats[name]
+            if bucket_stats["retries"] or bucket_stats["throttles"]:
+                throttled.append(
+                    {"account_id": account_id, "service": service, "region": region, **bucket_stats}
+                )
+        return {**totals, "max_rate": self.max_rate, "buckets": throttled}
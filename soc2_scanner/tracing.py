@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from soc2_scanner.profiling import PhaseTimer
+
+
+RUN_PID = 0
+
+# Run-level spans in these categories double as phases for --profile-run.
+PHASE_CATEGORIES = frozenset({"run", "writer"})
+
+_STARTED = "soc2_scanner_trace_started"
+_OPERATION = "soc2_scanner_trace_operation"
+
+_active: Optional["Tracer"] = None
+_phases: Optional["PhaseTimer"] = None
+
+
+class Tracer:
+    """Collects spans as Chrome Trace Event "complete" events.
+
+    Run-level spans share one process track; every scanned account gets its
+    own process track, with one lane per thread that worked on it. The
+    written file opens in Perfetto (ui.perfetto.dev) or chrome://tracing.
+    """
+
+    def __init__(self) -> None:
+        self._origin = time.perf_counter()
+        self._events: List[Dict[str, Any]] = []
+        self._account_pids: Dict[str, int] = {}
+        self._threads: Dict[Tuple[int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def _pid(self, account_id: Optional[str]) -> int:
+        if account_id is None:
+            return RUN_PID
+        pid = self._account_pids.get(account_id)
+        if pid is None:
+            pid = self._account_pids[account_id] = len(self._account_pids) + 1
+        return pid
+
+    def complete(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        account_id: Optional[str] = None,
+        args: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Record a span from two `time.perf_counter()` readings."""
+        thread = threading.current_thread()
+        self._add(name, category, start, end, account_id, args, thread.ident or 0, thread.name)
+
+    def _add(
+        self,
+        name: str,
+        category: str,
+        start: float,
+        end: float,
+        account_id: Optional[str],
+        args: Optional[Dict[str, Any]],
+        tid: int,
+        thread_name: str,
+    ) -> None:
+        with self._lock:
+            pid = self._pid(account_id)
+            self._threads.setdefault((pid, tid), thread_name)
+            self._events.append(
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": round((start - self._origin) * 1e6, 3),
+                    "dur": round((end - start) * 1e6, 3),
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args or {},
+                }
+            )
+
+    def take(self, account_id: str) -> List[Dict[str, Any]]:
+        """Remove and return the spans recorded for `account_id` (see `absorb`).
+
+        Span times are `time.perf_counter()` readings, which share one clock
+        across the processes of a host.
+        """
+        with self._lock:
+            pid = self._account_pids.get(account_id)
+            if pid is None:
+                return []
+            threads = {tid: name for (owner, tid), name in self._threads.items() if owner == pid}
+            spans = [
+                {
+                    "name": event["name"],
+                    "cat": event["cat"],
+                    "start": self._origin + event["ts"] / 1e6,
+                    "end": self._origin + (event["ts"] + event["dur"]) / 1e6,
+                    "args": event["args"],
+                    "tid": event["tid"],
+                    "thread": threads.get(event["tid"], ""),
+                }
+                for event in self._events
+                if event["pid"] == pid
+            ]
+            self._events = [event for event in self._events if event["pid"] != pid]
+            for tid in threads:
+                del self._threads[(pid, tid)]
+            return spans
+
+    def absorb(self, account_id: str, spans: List[Dict[str, Any]]) -> None:
+        """Add spans taken from another Tracer, e.g. one in a worker process."""
+        for item in spans:
+            self._add(
+                item["name"],
+                item["cat"],
+                item["start"],
+                item["end"],
+                account_id,
+                item["args"],
+                item["tid"],
+                item["thread"],
+            )
+
+    def attach(self, client: Any, account_id: Optional[str], service: str) -> None:
+        """Emit a span for every API call made through `client`."""
+        region = client.meta.region_name
+
+        def _before_call(model: Any, context: Dict[str, Any], **kwargs: Any) -> None:
+            # after-call-error only gets the exception and this context.
+            context[_OPERATION] = model.name
+            context[_STARTED] = time.perf_counter()
+
+        def _finish(context: Dict[str, Any], **args: Any) -> None:
+            start = context.get(_STARTED)
+            if start is not None:
+                self.complete(
+                    f"{service}.{context[_OPERATION]}",
+                    "aws",
+                    start,
+                    time.perf_counter(),
+                    account_id,
+                    {"region": region, **args},
+                )
+
+        def _after_call(context: Dict[str, Any], **kwargs: Any) -> None:
+            _finish(context)
+
+        def _after_call_error(
+            exception: BaseException, context: Dict[str, Any], **kwargs: Any
+        ) -> None:
+            _finish(context, error=type(exception).__name__)
+
+        events = client.meta.events
+        events.register("before-call", _before_call)
+        events.register("after-call", _after_call)
+        events.register("after-call-error", _after_call_error)
+
+    def events(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            metadata: List[Dict[str, Any]] = [
+                {
+                    "name": "process_name",
+                    "ph": "M",
+                    "pid": RUN_PID,
+                    "tid": 0,
+                    "args": {"name": "soc2-scanner run"},
+                }
+            ]
+            for account_id, pid in self._account_pids.items():
+                metadata.append(
+                    {
+                        "name": "process_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": 0,
+                        "args": {"name": f"account {account_id}"},
+                    }
+                )
+            for (pid, tid), thread_name in self._threads.items():
+                metadata.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": tid,
+                        "args": {"name": thread_name},
+                    }
+                )
+            return metadata + sorted(self._events, key=lambda event: event["ts"])
+
+    def write(self, path: str) -> str:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, handle)
+        return path
+
+
+def active_tracer() -> Optional[Tracer]:
+    return _active
+
+
+@contextmanager
+def tracing(tracer: Optional[Tracer]) -> Iterator[Optional[Tracer]]:
+    """Make `tracer` the target of `span` for the duration of the block."""
+    global _active
+    previous, _active = _active, tracer
+    try:
+        yield tracer
+    finally:
+        _active = previous
+
+
+@contextmanager
+def timing_phases(phases: Optional["PhaseTimer"]) -> Iterator[Optional["PhaseTimer"]]:
+    """Feed run-level `span`s into `phases` for the duration of the block."""
+    global _phases
+    previous, _phases = _phases, phases
+    try:
+        yield phases
+    finally:
+        _phases = previous
+
+
+@contextmanager
+def span(
+    name: str, category: str = "scan", account_id: Optional[str] = None, **args: Any
+) -> Iterator[None]:
+    """Time the block as a span on the active tracer and phase timer.
+
+    A no-op when neither is active.
+    """
+    tracer = _active
+    phases = _phases if account_id is None and category in PHASE_CATEGORIES else None
+    if tracer is None and phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        if tracer is not None:
+            tracer.complete(name, category, start, end, account_id, args)
+        if phases is not None:
+            phases.add(name, end - start, time.process_time() - cpu_start)
@@ -0,0 +1,27 @@
+"""Shared fixtures for tests that run whole scans."""
+
+from typing import List
+
+from soc2_scanner.scanner import ScanConfig
+
+
+def account_ids(count: int) -> List[str]:
+    """`count` (at most 9) distinct account IDs: 111111111111, 222222222222, ..."""
+    return [str(digit) * 12 for digit in range(1, count + 1)]
+
+
+ACCOUNTS = account_ids(3)
+
+
+def simulated_config(output_dir: str, **overrides) -> ScanConfig:
+    """A simulated scan of `ACCOUNTS` for controls CC1 and CC4, with `overrides` applied."""
+    values = {
+        "controls": ["CC1", "CC4"],
+        "regions": ["us-east-1"],
+        "profile": None,
+        "output_dir": output_dir,
+        "account_ids": ACCOUNTS,
+        "simulate": True,
+        **overrides,
+    }
+    return ScanConfig(**values)
@@ -0,0 +1,112 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from soc2_scanner import scanner
+from soc2_scanner.checkpoints import CHECKPOINT_DIR, CheckpointStore, checkpointed_scan
+from soc2_scanner.hashing import verify_run
+from soc2_scanner.scanner import run_scan
+from tests.helpers import ACCOUNTS, simulated_config
+
+
+class CheckpointedScanTests(unittest.TestCase):
+    def test_only_accounts_without_a_checkpoint_are_scanned(self) -> None:
+        with tempfile.TemporaryDirectory() as run_dir:
+            store = CheckpointStore(run_dir)
+            store.write_state({"accounts": ACCOUNTS})
+            store.write_account(1, {"account_id": ACCOUNTS[1], "restored": True})
+            scanned = []
+
+            def _scan(ids, on_settled):
+                scanned.extend(ids)
+                for position, account_id in enumerate(ids):
+                    account = {"account_id": account_id}
+                    on_settled(position, account)
+                    yield account
+
+            restored = []
+            results = list(checkpointed_scan(store, ACCOUNTS, _scan, restored))
+
+            self.assertEqual(scanned, [ACCOUNTS[0], ACCOUNTS[2]])
+            self.assertEqual(restored, [ACCOUNTS[1]])
+            self.assertEqual([result["account_id"] for result in results], ACCOUNTS)
+            self.assertTrue(results[1]["restored"])
+            self.assertEqual(store.completed(), {0, 1, 2})
+            self.assertFalse(any(name.endswith(".tmp") for name in os.listdir(store.directory)))
+
+    def test_missing_run_state_is_reported(self) -> None:
+        with tempfile.TemporaryDirectory() as run_dir:
+            with self.assertRaisesRegex(FileNotFoundError, "checkpoints/run.json"):
+                CheckpointStore(run_dir).load_state()
+
+
+class ResumeTests(unittest.TestCase):
+    def _interrupted_run(self, output_dir: str) -> str:
+        simulate_account = scanner._simulate_account
+
+        def _fail_on_last(controls, account_id, *args):
+            if account_id == ACCOUNTS[-1]:
+                raise KeyboardInterrupt
+            return simulate_account(controls, account_id, *args)
+
+        with patch("soc2_scanner.scanner._simulate_account", side_effect=_fail_on_last):
+            with self.assertRaises(KeyboardInterrupt):
+                run_scan(simulated_config(output_dir))
+        (run_id,) = os.listdir(output_dir)
+        return os.path.join(output_dir, run_id)
+
+    def test_resumed_run_scans_only_the_remaining_accounts(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            run_dir = self._interrupted_run(output_dir)
+            self.assertEqual(CheckpointStore(run_dir).completed(), {0, 1})
+
+            with patch(
+                "soc2_scanner.scanner._simulate_account", wraps=scanner._simulate_account
+            ) as simulate_account:
+                result = run_scan(simulated_config(output_dir, resume_dir=run_dir))
+
+            self.assertEqual(
+                [call.args[1] for call in simulate_account.call_args_list], ACCOUNTS[2:]
+            )
+            self.assertEqual(os.path.dirname(result["artifacts"][0]), run_dir)
+            self.assertFalse(os.path.exists(os.path.join(run_dir, CHECKPOINT_DIR)))
+            self.assertTrue(all(check.ok for check in verify_run(run_dir)))
+            with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                evidence = json.load(handle)
+            self.assertEqual(evidence["run_id"], os.path.basename(run_dir))
+            self.assertEqual([account["account_id"] for account in evidence["accounts"]], ACCOUNTS)
+            completeness_path = os.path.join(run_dir, "run_completeness.json")
+            with open(completeness_path, "r", encoding="utf-8") as handle:
+                self.assertEqual(json.load(handle)["restored_accounts"], 2)
+
+    def test_resume_keeps_the_interrupted_run_scope(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            run_dir = self._interrupted_run(output_dir)
+
+            run_scan(
+                simulated_config(
+                    output_dir, resume_dir=run_dir, controls=["CC9"], regions=["eu-west-1"]
+                )
+            )
+
+            with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                evidence = json.load(handle)
+            self.assertEqual(evidence["controls"], ["CC1", "CC4"])
+            self.assertEqual(evidence["regions"], ["us-east-1"])
+            self.assertEqual(
+                [entry["control_id"] for entry in evidence["accounts"][2]["evidence"]],
+                ["CC1", "CC4"],
+            )
+
+    def test_resume_requires_the_same_simulate_setting(self) -> None:
+        with tempfile.TemporaryDirectory() as output_dir:
+            run_dir = self._interrupted_run(output_dir)
+
+            with self.assertRaisesRegex(ValueError, "--simulate"):
+                run_scan(simulated_config(output_dir, resume_dir=run_dir, simulate=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
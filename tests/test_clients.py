@@ -0,0 +1,50 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from soc2_scanner.clients import ClientFactory
+
+
+class ClientFactoryTests(unittest.TestCase):
+    def test_clients_reused_per_session_service_and_region(self) -> None:
+        factory = ClientFactory(max_pool_connections=32)
+        session = Mock()
+        session.client.side_effect = lambda *args, **kwargs: Mock()
+        other_session = Mock()
+        other_session.client.side_effect = lambda *args, **kwargs: Mock()
+
+        first = factory.client(session, "kms", "us-east-1")
+        self.assertIs(factory.client(session, "kms", "us-east-1"), first)
+        self.assertIsNot(factory.client(session, "kms", "us-west-2"), first)
+        self.assertIsNot(factory.client(other_session, "kms", "us-east-1"), first)
+
+        self.assertEqual(factory.stats(), {"created": 3, "reused": 1})
+        _, kwargs = session.client.call_args
+        self.assertEqual(kwargs["config"].max_pool_connections, 32)
+
+    def test_bound_clients_are_built_once_under_concurrency(self) -> None:
+        factory = ClientFactory()
+        session = Mock()
+        session.client.side_effect = lambda *args, **kwargs: Mock()
+        clients = factory.bind(session)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(
+                executor.map(lambda _: clients.client("ec2", region_name="eu-west-1"), range(16))
+            )
+
+        self.assertEqual(session.client.call_count, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(factory.stats(), {"created": 1, "reused": 15})
+
+    def test_release_drops_session_clients(self) -> None:
+        factory = ClientFactory()
+        session = Mock()
+        session.client.side_effect = lambda *args, **kwargs: Mock()
+        first = factory.client(session, "iam")
+        factory.release(session)
+        self.assertIsNot(factory.client(session, "iam"), first)
+
+
+if __name__ == "__main__":
+    unittest.main()
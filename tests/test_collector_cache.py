@@ -0,0 +1,141 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from soc2_scanner.collector_cache import CollectorCache, fetch_through, with_age
+from soc2_scanner.controls import EvidenceContext, evaluate_control
+
+
+IAM = {"password_policy_present": True, "errors": []}
+
+
+class CollectorCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_results_are_reused_across_cache_instances(self) -> None:
+        collector = Mock(return_value=IAM)
+        _, first = fetch_through(CollectorCache(self.directory), "111", "iam", [], collector)
+        payload, second = fetch_through(CollectorCache(self.directory), "111", "iam", [], collector)
+
+        self.assertEqual(collector.call_count, 1)
+        self.assertEqual(payload, IAM)
+        self.assertEqual(first["source"], "fresh")
+        self.assertEqual(second, {"source": "cache", "fetched_at": first["fetched_at"]})
+
+    def test_key_covers_account_regions_and_version(self) -> None:
+        cache = CollectorCache(self.directory)
+        fetched_at = "2026-01-01T00:00:00+00:00"
+        cache.store("111", "waf", ["us-east-1", "eu-west-1"], {"errors": []}, fetched_at)
+
+        with patch("soc2_scanner.collector_cache._utc_now") as now:
+            now.return_value = datetime(2026, 1, 1, 1, tzinfo=timezone.utc)
+            self.assertIsNotNone(cache.load("111", "waf", ["eu-west-1", "us-east-1"]))
+            self.assertIsNone(cache.load("111", "waf", ["us-east-1"]))
+            self.assertIsNone(cache.load("222", "waf", ["us-east-1", "eu-west-1"]))
+            with patch.dict("soc2_scanner.collectors.COLLECTOR_REGISTRY") as registry:
+                registry["waf"] = {**registry["waf"], "version": 2}
+                self.assertIsNone(cache.load("111", "waf", ["us-east-1", "eu-west-1"]))
+
+    def test_entries_expire_after_their_ttl(self) -> None:
+        cache = CollectorCache(self.directory, ttls={"iam": 60})
+        fetched_at = (datetime.now(timezone.utc) - timedelta(seconds=120)).isoformat()
+        cache.store("111", "iam", [], IAM, fetched_at)
+
+        self.assertIsNone(cache.load("111", "iam", []))
+        self.assertEqual(cache.stats()["expired"], 1)
+        self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_malformed_entries_are_misses_and_removed(self) -> None:
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        entries = [
+            '{"fetched_at": "%s", "payl' % fetched_at,
+            json.dumps({"fetched_at": fetched_at}),
+            json.dumps({"fetched_at": "2026-01-01T00:00:00", "payload": IAM}),
+            json.dumps([fetched_at, IAM]),
+        ]
+        for text in entries:
+            cache = CollectorCache(self.directory)
+            cache.store("111", "iam", [], IAM, fetched_at)
+            (name,) = os.listdir(self.directory)
+            with open(os.path.join(self.directory, name), "w", encoding="utf-8") as handle:
+                handle.write(text)
+
+            self.assertIsNone(cache.load("111", "iam", []), text)
+            self.assertEqual(os.listdir(self.directory), [])
+            self.assertEqual(cache.stats()["misses"], 1)
+            self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_uncached_collectors_and_errors_always_run(self) -> None:
+        cache = CollectorCache(self.directory)
+        failing = Mock(return_value={"errors": ["AccessDenied"]})
+        for _ in range(2):
+            fetch_through(cache, "111", "iam", [], failing)
+            fetch_through(cache, "111", "guardduty", ["us-east-1"], Mock(return_value={}))
+
+        self.assertEqual(failing.call_count, 2)
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        cache = CollectorCache(self.directory)
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        payload = {"errors": [], "users": ["user"] * 20}
+        entry_size = len(json.dumps({"fetched_at": fetched_at, "payload": payload}, sort_keys=True))
+        cache.max_bytes = entry_size * 2
+        clock = iter(range(1, 100))
+        with patch("soc2_scanner.collector_cache._utc_now") as now:
+            now.side_effect = lambda: datetime.fromtimestamp(
+                1_800_000_000 + next(clock), timezone.utc
+            )
+            cache.store("111", "iam", [], payload, fetched_at)
+            cache.store("222", "iam", [], payload, fetched_at)
+            with patch.object(cache, "ttl", return_value=10**9):
+                self.assertIsNotNone(cache.load("111", "iam", []))
+            cache.store("333", "iam", [], payload, fetched_at)
+
+        with patch.object(cache, "ttl", return_value=10**9):
+            self.assertIsNotNone(cache.load("111", "iam", []))
+            self.assertIsNone(cache.load("222", "iam", []))
+        self.assertEqual(cache.stats()["evicted"], 1)
+
+    def test_evidence_records_provenance_and_age(self) -> None:
+        collector = Mock(
+            return_value={
+                "errors": [],
+                "organization_present": True,
+                "scp_count": 1,
+                "logging_trail_count": 1,
+            }
+        )
+        with patch("soc2_scanner.controls.context.resolve_collector", return_value=collector):
+            for _ in range(2):
+                context = EvidenceContext(
+                    session=Mock(),
+                    regions=["us-east-1"],
+                    clients=Mock(account_id="111"),
+                    collector_cache=CollectorCache(self.directory),
+                )
+                entry = evaluate_control("CC1", context)
+
+        # organizations is reused from the first run; cloudtrail has no TTL.
+        self.assertEqual(collector.call_count, 3)
+        self.assertEqual(entry["data_provenance"]["organizations"]["source"], "cache")
+        self.assertEqual(entry["data_provenance"]["cloudtrail"]["source"], "fresh")
+        self.assertGreaterEqual(entry["data_provenance"]["organizations"]["age_seconds"], 0)
+
+    def test_with_age(self) -> None:
+        info = {"source": "cache", "fetched_at": "2026-01-01T00:00:00+00:00"}
+        now = datetime(2026, 1, 1, 2, tzinfo=timezone.utc)
+
+        self.assertEqual(with_age(info, now)["age_seconds"], 7200)
+
+
+if __name__ == "__main__":
+    unittest.main()
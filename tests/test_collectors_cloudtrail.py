@@ -1,6 +1,7 @@
 import unittest
 from unittest.mock import Mock
 
+from soc2_scanner.collectors import RegionWorkers
 from soc2_scanner.collectors.cloudtrail import collect_cloudtrail
 
 
@@ -23,6 +24,25 @@ class CloudTrailCollectorTests(unittest.TestCase):
         self.assertEqual(result["multi_region_trail_count"], 1)
         self.assertEqual(result["errors"], [])
 
+    def test_collect_cloudtrail_parallel_matches_serial(self) -> None:
+        def _client(service, region_name=None):
+            client = Mock()
+            client.describe_trails.return_value = {
+                "trailList": [{"Name": f"trail-{region_name}", "HomeRegion": region_name}]
+            }
+            client.get_trail_status.return_value = {"IsLogging": region_name != "eu-west-1"}
+            return client
+
+        session = Mock()
+        session.client.side_effect = _client
+        regions = ["us-east-1", "eu-west-1", "ap-south-1", "us-west-2"]
+
+        serial = collect_cloudtrail(session, regions, RegionWorkers(1))
+        parallel = collect_cloudtrail(session, regions, RegionWorkers(4))
+
+        self.assertEqual(serial, parallel)
+        self.assertEqual([trail["region"] for trail in parallel["trails"]], regions)
+
 
 if __name__ == "__main__":
     unittest.main()
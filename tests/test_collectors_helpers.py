@@ -1,7 +1,9 @@
+import threading
+import time
 import unittest
 from unittest.mock import Mock
 
-from soc2_scanner.collectors import helpers
+from soc2_scanner.collectors import RegionWorkers, helpers
 
 
 class CollectorsHelpersTests(unittest.TestCase):
@@ -30,6 +32,21 @@ class CollectorsHelpersTests(unittest.TestCase):
         self.assertEqual([{"id": 1}, {"id": 2}, {"id": 3}], items)
         self.assertIsNone(error)
 
+    def test_map_regions_preserves_region_order(self) -> None:
+        workers = RegionWorkers(4, {"slow": 1})
+        threads = set()
+
+        def _collect(region: str) -> str:
+            threads.add(threading.get_ident())
+            time.sleep(0.03 if region == "us-east-1" else 0)
+            return region
+
+        regions = ["us-east-1", "us-east-2", "us-west-1", "us-west-2"]
+        self.assertEqual(helpers.map_regions("fast", regions, _collect, workers), regions)
+        self.assertGreater(len(threads), 1)
+        self.assertEqual(workers.for_collector("slow"), 1)
+        self.assertEqual(helpers.map_regions("slow", regions, _collect, workers), regions)
+
 
 if __name__ == "__main__":
     unittest.main()
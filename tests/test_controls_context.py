@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+from soc2_scanner.controls.context import (
+    CacheStats,
+    EvidenceContext,
+    get_cached,
+    get_cached_async,
+)
+
+
+class EvidenceContextCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.context = EvidenceContext(session=Mock(), regions=["us-east-1"])
+
+    def test_concurrent_callers_share_one_collection(self) -> None:
+        calls = []
+        started = threading.Event()
+
+        def _collector():
+            calls.append(1)
+            started.set()
+            time.sleep(0.05)
+            return {"errors": []}
+
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            leader = executor.submit(get_cached, self.context, "cloudtrail", _collector)
+            started.wait()
+            waiters = [
+                executor.submit(get_cached, self.context, "cloudtrail", _collector)
+                for _ in range(4)
+            ]
+            results = [leader.result()] + [future.result() for future in waiters]
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(
+            self.context.cache_stats["cloudtrail"], {"hits": 0, "misses": 1, "waits": 4}
+        )
+        get_cached(self.context, "cloudtrail", _collector)
+        self.assertEqual(self.context.cache_stats["cloudtrail"]["hits"], 1)
+
+    def test_collector_error_is_cached(self) -> None:
+        collector = Mock(side_effect=RuntimeError("boom"))
+        for _ in range(2):
+            with self.assertRaises(RuntimeError):
+                get_cached(self.context, "iam", collector)
+        self.assertEqual(collector.call_count, 1)
+        self.assertNotIn("iam", self.context.cache)
+        self.assertEqual(self.context.cache_stats["iam"], {"hits": 1, "misses": 1, "waits": 0})
+
+    def test_async_callers_share_one_collection(self) -> None:
+        collector = Mock(return_value={"errors": []})
+
+        async def _gather():
+            return await asyncio.gather(
+                *(get_cached_async(self.context, "vpc", collector) for _ in range(3))
+            )
+
+        results = asyncio.run(_gather())
+        self.assertEqual(collector.call_count, 1)
+        self.assertEqual(results, [{"errors": []}] * 3)
+        self.assertEqual(self.context.cache_stats["vpc"]["misses"], 1)
+
+
+    def test_run_totals_sum_every_account(self) -> None:
+        totals = CacheStats()
+        collector = Mock(return_value={"errors": []})
+        for _ in range(2):
+            context = EvidenceContext(session=Mock(), regions=["us-east-1"])
+            for _ in range(3):
+                get_cached(context, "iam", collector)
+            totals.add(context.cache_stats)
+
+        self.assertEqual(
+            totals.stats(),
+            {
+                "hits": 4,
+                "misses": 2,
+                "waits": 0,
+                "collectors": {"iam": {"hits": 4, "misses": 2, "waits": 0}},
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
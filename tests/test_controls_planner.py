@@ -0,0 +1,45 @@
+import unittest
+from unittest.mock import Mock, patch
+
+from soc2_scanner.collectors import COLLECTOR_REGISTRY
+from soc2_scanner.controls import CONTROL_REGISTRY, EvidenceContext
+from soc2_scanner.controls.planner import plan_collectors, prefetch_collectors
+
+
+class ControlPlannerTests(unittest.TestCase):
+    def test_plan_deduplicates_shared_collectors(self) -> None:
+        keys = plan_collectors(["CC1", "CC2", "CC4", "CC5", "CC999"])
+        self.assertEqual(
+            keys,
+            ["organizations", "cloudtrail", "cloudwatch", "vpc", "config_rules", "backup"],
+        )
+
+    def test_registered_controls_use_known_collectors(self) -> None:
+        for definition in CONTROL_REGISTRY.values():
+            self.assertTrue(set(definition["collectors"]).issubset(COLLECTOR_REGISTRY))
+
+    def test_prefetch_fills_cache_and_skips_seeded_keys(self) -> None:
+        context = EvidenceContext(session=Mock(), regions=["us-east-1"])
+        context.cache["organizations"] = {"errors": []}
+        calls = []
+
+        def _collector(*args):
+            calls.append(args)
+            return {"errors": []}
+
+        registry = {
+            key: {"collector": _collector, "regional": definition["regional"]}
+            for key, definition in COLLECTOR_REGISTRY.items()
+        }
+        with patch.dict("soc2_scanner.controls.context.COLLECTOR_REGISTRY", registry):
+            prefetch_collectors(context, plan_collectors(["CC1", "CC6"]), max_workers=4)
+
+        self.assertEqual(
+            set(context.cache), {"organizations", "cloudtrail", "iam", "access_analyzer"}
+        )
+        self.assertEqual(len(calls), 3)
+        self.assertIn((context.clients,), calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
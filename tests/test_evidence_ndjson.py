@@ -0,0 +1,155 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+
+from soc2_scanner.evidence_ndjson import (
+    NdjsonEvidenceWriter,
+    derive_evidence_json,
+    load_evidence,
+    report_view,
+)
+from soc2_scanner.scanner import ScanConfig, run_scan
+
+
+HEADER = {
+    "run_id": "20260101T000000Z",
+    "controls": ["CC4"],
+    "regions": ["us-east-1"],
+    "account_id": "111",
+    "caller_arn": "arn:aws:sts::111:assumed-role/auditor/session",
+    "identity_error": None,
+    "organization_error": None,
+    "attribution": "test",
+}
+
+ACCOUNT = {
+    "account_id": "111",
+    "account_name": "Prod",
+    "caller_arn": "arn:aws:sts::111:assumed-role/auditor/session",
+    "identity_error": None,
+    "evidence": [
+        {
+            "control_id": "CC4",
+            "title": "Monitoring Activities",
+            "status": "fail",
+            "gaps": ["AWS Config recorder is not enabled."],
+            "errors": [],
+            "data": {
+                "config_rules": {
+                    "noncompliant_count": 1,
+                    "rules_sample": [{"name": "iam-mfa", "compliance": "NON_COMPLIANT"}],
+                    "rules": ["iam-mfa"] * 100,
+                },
+                "config": {"recorders": []},
+            },
+        }
+    ],
+}
+
+
+class NdjsonEvidenceWriterTests(unittest.TestCase):
+    def test_digest_matches_file_and_records_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "evidence.ndjson")
+            writer = NdjsonEvidenceWriter(path, HEADER)
+            writer.write_account(ACCOUNT)
+            writer.write_account({**ACCOUNT, "account_id": "222"})
+            digest = writer.close("2026-01-01T00:00:00+00:00")
+
+            with open(path, "rb") as handle:
+                content = handle.read()
+            self.assertEqual(digest, hashlib.sha256(content).hexdigest())
+            lines = content.splitlines()
+            self.assertEqual(len(lines), 4)
+            self.assertEqual(json.loads(lines[-1])["account_count"], 2)
+
+            payload = load_evidence(path)
+            self.assertEqual(payload["generated_at"], "2026-01-01T00:00:00+00:00")
+            self.assertEqual(payload["evidence"], ACCOUNT["evidence"])
+            self.assertEqual([account["account_id"] for account in payload["accounts"]], ["111", "222"])
+
+    def test_single_account_matches_evidence_json_shape(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "evidence.ndjson")
+            writer = NdjsonEvidenceWriter(path, HEADER)
+            writer.write_account(ACCOUNT)
+            writer.close("now")
+
+            self.assertEqual(load_evidence(path)["accounts"], [])
+
+    def test_truncated_file_is_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "evidence.ndjson")
+            writer = NdjsonEvidenceWriter(path, HEADER)
+            writer.write_account(ACCOUNT)
+            writer._handle.close()
+
+            with self.assertRaises(ValueError):
+                load_evidence(path)
+
+    def test_report_view_keeps_only_report_fields(self) -> None:
+        view = report_view(ACCOUNT)
+
+        self.assertEqual(
+            view["evidence"][0]["data"],
+            {
+                "config_rules": {
+                    "noncompliant_count": 1,
+                    "rules_sample": [{"name": "iam-mfa", "compliance": "NON_COMPLIANT"}],
+                }
+            },
+        )
+        self.assertEqual(view["evidence"][0]["gaps"], ACCOUNT["evidence"][0]["gaps"])
+        self.assertIn("config", ACCOUNT["evidence"][0]["data"])
+
+
+class NdjsonScanTests(unittest.TestCase):
+    def _scan(self, output_dir: str, evidence_format: str) -> str:
+        config = ScanConfig(
+            controls=["CC1", "CC4"],
+            regions=["us-east-1"],
+            profile=None,
+            output_dir=output_dir,
+            account_ids=["111111111111", "222222222222"],
+            simulate=True,
+            evidence_format=evidence_format,
+        )
+        return os.path.dirname(run_scan(config)["artifacts"][0])
+
+    def test_derived_evidence_json_matches_json_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            json_dir = self._scan(os.path.join(tmp_dir, "json"), "json")
+            ndjson_dir = self._scan(os.path.join(tmp_dir, "ndjson"), "ndjson")
+
+            self.assertFalse(os.path.exists(os.path.join(ndjson_dir, "evidence.json")))
+            ndjson_path = os.path.join(ndjson_dir, "evidence.ndjson")
+            with open(f"{ndjson_path}.sha256", "r", encoding="utf-8") as handle:
+                recorded_digest = handle.read().split()[0]
+            with open(ndjson_path, "rb") as handle:
+                self.assertEqual(recorded_digest, hashlib.sha256(handle.read()).hexdigest())
+
+            derived_path = derive_evidence_json(ndjson_path)
+            with open(derived_path, "r", encoding="utf-8") as handle:
+                derived = json.load(handle)
+            with open(os.path.join(json_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                expected = json.load(handle)
+
+            for payload in (derived, expected):
+                del payload["generated_at"], payload["run_id"]
+                for account in payload["accounts"]:
+                    for entry in account["evidence"]:
+                        del entry["collected_at"], entry["data_provenance"]
+                for entry in payload.get("evidence", []):
+                    entry.pop("collected_at", None)
+            self.assertEqual(derived, expected)
+
+            with open(os.path.join(ndjson_dir, "run_completeness.json"), "r", encoding="utf-8") as handle:
+                artifacts = json.load(handle)["artifacts"]
+            self.assertEqual(artifacts["evidence_ndjson"], "evidence.ndjson")
+            self.assertEqual(artifacts["evidence_hash"], "evidence.ndjson.sha256")
+
+
+if __name__ == "__main__":
+    unittest.main()
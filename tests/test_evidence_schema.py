@@ -0,0 +1,121 @@
+import json
+import os
+import tempfile
+import unittest
+
+from soc2_scanner.evidence_ndjson import NdjsonEvidenceWriter, load_evidence
+from soc2_scanner.evidence_schema import (
+    SCHEMA_VERSION,
+    dedupe_account,
+    evidence_document,
+    inline_account,
+    versioned_header,
+)
+from soc2_scanner.scanner import ScanConfig, run_scan
+
+
+CLOUDTRAIL = {"logging_trail_count": 1, "trails": [{"name": "org-trail"}] * 50, "errors": []}
+
+ACCOUNT = {
+    "account_id": "111",
+    "account_name": "Prod",
+    "identity_error": None,
+    "evidence": [
+        {
+            "control_id": "CC1",
+            "status": "pass",
+            "gaps": [],
+            "errors": [],
+            "data": {"organizations": {"scp_count": 2, "errors": []}, "cloudtrail": CLOUDTRAIL},
+        },
+        {
+            "control_id": "CC2",
+            "status": "pass",
+            "gaps": [],
+            "errors": [],
+            "data": {"cloudtrail": CLOUDTRAIL, "config_rules": {"noncompliant_count": 1}},
+        },
+        {
+            "control_id": "CC4",
+            "status": "fail",
+            "gaps": ["No CloudWatch alarms detected."],
+            "errors": [],
+            "data": {"config_rules": {"noncompliant_count": 3}},
+        },
+    ],
+}
+
+
+class EvidenceSchemaTests(unittest.TestCase):
+    def test_shared_payloads_are_stored_once(self) -> None:
+        record = dedupe_account(ACCOUNT)
+
+        self.assertEqual(
+            sorted(record["collectors"]), ["cloudtrail", "config_rules", "organizations"]
+        )
+        self.assertIs(record["collectors"]["cloudtrail"], CLOUDTRAIL)
+        self.assertEqual(
+            [entry["data_refs"] for entry in record["evidence"]],
+            [["organizations", "cloudtrail"], ["cloudtrail", "config_rules"], []],
+        )
+        self.assertNotIn("data", record["evidence"][0])
+        # A payload that differs from the stored one stays with its control.
+        self.assertEqual(record["evidence"][2]["data"], {"config_rules": {"noncompliant_count": 3}})
+        self.assertIn("data", ACCOUNT["evidence"][0])
+
+    def test_inline_account_restores_the_legacy_shape(self) -> None:
+        round_tripped = json.loads(json.dumps(dedupe_account(ACCOUNT)))
+
+        self.assertEqual(inline_account(round_tripped), ACCOUNT)
+
+    def test_document_layouts(self) -> None:
+        legacy = evidence_document(versioned_header({"run_id": "r"}, "legacy"), "now", [ACCOUNT])
+        self.assertNotIn("schema_version", legacy)
+        self.assertEqual(legacy["evidence"], ACCOUNT["evidence"])
+        self.assertEqual(legacy["accounts"], [])
+
+        header = versioned_header({"run_id": "r"}, "v2")
+        current = evidence_document(header, "now", [dedupe_account(ACCOUNT)])
+        self.assertEqual(current["schema_version"], SCHEMA_VERSION)
+        self.assertNotIn("evidence", current)
+        self.assertEqual([account["account_id"] for account in current["accounts"]], ["111"])
+
+    def test_ndjson_accounts_follow_the_header_schema(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "evidence.ndjson")
+            writer = NdjsonEvidenceWriter(path, versioned_header({"run_id": "r"}, "v2"))
+            writer.write_account(ACCOUNT)
+            writer.close("now")
+
+            payload = load_evidence(path)
+
+        self.assertEqual(payload["accounts"][0]["collectors"]["cloudtrail"], CLOUDTRAIL)
+        self.assertEqual(
+            payload["accounts"][0]["evidence"][1]["data_refs"], ["cloudtrail", "config_rules"]
+        )
+
+    def test_scan_writes_v2_unless_legacy_is_requested(self) -> None:
+        payloads = {}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for schema in ("v2", "legacy"):
+                config = ScanConfig(
+                    controls=["CC1", "CC4"],
+                    regions=["us-east-1"],
+                    profile=None,
+                    output_dir=os.path.join(tmp_dir, schema),
+                    simulate=True,
+                    evidence_schema=schema,
+                )
+                run_dir = os.path.dirname(run_scan(config)["artifacts"][0])
+                with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                    payloads[schema] = json.load(handle)
+
+        self.assertEqual(payloads["v2"]["schema_version"], SCHEMA_VERSION)
+        self.assertIn("collectors", payloads["v2"]["accounts"][0])
+        self.assertNotIn("schema_version", payloads["legacy"])
+        self.assertIn("data", payloads["legacy"]["evidence"][0])
+        self.assertEqual(payloads["legacy"]["accounts"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
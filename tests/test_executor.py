@@ -0,0 +1,214 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from soc2_scanner import scanner
+from soc2_scanner.benchmark import synthetic_responses
+from soc2_scanner.cli import _validate_executor
+from soc2_scanner.clients import ClientFactory
+from soc2_scanner.hashing import verify_run
+from soc2_scanner.scanner import run_scan
+from soc2_scanner.telemetry import CallTelemetry, _OperationStats
+from soc2_scanner.throttling import AdaptiveRateLimiter
+from soc2_scanner.tracing import Tracer, tracing
+from tests.helpers import account_ids, simulated_config
+
+
+ACCOUNTS = account_ids(4)
+
+
+def _evidence(run_dir: str) -> list:
+    with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+        accounts = json.load(handle)["accounts"]
+    for account in accounts:
+        for entry in account["evidence"]:
+            del entry["collected_at"], entry["data_provenance"]
+    return accounts
+
+
+class OrderedResultsTests(unittest.TestCase):
+    def test_results_keep_account_order_and_errors_stay_on_their_account(self) -> None:
+        def _task(account_id: str) -> str:
+            # Earlier accounts finish last.
+            time.sleep({"a": 0.05, "b": 0.02}.get(account_id, 0))
+            if account_id == "c":
+                raise RuntimeError("boom")
+            return account_id
+
+        settled = []
+        lock = threading.Lock()
+
+        def _settle(index: int, raw: str) -> dict:
+            with lock:
+                settled.append(raw)
+            return {"account_id": raw}
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = scanner._ordered_results(pool, ["a", "b", "c", "d"], _task, 3, _settle)
+            self.assertEqual(next(results), {"account_id": "a"})
+            self.assertEqual(next(results), {"account_id": "b"})
+            with self.assertRaisesRegex(RuntimeError, "boom"):
+                next(results)
+
+        self.assertEqual(settled[-1], "a")
+
+    def test_slow_account_holds_back_new_starts_and_yielded_results_are_dropped(self) -> None:
+        class _Result(dict):
+            pass
+
+        head = threading.Event()
+        started = []
+        refs = {}
+
+        def _task(account_id: str) -> _Result:
+            started.append(account_id)
+            if account_id == "a":
+                head.wait()
+            result = _Result(account_id=account_id)
+            refs[account_id] = weakref.ref(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = scanner._ordered_results(
+                pool, ["a", "b", "c", "d"], _task, 2, lambda index, raw: raw
+            )
+            first = []
+            consumer = threading.Thread(target=lambda: first.append(next(results)))
+            consumer.start()
+            try:
+                time.sleep(0.1)
+                # "b" has finished, but nothing else starts until "a" is read.
+                self.assertEqual(sorted(started), ["a", "b"])
+            finally:
+                head.set()
+                consumer.join()
+            self.assertEqual(first.pop()["account_id"], "a")
+
+            self.assertEqual(next(results)["account_id"], "b")
+            self.assertIsNone(refs["a"]())
+            self.assertEqual([result["account_id"] for result in results], ["c", "d"])
+
+    def test_worker_reports_are_merged_into_the_parent(self) -> None:
+        def _report(pid: int, account_id: str, created: int) -> dict:
+            stats = _OperationStats()
+            stats.latencies.append(0.5)
+            stats.errors["AccessDenied"] = 1
+            start = time.perf_counter()
+            return {
+                "pid": pid,
+                "telemetry": [((account_id, "iam", "ListUsers", None), stats)],
+                "spans": [
+                    {
+                        "name": "scan_account",
+                        "cat": "account",
+                        "start": start,
+                        "end": start + 0.01,
+                        "args": {},
+                        "tid": 7,
+                        "thread": "MainThread",
+                    }
+                ],
+                "stats": {
+                    "client_pool": {"created": created, "reused": 2 * created},
+                    "throttling": {
+                        "calls": created,
+                        "retries": 0,
+                        "throttles": 1,
+                        "max_rate": 20.0,
+                        "buckets": [{"account_id": account_id, "service": "iam", "region": None}],
+                    },
+                    "collector_cache": None,
+                    "evidence_cache": {
+                        "collectors": {"iam": {"hits": created, "misses": 1, "waits": 0}}
+                    },
+                },
+            }
+
+        # Worker 10 scans "1" and "3", so only its second (cumulative) report counts.
+        reports = {"1": _report(10, "1", 1), "2": _report(11, "2", 4), "3": _report(10, "3", 2)}
+        run = scanner._ScanRun(
+            config=simulated_config("unused", account_ids=ACCOUNTS, executor="thread"),
+            session=Mock(),
+            identity={"account_id": "0"},
+            regions=["us-east-1"],
+            account_map={},
+            clients=ClientFactory(rate_limiter=AdaptiveRateLimiter(), telemetry=CallTelemetry()),
+        )
+        on_settled = Mock()
+        tracer = Tracer()
+        with tracing(tracer), patch.object(scanner, "_init_account_worker"), patch.object(
+            scanner,
+            "_scan_account_in_worker",
+            side_effect=lambda account_id: ({"account_id": account_id}, reports[account_id]),
+        ):
+            results = list(scanner._scan_accounts_in_processes(run, ["1", "2", "3"], on_settled))
+
+        self.assertEqual([result["account_id"] for result in results], ["1", "2", "3"])
+        self.assertEqual(sorted(call.args[0] for call in on_settled.call_args_list), [0, 1, 2])
+        summary = run.clients.telemetry.summary()
+        self.assertEqual(summary["call_count"], 3)
+        self.assertEqual(summary["operations"][0]["errors"], {"AccessDenied": 1})
+        spans = [event for event in tracer.events() if event["ph"] == "X"]
+        self.assertEqual(len({event["pid"] for event in spans}), 3)
+
+        stats = scanner._run_stats(run)
+        self.assertEqual(stats["client_pool"], {"created": 6, "reused": 12})
+        self.assertEqual(stats["throttling"]["calls"], 6)
+        self.assertEqual(stats["throttling"]["throttles"], 2)
+        self.assertEqual(
+            [bucket["account_id"] for bucket in stats["throttling"]["buckets"]], ["2", "3"]
+        )
+        self.assertEqual(
+            stats["evidence_cache"]["collectors"], {"iam": {"hits": 6, "misses": 2, "waits": 0}}
+        )
+
+    def test_take_removes_only_that_accounts_metrics(self) -> None:
+        telemetry = CallTelemetry()
+        telemetry.absorb([(("1", "iam", "ListUsers", None), _OperationStats())])
+        telemetry.absorb([(("2", "iam", "ListUsers", None), _OperationStats())])
+
+        taken = telemetry.take("1")
+
+        self.assertEqual([key for key, _ in taken], [("1", "iam", "ListUsers", None)])
+        self.assertEqual(
+            [item["account_id"] for item in telemetry.summary()["operations"]], ["2"]
+        )
+
+
+class ProcessExecutorTests(unittest.TestCase):
+    def test_process_mode_matches_thread_mode(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            runs = {}
+            for executor in ("thread", "process"):
+                config = simulated_config(
+                    os.path.join(tmp_dir, executor),
+                    account_ids=ACCOUNTS,
+                    max_account_workers=2,
+                    executor=executor,
+                )
+                with synthetic_responses(1):
+                    result = run_scan(config)
+                runs[executor] = os.path.dirname(result["artifacts"][0])
+
+            self.assertEqual(_evidence(runs["process"]), _evidence(runs["thread"]))
+            self.assertIn("simulated_api", _evidence(runs["process"])[0]["collectors"])
+            self.assertTrue(all(check.ok for check in verify_run(runs["process"])))
+            with open(
+                os.path.join(runs["process"], "run_completeness.json"), "r", encoding="utf-8"
+            ) as handle:
+                self.assertEqual(json.load(handle)["executor"], "process")
+
+    def test_validate_executor(self) -> None:
+        self.assertEqual(_validate_executor("process"), "process")
+        with self.assertRaises(ValueError):
+            _validate_executor("fork")
+
+
+if __name__ == "__main__":
+    unittest.main()
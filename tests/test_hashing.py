@@ -0,0 +1,134 @@
+import hashlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+
+from soc2_scanner.cli import verify_main
+from soc2_scanner.hashing import (
+    MANIFEST_FILE,
+    ArtifactManifest,
+    HashingWriter,
+    hash_path,
+    hashing_open,
+    verify_run,
+)
+from soc2_scanner.scanner import ScanConfig, run_scan
+
+
+def _sha256_of(path: str) -> str:
+    with open(path, "rb") as handle:
+        return hashlib.sha256(handle.read()).hexdigest()
+
+
+class HashingWriterTests(unittest.TestCase):
+    def test_digest_matches_bytes_on_disk(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            binary_path = os.path.join(tmp_dir, "data.bin")
+            with HashingWriter(binary_path) as writer:
+                writer.write(b"abc")
+                writer.write(memoryview(b"def"))
+            self.assertEqual(writer.hexdigest(), _sha256_of(binary_path))
+
+            text_path = os.path.join(tmp_dir, "data.txt")
+            handle, writer = hashing_open(text_path, newline="\r\n")
+            with handle:
+                json.dump({"name": "café", "lines": ["a\nb"]}, handle, indent=2)
+            self.assertEqual(writer.hexdigest(), _sha256_of(text_path))
+            with open(text_path, "rb") as raw:
+                self.assertIn(b"\r\n", raw.read())
+
+    def test_hash_path_handles_empty_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "empty")
+            open(path, "wb").close()
+            self.assertEqual(hash_path(path), hashlib.sha256(b"").hexdigest())
+
+
+class ManifestTests(unittest.TestCase):
+    def test_manifest_lists_artifacts_inside_run_dir(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manifest = ArtifactManifest()
+            with manifest.open(os.path.join(tmp_dir, "b.json")) as handle:
+                handle.write("{}\n")
+            with manifest.open(os.path.join(tmp_dir, "a.pdf"), "wb") as handle:
+                handle.write(b"%PDF")
+            manifest.add(os.path.join(os.path.dirname(tmp_dir), "trace.json"), "0" * 64)
+
+            with open(manifest.write(tmp_dir), "r", encoding="utf-8") as handle:
+                lines = handle.read().splitlines()
+
+            self.assertEqual(
+                lines,
+                [
+                    f"{_sha256_of(os.path.join(tmp_dir, 'a.pdf'))}  a.pdf",
+                    f"{_sha256_of(os.path.join(tmp_dir, 'b.json'))}  b.json",
+                ],
+            )
+
+
+class VerifyTests(unittest.TestCase):
+    def _run_dir(self, output_dir: str) -> str:
+        config = ScanConfig(
+            controls=["CC1"],
+            regions=["us-east-1"],
+            profile=None,
+            output_dir=output_dir,
+            simulate=True,
+        )
+        result = run_scan(config)
+        run_dir = os.path.dirname(result["artifacts"][0])
+        self.assertIn(os.path.join(run_dir, MANIFEST_FILE), result["artifacts"])
+        return run_dir
+
+    def test_scan_artifacts_verify(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._run_dir(tmp_dir)
+
+            results = verify_run(run_dir, max_workers=2)
+
+            self.assertTrue(all(result.ok for result in results))
+            checked = {
+                os.path.basename(result.path) for result in results if result.source == MANIFEST_FILE
+            }
+            self.assertIn("evidence.json", checked)
+            self.assertIn("evidence_summary.csv", checked)
+            self.assertIn("run_completeness.json", checked)
+            for result in results:
+                self.assertEqual(result.actual, _sha256_of(result.path))
+
+    def test_verify_reports_tampered_and_missing_files(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._run_dir(tmp_dir)
+            with open(os.path.join(run_dir, "evidence.json"), "a", encoding="utf-8") as handle:
+                handle.write(" ")
+            os.remove(os.path.join(run_dir, "evidence_summary.csv"))
+
+            failed = {
+                (os.path.basename(result.path), result.actual is None)
+                for result in verify_run(run_dir)
+                if not result.ok
+            }
+            self.assertEqual(failed, {("evidence.json", False), ("evidence_summary.csv", True)})
+
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(verify_main([run_dir]), 1)
+            self.assertIn("evidence_summary.csv: MISSING", output.getvalue())
+
+    def test_verify_requires_manifest(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with redirect_stdout(io.StringIO()):
+                self.assertEqual(verify_main([tmp_dir]), 2)
+
+    def test_verify_rejects_non_positive_workers(self) -> None:
+        for workers in ("0", "-2", "two"):
+            with redirect_stderr(io.StringIO()) as errors, self.assertRaises(SystemExit) as raised:
+                verify_main(["reports/run", "--workers", workers])
+            self.assertEqual(raised.exception.code, 2)
+            self.assertIn("--workers: must be a positive integer", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import re
+import subprocess
+import sys
+import unittest
+
+# Cumulative `python -X importtime` budget for `import soc2_scanner.cli`, in
+# microseconds. Locally the import takes ~90 ms; the headroom absorbs slow CI
+# runners, while pulling boto3 (~250 ms) or pandas (~350 ms) back onto the
+# startup path blows it.
+CLI_IMPORT_BUDGET_US = 250_000
+
+HEAVY_MODULES = ("boto3", "botocore", "pandas", "numpy", "reportlab", "asyncio", "yaml")
+
+
+def _import_times(module: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)", line)
+        if match:
+            times[match.group(2)] = int(match.group(1))
+    return times
+
+
+class ImportTimeTests(unittest.TestCase):
+    def test_cli_import_skips_heavy_dependencies(self) -> None:
+        imported = _import_times("soc2_scanner.cli")
+        heavy = sorted(name for name in imported if name.split(".")[0] in HEAVY_MODULES)
+        self.assertEqual(heavy, [])
+
+    def test_cli_import_within_budget(self) -> None:
+        # Best of three, so one noisy run does not fail the suite.
+        cumulative = min(_import_times("soc2_scanner.cli")["soc2_scanner.cli"] for _ in range(3))
+        self.assertLess(cumulative, CLI_IMPORT_BUDGET_US)
+
+    def test_collectors_resolve_lazily(self) -> None:
+        code = (
+            "import sys\n"
+            "from soc2_scanner.collectors import COLLECTOR_REGISTRY, resolve_collector\n"
+            "assert 'soc2_scanner.collectors.kms' not in sys.modules\n"
+            "assert resolve_collector('kms').__name__ == 'collect_kms'\n"
+            "assert 'soc2_scanner.collectors.kms' in sys.modules\n"
+            "assert 'soc2_scanner.collectors.iam' not in sys.modules\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import io
+import unittest
+from unittest.mock import patch
+
+try:
+    import reportlab  # noqa: F401
+except ImportError:  # reportlab is optional
+    reportlab = None
+
+from soc2_scanner import pdf_report
+
+
+COVER = {
+    "run_id": "20260101T000000Z",
+    "generated_at": "2026-01-01T00:00:00+00:00",
+    "account_id": "111111111111",
+    "caller_arn": "arn:aws:sts::111111111111:assumed-role/auditor/session",
+    "regions": ["us-east-1"],
+    "controls": ["CC4"],
+    "account_count": 3,
+    "narrative": "Synthetic evidence.",
+}
+
+
+def _account(index: int) -> dict:
+    return {
+        "account_id": f"11111111111{index}",
+        "account_name": f"Account {index}" if index % 2 else None,
+        "identity_error": None,
+        "controls": [
+            {
+                "control_id": "CC4",
+                "title": "Monitoring Activities",
+                "status": "fail",
+                "gap_count": 1,
+                "error_count": 0,
+                "noncompliant_count": 2,
+                "control_language": "The entity monitors its controls.",
+                "status_text": "Fail",
+                "summary": "1 gap.",
+                "collected_at": "2026-01-01T00:00:00+00:00",
+                "issue_rows": [
+                    {
+                        "type": "Gap",
+                        "item": "AWS Config recorder is not enabled.",
+                        "recommendation": "Enable it.",
+                    }
+                ]
+                * 40,
+            }
+        ],
+    }
+
+
+ACCOUNTS = [_account(index) for index in range(3)]
+
+ROLLUP = {
+    "controls": ["CC4"],
+    "account_count": 3,
+    "matrix": [
+        {
+            "account_id": account["account_id"],
+            "account_name": account["account_name"],
+            "identity_error": None,
+            "statuses": ["fail"],
+        }
+        for account in ACCOUNTS
+    ],
+    "status_counts": {"CC4": {"fail": 3}},
+    "top_gaps": [
+        {
+            "gap": "AWS Config recorder is not enabled.",
+            "account_count": 3,
+            "controls": ["CC4"],
+            "recommendation": "Enable it.",
+        }
+    ],
+    "error_hotspots": [],
+}
+
+
+@unittest.skipIf(reportlab is None, "reportlab is not installed")
+class PdfReportTests(unittest.TestCase):
+    def test_styles_are_built_once(self) -> None:
+        self.assertIs(pdf_report._styles(), pdf_report._styles())
+
+    def test_summary_has_rollup_and_no_account_detail(self) -> None:
+        buffer = io.BytesIO()
+        # Uncompressed page streams keep the text searchable.
+        with patch("reportlab.rl_config.pageCompression", 0):
+            pdf_report.write_summary_pdf(buffer, COVER, ROLLUP, "attribution", "accounts")
+
+        data = buffer.getvalue()
+        self.assertTrue(data.startswith(b"%PDF"))
+        self.assertIn(b"Control Status Matrix", data)
+        self.assertIn(b"111111111112", data)
+        self.assertNotIn(b"CC4 Details", data)
+
+    def test_account_pdfs_render_in_worker_processes_in_order(self) -> None:
+        with patch.object(pdf_report, "PDF_CHUNK_ACCOUNTS", 1):
+            documents = list(pdf_report.account_pdfs(ACCOUNTS, "attribution", max_workers=2))
+
+        self.assertEqual(len(documents), len(ACCOUNTS))
+        for document, account in zip(documents, ACCOUNTS):
+            self.assertTrue(document.startswith(b"%PDF"))
+            # The account is in the document title, which is not compressed.
+            self.assertIn(f"Account {account['account_id']}".encode("utf-8"), document)
+
+    def test_accounts_render_in_process_for_a_single_chunk(self) -> None:
+        with patch("concurrent.futures.ProcessPoolExecutor") as pool:
+            documents = list(pdf_report.account_pdfs(ACCOUNTS[:2], "attribution"))
+
+        pool.assert_not_called()
+        self.assertEqual(len(documents), 2)
+
+if __name__ == "__main__":
+    unittest.main()
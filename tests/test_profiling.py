@@ -0,0 +1,107 @@
+import json
+import marshal
+import os
+import pstats
+import sys
+import tempfile
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from soc2_scanner.collectors.helpers import RegionWorkers
+from soc2_scanner.collectors.kms import collect_kms
+from soc2_scanner.profiling import PhaseTimer, PyinstrumentProfiler, create_profiler
+from soc2_scanner.scanner import ScanConfig, run_scan
+
+
+class ProfilingTests(unittest.TestCase):
+    def test_phase_timer_accumulates_repeated_phases(self) -> None:
+        phases = PhaseTimer()
+        phases.add("hash:evidence.json", 0.25, 0.125)
+        phases.add("write_pdf", 1.0, 0.5)
+        phases.add("hash:evidence.json", 0.25, 0.125)
+        summary = {phase["name"]: phase for phase in phases.summary()}
+        self.assertEqual(list(summary), ["hash:evidence.json", "write_pdf"])
+        self.assertEqual(summary["hash:evidence.json"]["calls"], 2)
+        self.assertEqual(summary["hash:evidence.json"]["wall_seconds"], 0.5)
+        self.assertEqual(summary["hash:evidence.json"]["cpu_seconds"], 0.25)
+
+    def test_unknown_profiler_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            create_profiler("perf")
+
+    def test_auto_profiler_sees_collectors_on_pool_threads(self) -> None:
+        session = Mock()
+        session.client.return_value.list_keys.return_value = {"Keys": []}
+        profiler = create_profiler("auto")
+        profiler.start()
+        try:
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="soc2-account") as pool:
+                pool.submit(
+                    collect_kms, session, ["us-east-1", "eu-west-1"], RegionWorkers(2)
+                ).result()
+        finally:
+            profiler.stop()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            stats_path, _ = profiler.write(tmp_dir)
+            stats = pstats.Stats(stats_path)
+        functions = {(os.path.basename(path), name) for path, _, name in stats.stats}
+        self.assertIn(("kms.py", "collect_kms"), functions)
+        self.assertIn(("kms.py", "_collect_region"), functions)
+
+    def test_pyinstrument_stats_are_readable_by_pstats(self) -> None:
+        # Non-ASCII marshal bytes, as PStatsRenderer returns them.
+        stats = {("kms.py", 14, "_collect_region"): (1, 1, 0.5, 0.5, {})}
+        rendered = marshal.dumps(stats).decode("utf-8", errors="surrogateescape")
+        renderers = types.ModuleType("pyinstrument.renderers")
+        renderers.PStatsRenderer = Mock()
+        module = types.ModuleType("pyinstrument")
+        module.Profiler = Mock()
+        module.Profiler.return_value.output.return_value = rendered
+        module.Profiler.return_value.output_text.return_value = "summary"
+        module.renderers = renderers
+        with patch.dict(
+            sys.modules, {"pyinstrument": module, "pyinstrument.renderers": renderers}
+        ):
+            profiler = PyinstrumentProfiler()
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                stats_path, _ = profiler.write(tmp_dir)
+                loaded = pstats.Stats(stats_path)
+
+        self.assertEqual(loaded.stats, stats)
+
+    def test_profile_run_writes_stats_and_phase_breakdown(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = ScanConfig(
+                controls=["CC1", "CC2"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                simulate=True,
+                profile_run=True,
+                profiler="cprofile",
+            )
+            result = run_scan(config)
+            self.assertIsNone(sys.getprofile())
+
+            run_dir = os.path.dirname(result["artifacts"][0])
+            stats_path = os.path.join(run_dir, "profile.pstats")
+            self.assertIn(stats_path, result["artifacts"])
+            stats = pstats.Stats(stats_path)
+            self.assertTrue(any(function[2] == "_write_pdf_summary" for function in stats.stats))
+            with open(os.path.join(run_dir, "profile_summary.txt"), encoding="utf-8") as handle:
+                self.assertIn("cumulative time", handle.read())
+            with open(os.path.join(run_dir, "run_completeness.json"), encoding="utf-8") as handle:
+                profile = json.load(handle)["profile"]
+
+        self.assertEqual(profile["profiler"], "cprofile")
+        phase_names = [phase["name"] for phase in profile["phases"]]
+        for name in ("scan_accounts", "write_json", "write_csv", "write_markdown", "write_pdf"):
+            self.assertIn(name, phase_names)
+        self.assertNotIn("run_scan", phase_names)
+
+
+if __name__ == "__main__":
+    unittest.main()
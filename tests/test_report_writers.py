@@ -0,0 +1,139 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from soc2_scanner.cli import _validate_formats
+from soc2_scanner.hashing import verify_run
+from soc2_scanner.scanner import ScanConfig, run_scan
+
+
+def _completeness(run_dir: str) -> dict:
+    with open(os.path.join(run_dir, "run_completeness.json"), "r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+class ReportWriterTests(unittest.TestCase):
+    def _simulate(self, output_dir: str, **overrides) -> str:
+        config = ScanConfig(
+            controls=["CC1", "CC4"],
+            regions=["us-east-1"],
+            profile=None,
+            output_dir=output_dir,
+            account_ids=["111111111111", "222222222222"],
+            simulate=True,
+            **overrides,
+        )
+        return os.path.dirname(run_scan(config)["artifacts"][0])
+
+    def test_only_selected_formats_are_written(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._simulate(tmp_dir, formats=["json", "md"])
+
+            files = set(os.listdir(run_dir))
+            self.assertIn("evidence.json", files)
+            self.assertIn("report_summary.md", files)
+            self.assertNotIn("evidence_summary.csv", files)
+            self.assertNotIn("report_summary.pdf", files)
+
+            completeness = _completeness(run_dir)
+            self.assertEqual(completeness["formats"], ["json", "md"])
+            self.assertEqual([writer["format"] for writer in completeness["writers"]], ["json", "md"])
+            self.assertNotIn("evidence_csv", completeness["artifacts"])
+            with open(os.path.join(run_dir, "report_summary.md"), "r", encoding="utf-8") as handle:
+                self.assertNotIn("- evidence_summary.csv", handle.read())
+            self.assertTrue(all(result.ok for result in verify_run(run_dir)))
+
+    def test_writer_timings_cover_every_format(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._simulate(tmp_dir)
+
+            writers = {writer["format"]: writer for writer in _completeness(run_dir)["writers"]}
+
+            self.assertEqual(set(writers), {"json", "csv", "md", "pdf"})
+            for writer in writers.values():
+                self.assertGreaterEqual(writer["seconds"], 0)
+            self.assertEqual(writers["csv"]["artifacts"], ["evidence_summary.csv"])
+
+    def test_summary_is_rollup_first_and_details_are_opt_in(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._simulate(tmp_dir, formats=["md"])
+
+            with open(os.path.join(run_dir, "report_summary.md"), "r", encoding="utf-8") as handle:
+                summary = handle.read()
+            self.assertIn("## Control Status Matrix", summary)
+            self.assertIn("## Top Gaps", summary)
+            self.assertIn("## Error Hotspots", summary)
+            self.assertNotIn("CC1 - ", summary)
+            self.assertNotIn("accounts", os.listdir(run_dir))
+
+    def test_account_details_are_written_per_account(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_dir = self._simulate(tmp_dir, formats=["md", "pdf"], account_details=True)
+
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(run_dir, "accounts"))),
+                ["111111111111.md", "111111111111.pdf", "222222222222.md", "222222222222.pdf"],
+            )
+            with open(
+                os.path.join(run_dir, "accounts", "222222222222.md"), "r", encoding="utf-8"
+            ) as handle:
+                self.assertIn("## CC4 - ", handle.read())
+
+            completeness = _completeness(run_dir)
+            self.assertEqual(completeness["artifacts"]["account_details"], "accounts/")
+            detail_timings = [w for w in completeness["writers"] if w["scope"] == "accounts"]
+            self.assertEqual([w["format"] for w in detail_timings], ["md", "pdf"])
+            self.assertIn("accounts/111111111111.md", detail_timings[0]["artifacts"])
+            results = verify_run(run_dir)
+            self.assertTrue(all(result.ok for result in results))
+            self.assertIn(
+                os.path.join(run_dir, "accounts", "222222222222.pdf"),
+                {result.path for result in results},
+            )
+
+    def test_live_scan_skips_csv_stream_when_not_selected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = ScanConfig(
+                controls=["CC1"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                formats=["json"],
+            )
+            with patch("soc2_scanner.scanner.boto3.Session", return_value=Mock()), patch(
+                "soc2_scanner.scanner._get_account_identity",
+                return_value={"account_id": "123", "arn": "arn", "identity_error": None},
+            ), patch(
+                "soc2_scanner.scanner.collect_organizations", return_value={"errors": []}
+            ), patch("soc2_scanner.scanner.prefetch_collectors"), patch(
+                "soc2_scanner.scanner.evaluate_control",
+                return_value={"control_id": "CC1", "status": "pass", "gaps": [], "errors": []},
+            ):
+                result = run_scan(config)
+
+            run_dir = os.path.dirname(result["artifacts"][0])
+            self.assertEqual(
+                sorted(os.listdir(run_dir)),
+                [
+                    "evidence.json",
+                    "evidence.json.sha256",
+                    "manifest.sha256",
+                    "run_completeness.json",
+                    "run_completeness.json.sha256",
+                ],
+            )
+
+    def test_formats_are_validated(self) -> None:
+        self.assertEqual(_validate_formats(None), ["json", "csv", "md", "pdf"])
+        self.assertEqual(_validate_formats("pdf, json"), ["json", "pdf"])
+        self.assertEqual(_validate_formats(["md"]), ["md"])
+        with self.assertRaises(ValueError):
+            _validate_formats("json,xml")
+        with self.assertRaises(ValueError):
+            _validate_formats("")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from soc2_scanner import scanner
+from soc2_scanner.cli import main
+from soc2_scanner.controls import EvidenceContext
+from soc2_scanner.hashing import verify_run
+from soc2_scanner.rerun import RerunPlan, failed_controls, load_run_evidence, run_accounts
+from soc2_scanner.scanner import run_scan
+from tests.helpers import ACCOUNTS, simulated_config
+
+
+DENIED = "AccessDeniedException: denied"
+
+
+def _entry(control_id: str, status: str = "pass", errors=(), data=None) -> dict:
+    return {
+        "control_id": control_id,
+        "status": status,
+        "gaps": [],
+        "errors": list(errors),
+        "data": data or {},
+    }
+
+
+class FailedControlsTests(unittest.TestCase):
+    def test_identity_errors_rerun_every_control(self) -> None:
+        account = {"account_id": "1", "identity_error": "AccessDenied", "evidence": []}
+
+        self.assertEqual(failed_controls(account, ["CC1", "CC4"]), ["CC1", "CC4"])
+
+    def test_only_errors_needing_review_and_missing_controls_rerun(self) -> None:
+        account = {
+            "account_id": "1",
+            "identity_error": None,
+            "evidence": [
+                _entry("CC1", "needs_review", errors=[DENIED]),
+                _entry("CC2", "fail"),
+                _entry("CC3", "needs_review"),
+            ],
+        }
+
+        self.assertEqual(failed_controls(account, ["CC1", "CC2", "CC3", "CC4"]), ["CC1", "CC4"])
+
+    def test_legacy_single_account_payload(self) -> None:
+        payload = {
+            "run_id": "r1",
+            "account_id": "1",
+            "caller_arn": "arn",
+            "identity_error": None,
+            "evidence": [_entry("CC1")],
+            "accounts": [],
+        }
+
+        (account,) = run_accounts(payload)
+        self.assertEqual(account["account_id"], "1")
+        self.assertEqual(account["evidence"], [_entry("CC1")])
+
+
+class RerunPlanTests(unittest.TestCase):
+    def _plan(self) -> RerunPlan:
+        return RerunPlan(
+            {
+                "run_id": "r1",
+                "controls": ["CC1", "CC4"],
+                "regions": ["us-east-1"],
+                "accounts": [
+                    {
+                        "account_id": "1",
+                        "identity_error": None,
+                        "evidence": [
+                            _entry(
+                                "CC1",
+                                "needs_review",
+                                errors=[DENIED],
+                                data={
+                                    "organizations": {"errors": []},
+                                    "cloudtrail": {"errors": [DENIED]},
+                                },
+                            ),
+                            _entry("CC4"),
+                        ],
+                    }
+                ],
+            }
+        )
+
+    def test_seed_reuses_only_error_free_collectors(self) -> None:
+        plan = self._plan()
+        plan.accounts["1"]["evidence"][0]["data_provenance"] = {
+            "organizations": {"source": "fresh", "fetched_at": "2026-01-01T00:00:00+00:00"}
+        }
+        context = EvidenceContext(session=Mock(), regions=["us-east-1"], clients=Mock())
+
+        plan.seed(context, "1")
+
+        self.assertEqual(set(context.cache), {"organizations"})
+        self.assertEqual(context.provenance["organizations"]["source"], "previous_run")
+
+    def test_merge_keeps_control_order_and_origins(self) -> None:
+        plan = self._plan()
+        fresh = {"account_id": "1", "identity_error": None, "evidence": [_entry("CC1")]}
+
+        merged = plan.merge("1", fresh, "r2")
+
+        self.assertEqual([entry["control_id"] for entry in merged["evidence"]], ["CC1", "CC4"])
+        self.assertEqual(merged["evidence"][0]["origin"], {"source": "rerun", "run_id": "r2"})
+        self.assertEqual(
+            merged["evidence"][1]["origin"], {"source": "carried_over", "run_id": "r1"}
+        )
+
+    def test_account_still_unreachable_keeps_previous_evidence(self) -> None:
+        plan = self._plan()
+        fresh = {"account_id": "1", "identity_error": "AccessDenied", "evidence": []}
+
+        merged = plan.merge("1", fresh, "r2")
+
+        self.assertIsNone(merged["identity_error"])
+        self.assertEqual(len(merged["evidence"]), 2)
+
+
+class FailedOnlyRerunTests(unittest.TestCase):
+    def _source_run(self, output_dir: str, **overrides) -> str:
+        """A simulated run where everything passed except the failures injected below."""
+        result = run_scan(simulated_config(output_dir, **overrides))
+        run_dir = os.path.dirname(result["artifacts"][0])
+        path = os.path.join(run_dir, "evidence.json")
+        if not os.path.exists(path):
+            return run_dir
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        for account in payload["accounts"]:
+            for entry in account["evidence"]:
+                entry.update(status="pass", errors=[])
+        payload["accounts"][0]["evidence"][1].update(status="needs_review", errors=[DENIED])
+        payload["accounts"][1].update(identity_error="AccessDenied", evidence=[])
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        return run_dir
+
+    def test_only_failed_accounts_and_controls_are_scanned(self) -> None:
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as out:
+            source = self._source_run(source_dir)
+
+            with patch(
+                "soc2_scanner.scanner._simulate_account", wraps=scanner._simulate_account
+            ) as simulate_account:
+                result = run_scan(simulated_config(out, rerun_dir=source, controls=["CC9"]))
+
+            self.assertEqual(
+                [call.args[:2] for call in simulate_account.call_args_list],
+                [(["CC4"], ACCOUNTS[0]), (["CC1", "CC4"], ACCOUNTS[1])],
+            )
+            run_dir = os.path.dirname(result["artifacts"][0])
+            self.assertTrue(all(check.ok for check in verify_run(run_dir)))
+            evidence = load_run_evidence(run_dir)
+            source_id = os.path.basename(source)
+            self.assertEqual(evidence["rerun_of"], source_id)
+            self.assertEqual(evidence["controls"], ["CC1", "CC4"])
+            accounts = run_accounts(evidence)
+            self.assertEqual([account["account_id"] for account in accounts], ACCOUNTS)
+            origins = [
+                [entry["origin"]["source"] for entry in account["evidence"]] for account in accounts
+            ]
+            self.assertEqual(
+                origins,
+                [["carried_over", "rerun"], ["rerun", "rerun"], ["carried_over", "carried_over"]],
+            )
+            self.assertEqual(accounts[2]["evidence"][0]["origin"]["run_id"], source_id)
+            self.assertIsNone(accounts[1]["identity_error"])
+            completeness_path = os.path.join(run_dir, "run_completeness.json")
+            with open(completeness_path, "r", encoding="utf-8") as handle:
+                self.assertEqual(
+                    json.load(handle)["rerun"],
+                    {"source_run_id": source_id, "accounts": 2, "controls": 3},
+                )
+
+    def test_ndjson_legacy_runs_can_be_rerun(self) -> None:
+        with tempfile.TemporaryDirectory() as source_dir, tempfile.TemporaryDirectory() as out:
+            source = self._source_run(
+                source_dir, evidence_format="ndjson", evidence_schema="legacy"
+            )
+            plan = RerunPlan(load_run_evidence(source))
+
+            result = run_scan(simulated_config(out, rerun_dir=source))
+
+            run_dir = os.path.dirname(result["artifacts"][0])
+            accounts = run_accounts(load_run_evidence(run_dir))
+            self.assertEqual([account["account_id"] for account in accounts], plan.account_ids)
+
+    def test_cli_rerun_subcommand(self) -> None:
+        with patch("soc2_scanner.cli.run_scan") as run:
+            run.return_value = {"artifacts": ["reports/r2/evidence.json"]}
+            main(
+                ["rerun", "--failed-only", "reports/r1", "--simulate", "--max-account-workers", "4"]
+            )
+
+        config = run.call_args.args[0]
+        self.assertEqual(config.rerun_dir, "reports/r1")
+        self.assertEqual(config.max_account_workers, 4)
+
+    def test_cli_rerun_requires_failed_only(self) -> None:
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            main(["rerun", "reports/r1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
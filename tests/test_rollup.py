@@ -0,0 +1,97 @@
+import unittest
+
+from soc2_scanner.rollup import NOT_SCANNED, OrgRollup, build_rollup, status_columns
+from soc2_scanner.scanner import _markdown_rollup_lines
+
+
+def _entry(control_id: str, status: str, gaps=(), errors=()) -> dict:
+    return {"control_id": control_id, "status": status, "gaps": list(gaps), "errors": list(errors)}
+
+
+ACCOUNTS = [
+    {
+        "account_id": "111111111111",
+        "account_name": "prod",
+        "evidence": [
+            _entry("CC1", "fail", gaps=["No Service Control Policies detected."]),
+            _entry("CC4", "needs_review", errors=["AccessDeniedException: denied"]),
+        ],
+    },
+    {
+        "account_id": "222222222222",
+        "account_name": "dev",
+        "evidence": [
+            _entry("CC1", "fail", gaps=["No Service Control Policies detected."]),
+            _entry(
+                "CC4",
+                "fail",
+                gaps=["No CloudWatch alarms detected.", "No Service Control Policies detected."],
+            ),
+        ],
+    },
+    {
+        "account_id": "333333333333",
+        "account_name": None,
+        "identity_error": "AccessDenied: sts:AssumeRole",
+        "evidence": [],
+    },
+]
+
+
+class OrgRollupTests(unittest.TestCase):
+    def test_matrix_has_a_status_per_account_and_control(self) -> None:
+        summary = build_rollup(ACCOUNTS, ["CC1", "CC4"])
+
+        self.assertEqual(summary["account_count"], 3)
+        self.assertEqual(
+            [row["statuses"] for row in summary["matrix"]],
+            [["fail", "needs_review"], ["fail", "fail"], [NOT_SCANNED, NOT_SCANNED]],
+        )
+        self.assertEqual(summary["status_counts"]["CC1"], {"fail": 2, NOT_SCANNED: 1})
+
+    def test_gaps_are_ranked_by_affected_accounts(self) -> None:
+        summary = build_rollup(ACCOUNTS, ["CC1", "CC4"], recommend_gap=lambda gap: f"fix {gap}")
+
+        top = summary["top_gaps"]
+        self.assertEqual(top[0]["gap"], "No Service Control Policies detected.")
+        self.assertEqual(top[0]["account_count"], 2)
+        self.assertEqual(top[0]["controls"], ["CC1", "CC4"])
+        self.assertEqual(top[0]["recommendation"], "fix No Service Control Policies detected.")
+        self.assertEqual(top[1]["account_count"], 1)
+
+    def test_error_hotspots_group_errors_by_label(self) -> None:
+        rollup = OrgRollup(["CC1", "CC4"], error_label=lambda error: error.split(":")[0])
+        for account in ACCOUNTS:
+            rollup.add_account(account)
+
+        hotspots = rollup.error_hotspots()
+        self.assertEqual(
+            [(item["control_id"], item["error"]) for item in hotspots],
+            [(None, "AccessDenied"), ("CC4", "AccessDeniedException")],
+        )
+        self.assertEqual(hotspots[0]["accounts_sample"], ["333333333333"])
+        self.assertEqual(hotspots[1]["example"], "AccessDeniedException: denied")
+
+    def test_limits_apply_to_rankings(self) -> None:
+        rollup = OrgRollup(["CC1", "CC4"])
+        for account in ACCOUNTS:
+            rollup.add_account(account)
+
+        self.assertEqual(len(rollup.top_gaps(limit=1)), 1)
+        self.assertEqual(rollup.error_hotspots(limit=0), [])
+
+    def test_other_statuses_get_their_own_column(self) -> None:
+        accounts = [*ACCOUNTS, {"account_id": "444444444444", "evidence": [_entry("CC1", "error")]}]
+        summary = build_rollup(accounts, ["CC1", "CC4"])
+
+        self.assertEqual(
+            status_columns(summary["status_counts"]),
+            ["pass", "fail", "needs_review", NOT_SCANNED, "error"],
+        )
+        lines = _markdown_rollup_lines(summary)
+        self.assertEqual(lines[2], "| Control | Pass | Fail | Needs Review | Not Scanned | Error |")
+        self.assertEqual(lines[4], "| CC1 | 0 | 2 | 0 | 1 | 1 |")
+
+
+if __name__ == "__main__":
+    unittest.main()
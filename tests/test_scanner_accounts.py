@@ -0,0 +1,198 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from soc2_scanner import scanner
+from soc2_scanner.scanner import ScanConfig, _identity_from_arn, run_scan
+
+
+def _fake_assume(
+    base_session, account_id, role_name, external_id, sts_client=None, credential_cache=None
+):
+    if account_id == "333":
+        return None, None, "AccessDenied: not authorized to assume role"
+    account_session = Mock()
+    account_session.account_id = account_id
+    return account_session, None, None
+
+
+def _fake_identity(session):
+    account_id = getattr(session, "account_id", "111")
+    return {"account_id": account_id, "arn": f"arn:{account_id}", "identity_error": None}
+
+
+def _fake_evaluate(control, context):
+    # Earlier accounts finish last so completion order differs from input order.
+    time.sleep({"111": 0.05, "222": 0.02}.get(context.session.account_id, 0))
+    return {
+        "control_id": control,
+        "title": "Control Environment",
+        "status": "pass",
+        "evidence_sources": [],
+        "collected_at": "now",
+        "gaps": [],
+        "errors": [],
+        "data": {},
+    }
+
+
+class ScannerAccountTests(unittest.TestCase):
+    def test_concurrent_accounts_keep_order_and_isolate_errors(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = ScanConfig(
+                controls=["CC2"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                account_ids=["111", "222", "333", "444"],
+                max_account_workers=4,
+            )
+
+            fake_session = Mock()
+            fake_session.region_name = "us-east-1"
+            fake_session.account_id = "111"
+
+            with patch("soc2_scanner.scanner.boto3.Session", return_value=fake_session):
+                with patch(
+                    "soc2_scanner.scanner._get_account_identity", side_effect=_fake_identity
+                ):
+                    with patch(
+                        "soc2_scanner.scanner._assume_role_session", side_effect=_fake_assume
+                    ):
+                        with patch("soc2_scanner.scanner.prefetch_collectors"), patch(
+                            "soc2_scanner.scanner.evaluate_control", side_effect=_fake_evaluate
+                        ):
+                            result = run_scan(config)
+
+            run_dir = os.path.dirname(result["artifacts"][0])
+            with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+
+        accounts = payload["accounts"]
+        self.assertEqual([account["account_id"] for account in accounts], ["111", "222", "333", "444"])
+        self.assertIn("AccessDenied", accounts[2]["identity_error"])
+        self.assertEqual(accounts[2]["evidence"], [])
+        self.assertEqual(accounts[3]["evidence"][0]["status"], "pass")
+
+    def test_assumed_role_arn_skips_caller_identity(self) -> None:
+        def _assume_with_arn(
+            base_session, account_id, role_name, external_id, sts_client=None, credential_cache=None
+        ):
+            if account_id == "333":
+                return None, None, "AccessDenied: not authorized to assume role"
+            account_session = Mock()
+            account_session.account_id = account_id
+            arn = f"arn:aws:sts::{account_id}:assumed-role/{role_name}/soc2-scanner"
+            return account_session, arn, None
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = ScanConfig(
+                controls=["CC2"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                account_ids=["222", "333"],
+                max_account_workers=2,
+                role_prefetch=1,
+            )
+            fake_session = Mock()
+            fake_session.account_id = "111"
+            with patch("soc2_scanner.scanner.boto3.Session", return_value=fake_session):
+                with patch(
+                    "soc2_scanner.scanner._get_account_identity", side_effect=_fake_identity
+                ) as identity_call:
+                    with patch(
+                        "soc2_scanner.scanner._assume_role_session", side_effect=_assume_with_arn
+                    ):
+                        with patch("soc2_scanner.scanner.prefetch_collectors"), patch(
+                            "soc2_scanner.scanner.evaluate_control", side_effect=_fake_evaluate
+                        ) as evaluate_call:
+                            result = run_scan(config)
+
+            run_dir = os.path.dirname(result["artifacts"][0])
+            with open(os.path.join(run_dir, "evidence.json"), "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+
+        self.assertEqual(identity_call.call_count, 1)
+        self.assertEqual(evaluate_call.call_count, 1)
+        accounts = payload["accounts"]
+        self.assertEqual(
+            accounts[0]["caller_arn"],
+            "arn:aws:sts::222:assumed-role/OrganizationAccountAccessRole/soc2-scanner",
+        )
+        self.assertIn("AccessDenied", accounts[1]["identity_error"])
+
+    def test_region_workers_reach_the_account_context(self) -> None:
+        contexts = []
+
+        def _evaluate(control, context):
+            contexts.append(context)
+            return _fake_evaluate(control, context)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            config = ScanConfig(
+                controls=["CC2"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                max_region_workers=2,
+                region_workers={"cloudtrail": 8},
+            )
+            fake_session = Mock()
+            fake_session.account_id = "111"
+            with patch("soc2_scanner.scanner.boto3.Session", return_value=fake_session):
+                with patch(
+                    "soc2_scanner.scanner._get_account_identity", side_effect=_fake_identity
+                ):
+                    with patch("soc2_scanner.scanner.prefetch_collectors"), patch(
+                        "soc2_scanner.scanner.evaluate_control", side_effect=_evaluate
+                    ):
+                        run_scan(config)
+
+        (context,) = contexts
+        self.assertEqual(context.region_workers.for_collector("cloudtrail"), 8)
+        self.assertEqual(context.region_workers.for_collector("kms"), 2)
+
+    def test_unknown_region_workers_collector_is_rejected(self) -> None:
+        with self.assertRaisesRegex(ValueError, "unknown collector: cloudtrial"):
+            ScanConfig(
+                controls=["CC2"],
+                regions=[],
+                profile=None,
+                output_dir="reports",
+                region_workers={"cloudtrial": 8},
+            )
+
+    def test_closing_early_skips_accounts_still_assuming_roles(self) -> None:
+        assuming = threading.Event()
+
+        def _prepare(run, account_id):
+            if account_id != "111":
+                assuming.set()
+                time.sleep(0.1)
+            return scanner._PreparedAccount(account_id, Mock(), {"account_id": account_id})
+
+        run = Mock(config=ScanConfig([], [], None, "reports", max_account_workers=1))
+        with patch.object(scanner, "_prepare_account", side_effect=_prepare), patch.object(
+            scanner, "_evaluate_account", side_effect=lambda run, prepared: prepared.identity
+        ) as evaluate:
+            results = scanner._scan_accounts(run, ["111", "222", "333"])
+            self.assertEqual(next(results), {"account_id": "111"})
+            assuming.wait()
+            results.close()
+
+        self.assertEqual([call.args[1].account_id for call in evaluate.call_args_list], ["111"])
+
+    def test_identity_from_arn(self) -> None:
+        identity = _identity_from_arn("arn:aws:sts::123456789012:assumed-role/Audit/soc2-scanner")
+        self.assertEqual(identity["account_id"], "123456789012")
+        self.assertIsNone(_identity_from_arn(None))
+        self.assertIsNone(_identity_from_arn("not-an-arn"))
+
+
+if __name__ == "__main__":
+    unittest.main()
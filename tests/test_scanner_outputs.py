@@ -35,7 +35,9 @@ class ScannerOutputTests(unittest.TestCase):
                             "errors": [],
                         },
                     ):
-                        with patch("soc2_scanner.scanner.evaluate_control") as mock_eval:
+                        with patch("soc2_scanner.scanner.prefetch_collectors"), patch(
+                            "soc2_scanner.scanner.evaluate_control"
+                        ) as mock_eval:
                             mock_eval.return_value = {
                                 "control_id": "CC1",
                                 "title": "Control Environment",
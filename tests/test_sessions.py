@@ -0,0 +1,137 @@
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+from soc2_scanner import sessions
+from soc2_scanner.sessions import assume_role_session, new_session
+
+try:
+    from cryptography.fernet import Fernet
+except ImportError:  # pragma: no cover - optional dependency
+    Fernet = None
+
+
+def _sts_client(lifetime: timedelta) -> Mock:
+    sts = Mock()
+    counter = iter(range(1, 100))
+
+    def _assume_role(**kwargs):
+        index = next(counter)
+        return {
+            "AssumedRoleUser": {
+                "Arn": "arn:aws:sts::222222222222:assumed-role/OrganizationAccountAccessRole/soc2-scanner"
+            },
+            "Credentials": {
+                "AccessKeyId": f"ASIA{index}",
+                "SecretAccessKey": "secret",
+                "SessionToken": "token",
+                "Expiration": datetime.now(timezone.utc) + lifetime,
+            }
+        }
+
+    sts.assume_role.side_effect = _assume_role
+    return sts
+
+
+class SharedSessionTests(unittest.TestCase):
+    def test_sessions_share_loader_and_endpoint_data(self) -> None:
+        first = new_session("AKIAFIRST", "secret-1", "token-1", "us-east-1")
+        second = new_session("AKIASECOND", "secret-2", "token-2", "us-west-2")
+
+        first_core = first._session
+        second_core = second._session
+        self.assertIs(
+            first_core.get_component("data_loader"), second_core.get_component("data_loader")
+        )
+        self.assertIs(
+            first_core._get_internal_component("endpoint_resolver"),
+            second_core._get_internal_component("endpoint_resolver"),
+        )
+        search_paths = second_core.get_component("data_loader").search_paths
+        self.assertEqual(len(search_paths), len(set(search_paths)))
+
+    def test_sessions_keep_their_own_credentials(self) -> None:
+        first = new_session("AKIAFIRST", "secret-1", "token-1", "us-east-1")
+        second = new_session("AKIASECOND", "secret-2", "token-2", "us-west-2")
+
+        self.assertEqual(first.get_credentials().access_key, "AKIAFIRST")
+        self.assertEqual(second.get_credentials().access_key, "AKIASECOND")
+        self.assertEqual(second.region_name, "us-west-2")
+        client = second.client("sts")
+        self.assertEqual(client.meta.region_name, "us-west-2")
+
+    def test_plain_session_without_botocore_internals(self) -> None:
+        missing = AttributeError("'Session' object has no attribute '_internal_components'")
+        with patch.object(sessions, "_shared_unsupported", False), patch.object(
+            sessions, "_load_shared_components", side_effect=missing
+        ) as load:
+            first = new_session("AKIAFIRST", "secret-1", "token-1", "us-east-1")
+            assumed, _ = assume_role_session(
+                _sts_client(timedelta(hours=1)),
+                "arn:aws:iam::222222222222:role/OrganizationAccountAccessRole",
+                region_name="us-west-2",
+            )
+
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(first.get_credentials().access_key, "AKIAFIRST")
+        self.assertEqual(assumed.get_credentials().access_key, "ASIA1")
+        self.assertEqual(assumed.region_name, "us-west-2")
+
+
+class AssumeRoleSessionTests(unittest.TestCase):
+    role_arn = "arn:aws:iam::222222222222:role/OrganizationAccountAccessRole"
+
+    def test_credentials_refresh_before_expiry(self) -> None:
+        sts = _sts_client(timedelta(minutes=5))
+        session, arn = assume_role_session(
+            sts, self.role_arn, external_id="ext", region_name="us-east-1"
+        )
+
+        frozen = session.get_credentials().get_frozen_credentials()
+
+        self.assertEqual(sts.assume_role.call_count, 2)
+        self.assertEqual(frozen.access_key, "ASIA2")
+        self.assertTrue(arn.startswith("arn:aws:sts::222222222222:assumed-role/"))
+        _, kwargs = sts.assume_role.call_args
+        self.assertEqual(kwargs["ExternalId"], "ext")
+        self.assertIs(
+            session._session.get_component("data_loader"),
+            new_session()._session.get_component("data_loader"),
+        )
+
+    @unittest.skipUnless(Fernet, "cryptography is not installed")
+    def test_cached_credentials_skip_sts(self) -> None:
+        from soc2_scanner.credential_cache import CredentialCache
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CredentialCache(cache_dir, key=Fernet.generate_key().decode("ascii"))
+            first_sts = _sts_client(timedelta(hours=1))
+            assume_role_session(first_sts, self.role_arn, credential_cache=cache)
+
+            second_sts = _sts_client(timedelta(hours=1))
+            session, arn = assume_role_session(second_sts, self.role_arn, credential_cache=cache)
+            other, _ = assume_role_session(
+                second_sts, self.role_arn, external_id="other", credential_cache=cache
+            )
+
+            self.assertEqual(first_sts.assume_role.call_count, 1)
+            self.assertEqual(second_sts.assume_role.call_count, 1)
+            self.assertEqual(session.get_credentials().access_key, "ASIA1")
+            self.assertIn("222222222222", arn)
+            self.assertEqual(other.get_credentials().access_key, "ASIA1")
+            with open(cache._path(self.role_arn, None), "rb") as handle:
+                self.assertNotIn(b"ASIA1", handle.read())
+
+    @unittest.skipUnless(Fernet, "cryptography is not installed")
+    def test_nearly_expired_cache_entries_are_ignored(self) -> None:
+        from soc2_scanner.credential_cache import CredentialCache
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = CredentialCache(cache_dir, key=Fernet.generate_key().decode("ascii"))
+            assume_role_session(_sts_client(timedelta(minutes=10)), self.role_arn, credential_cache=cache)
+            self.assertIsNone(cache.load(self.role_arn, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+import json
+import os
+import re
+import tempfile
+import unittest
+
+from soc2_scanner.cli import main
+from soc2_scanner.hashing import verify_run
+from soc2_scanner.sharding import parse_shard, select_shard, shard_of
+from soc2_scanner.scanner import run_merge, run_scan
+from tests.helpers import account_ids, simulated_config
+
+
+ACCOUNTS = account_ids(9)
+TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T[\d:.]+\+00:00|\d{8}T\d{6}Z")
+
+
+def _read(run_dir: str, name: str) -> str:
+    """An artifact with its run IDs and timestamps blanked out."""
+    with open(os.path.join(run_dir, name), "r", encoding="utf-8") as handle:
+        return TIMESTAMP.sub("<time>", handle.read())
+
+
+class ShardTests(unittest.TestCase):
+    def test_parse_shard(self) -> None:
+        self.assertEqual(parse_shard("2/4"), (2, 4))
+        for value in ("0/4", "5/4", "2", "a/b", "2/4/1"):
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+    def test_partition_is_stable_and_complete(self) -> None:
+        self.assertEqual([shard_of(account_id, 3) for account_id in ACCOUNTS[:4]], [2, 3, 3, 2])
+        shards = [select_shard(ACCOUNTS, (index, 3)) for index in (1, 2, 3)]
+        self.assertEqual(sorted(sum(shards, [])), sorted(ACCOUNTS))
+
+
+class MergeTests(unittest.TestCase):
+    def _shard_runs(self, output_dir: str, count: int = 3, **overrides) -> list:
+        return [
+            os.path.dirname(
+                run_scan(
+                    simulated_config(
+                        os.path.join(output_dir, str(index)),
+                        account_ids=ACCOUNTS,
+                        shard=(index, count),
+                        **overrides,
+                    )
+                )["artifacts"][0]
+            )
+            for index in range(1, count + 1)
+        ]
+
+    def test_merge_matches_a_single_host_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            single = os.path.dirname(
+                run_scan(
+                    simulated_config(os.path.join(tmp_dir, "single"), account_ids=ACCOUNTS)
+                )["artifacts"][0]
+            )
+            shards = self._shard_runs(tmp_dir)
+            with open(os.path.join(shards[0], "evidence.json"), "r", encoding="utf-8") as handle:
+                first = json.load(handle)
+            self.assertEqual(
+                [account["account_id"] for account in first["accounts"]],
+                select_shard(ACCOUNTS, (1, 3)),
+            )
+
+            merged_config = simulated_config(os.path.join(tmp_dir, "merged"), account_ids=ACCOUNTS)
+            merged = os.path.dirname(
+                run_merge(list(reversed(shards)), merged_config)["artifacts"][0]
+            )
+
+            for name in ("evidence.json", "evidence_summary.csv", "report_summary.md"):
+                self.assertEqual(_read(merged, name), _read(single, name), name)
+            self.assertTrue(all(result.ok for result in verify_run(merged)))
+            completeness = json.loads(_read(merged, "run_completeness.json"))
+            self.assertEqual(completeness["account_count"], len(ACCOUNTS))
+            self.assertEqual([shard["index"] for shard in completeness["shards"]], [1, 2, 3])
+
+    def test_merge_requires_every_shard(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            shards = self._shard_runs(tmp_dir)
+
+            with self.assertRaisesRegex(ValueError, "shards 1..3"):
+                run_merge(
+                    shards[:2],
+                    simulated_config(os.path.join(tmp_dir, "merged"), account_ids=ACCOUNTS),
+                )
+
+    def test_merge_rejects_modified_shards(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            shards = self._shard_runs(tmp_dir, count=2)
+            with open(os.path.join(shards[1], "evidence.json"), "a", encoding="utf-8") as handle:
+                handle.write("\n")
+
+            with self.assertRaisesRegex(ValueError, "fails verification"):
+                run_merge(
+                    shards, simulated_config(os.path.join(tmp_dir, "merged"), account_ids=ACCOUNTS)
+                )
+
+    def test_cli_merge_of_legacy_ndjson_shards(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Of six shards, the first has one account and the fourth none.
+            shards = self._shard_runs(
+                tmp_dir, count=6, evidence_format="ndjson", evidence_schema="legacy"
+            )
+            output = os.path.join(tmp_dir, "merged")
+            main(["merge", *shards, "--output", output, "--formats", "json,csv"])
+
+            (run_id,) = os.listdir(output)
+            payload = json.loads(_read(os.path.join(output, run_id), "evidence.json"))
+            self.assertNotIn("shard", payload)
+            self.assertEqual([account["account_id"] for account in payload["accounts"]], ACCOUNTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
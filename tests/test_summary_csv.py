@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+
+from soc2_scanner.summary_csv import SUMMARY_COLUMNS, SummaryCsvWriter, summary_rows
+
+try:
+    import pandas as pd
+except ImportError:  # pandas is optional
+    pd = None
+
+
+ACCOUNTS = [
+    {
+        "account_id": "111",
+        "account_name": None,
+        "evidence": [
+            {
+                "control_id": "CC4",
+                "title": "Monitoring Activities",
+                "status": "fail",
+                "gaps": ["AWS Config recorder is not enabled."],
+                "errors": [],
+                "data": {
+                    "config_rules": {
+                        "noncompliant_count": 2,
+                        "rules_sample": [
+                            {"name": "s3-bucket-logging", "compliance": "NON_COMPLIANT"},
+                            {"name": "iam-mfa", "compliance": "COMPLIANT"},
+                            {"name": 'rule "quoted", with comma', "compliance": "NON_COMPLIANT"},
+                        ],
+                    }
+                },
+            },
+            {
+                "control_id": "CC6",
+                "title": "Logical and Physical Access",
+                "status": "pass",
+                "gaps": [],
+                "errors": ["kms:us-east-1: AccessDenied\nretry later"],
+                "data": {},
+            },
+        ],
+    },
+    {"account_id": "222", "account_name": "Prod, EU", "evidence": []},
+    {
+        "account_id": "333",
+        "account_name": "Audit",
+        "evidence": [{"control_id": "CC1", "title": "Control Environment", "status": "pass"}],
+    },
+]
+
+
+def _write(accounts) -> bytes:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "evidence_summary.csv")
+        with SummaryCsvWriter(path) as writer:
+            for account in accounts:
+                writer.write_account(account)
+        with open(path, "rb") as handle:
+            return handle.read()
+
+
+def _pandas_csv(accounts) -> bytes:
+    rows = [
+        dict(zip(SUMMARY_COLUMNS, row)) for account in accounts for row in summary_rows(account)
+    ]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "evidence_summary.csv")
+        pd.DataFrame(rows).to_csv(path, index=False)
+        with open(path, "rb") as handle:
+            return handle.read()
+
+
+class SummaryCsvWriterTests(unittest.TestCase):
+    def test_rows_follow_summary_columns(self) -> None:
+        rows = list(summary_rows(ACCOUNTS[0]))
+        self.assertEqual(
+            rows[0],
+            [
+                "111",
+                None,
+                "CC4",
+                "Monitoring Activities",
+                "fail",
+                1,
+                0,
+                2,
+                's3-bucket-logging, rule "quoted", with comma',
+            ],
+        )
+        self.assertEqual(rows[1][6:8], [1, 0])
+
+    def test_empty_summary_is_a_single_line_terminator(self) -> None:
+        self.assertEqual(_write([ACCOUNTS[1]]), os.linesep.encode())
+
+    @unittest.skipIf(pd is None, "pandas not installed")
+    def test_output_matches_pandas_byte_for_byte(self) -> None:
+        self.assertEqual(_write(ACCOUNTS), _pandas_csv(ACCOUNTS))
+        self.assertEqual(_write([ACCOUNTS[1]]), _pandas_csv([ACCOUNTS[1]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import ClientError, EndpointConnectionError
+
+from soc2_scanner.clients import ClientFactory
+from soc2_scanner.collectors.helpers import safe_call
+from soc2_scanner.telemetry import CallTelemetry, _percentile
+
+
+def _response(status_code: int, body: bytes) -> AWSResponse:
+    raw = Mock()
+    raw.stream.return_value = [body]
+    return AWSResponse("https://kms.eu-west-1.amazonaws.com/", status_code, {}, raw)
+
+
+class CallTelemetryTests(unittest.TestCase):
+    def test_percentile_uses_nearest_rank(self) -> None:
+        values = [float(value) for value in range(1, 101)]
+        self.assertEqual(_percentile(values, 50), 50.0)
+        self.assertEqual(_percentile(values, 95), 95.0)
+        self.assertEqual(_percentile(values, 99), 99.0)
+        self.assertEqual(_percentile([], 50), 0.0)
+
+    def test_calls_grouped_by_account_service_operation_and_region(self) -> None:
+        telemetry = CallTelemetry()
+        factory = ClientFactory(telemetry=telemetry)
+        session = boto3.Session(
+            aws_access_key_id="test", aws_secret_access_key="test", region_name="eu-west-1"
+        )
+        client = factory.bind(session, "111").client("kms", region_name="eu-west-1")
+
+        list_body = b'{"Keys": [], "Truncated": false}'
+        responses = [
+            _response(400, b'{"__type":"ThrottlingException","message":"Rate exceeded"}'),
+            _response(200, list_body),
+            _response(200, list_body),
+            _response(400, b'{"__type":"NotFoundException","message":"missing"}'),
+        ]
+        client.meta.events.register("before-send", lambda **kwargs: responses.pop(0))
+
+        with patch("botocore.endpoint.time.sleep"):
+            client.list_keys()
+            client.list_keys()
+            with self.assertRaises(ClientError):
+                client.describe_key(KeyId="alias/missing")
+
+        summary = telemetry.summary()
+        self.assertEqual(summary["call_count"], 3)
+        by_operation = {item["operation"]: item for item in summary["operations"]}
+        list_keys = by_operation["ListKeys"]
+        self.assertEqual(
+            (list_keys["account_id"], list_keys["service"], list_keys["region"]),
+            ("111", "kms", "eu-west-1"),
+        )
+        self.assertEqual(list_keys["count"], 2)
+        self.assertEqual(list_keys["retries"], 1)
+        self.assertEqual(list_keys["throttles"], 1)
+        self.assertEqual(list_keys["response_bytes"], 2 * len(list_body))
+        self.assertGreaterEqual(list_keys["p99_ms"], list_keys["p50_ms"])
+        self.assertEqual(by_operation["DescribeKey"]["errors"], {"NotFoundException": 1})
+
+    def test_transport_errors_are_recorded_and_reach_the_caller(self) -> None:
+        telemetry = CallTelemetry()
+        factory = ClientFactory(telemetry=telemetry)
+        session = boto3.Session(
+            aws_access_key_id="test", aws_secret_access_key="test", region_name="eu-west-1"
+        )
+        client = factory.bind(session, "111").client("kms", region_name="eu-west-1")
+
+        def _unreachable(request, **kwargs):
+            raise EndpointConnectionError(endpoint_url=request.url)
+
+        client.meta.events.register("before-send", _unreachable)
+        with patch("botocore.endpoint.time.sleep"):
+            result, error = safe_call(client.list_keys)
+
+        self.assertIsNone(result)
+        self.assertIn("Could not connect to the endpoint URL", error)
+        (operation,) = telemetry.summary()["operations"]
+        self.assertEqual(operation["operation"], "ListKeys")
+        self.assertEqual(operation["errors"], {"EndpointConnectionError": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from soc2_scanner.clients import ClientFactory
+from soc2_scanner.throttling import AdaptiveRateLimiter, TokenBucket, is_throttle_response
+
+
+_THROTTLE_BODY = b'{"__type":"ThrottlingException","message":"Rate exceeded"}'
+
+
+def _response(status_code: int, body: bytes) -> AWSResponse:
+    raw = Mock()
+    raw.stream.return_value = [body]
+    return AWSResponse("https://kms.us-east-1.amazonaws.com/", status_code, {}, raw)
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_rate_halves_on_throttle_and_recovers_additively(self) -> None:
+        bucket = TokenBucket(max_rate=8.0, min_rate=1.0)
+        bucket.record_throttle()
+        self.assertEqual(bucket.rate, 4.0)
+        bucket.record_throttle()
+        bucket.record_throttle()
+        bucket.record_throttle()
+        self.assertEqual(bucket.rate, 1.0)
+        bucket.record_success()
+        self.assertEqual(bucket.rate, 2.0)
+        for _ in range(100):
+            bucket.record_success()
+        self.assertEqual(bucket.rate, 8.0)
+
+    def test_acquire_waits_once_the_burst_is_spent(self) -> None:
+        bucket = TokenBucket(max_rate=2.0)
+        with patch("soc2_scanner.throttling.time.sleep") as sleep:
+            bucket.acquire()
+            bucket.acquire()
+            sleep.assert_not_called()
+            bucket.acquire()
+        self.assertAlmostEqual(sleep.call_args[0][0], 0.5, places=1)
+
+    def test_is_throttle_response(self) -> None:
+        self.assertTrue(is_throttle_response((Mock(status_code=429), {})))
+        self.assertTrue(
+            is_throttle_response((Mock(status_code=400), {"Error": {"Code": "Throttling"}}))
+        )
+        self.assertFalse(
+            is_throttle_response((Mock(status_code=400), {"Error": {"Code": "AccessDenied"}}))
+        )
+        self.assertFalse(is_throttle_response(None))
+
+
+class AdaptiveRateLimiterTests(unittest.TestCase):
+    def test_throttled_call_is_retried_and_counted(self) -> None:
+        limiter = AdaptiveRateLimiter(max_rate=50.0)
+        factory = ClientFactory(rate_limiter=limiter)
+        session = boto3.Session(
+            aws_access_key_id="test", aws_secret_access_key="test", region_name="us-east-1"
+        )
+        client = factory.bind(session, "111").client("kms", region_name="us-east-1")
+
+        responses = [
+            _response(400, _THROTTLE_BODY),
+            _response(200, b'{"Keys": [], "Truncated": false}'),
+        ]
+        client.meta.events.register("before-send", lambda **kwargs: responses.pop(0))
+
+        with patch("botocore.endpoint.time.sleep"):
+            result = client.list_keys()
+
+        self.assertEqual(result["Keys"], [])
+        self.assertEqual(result["ResponseMetadata"]["RetryAttempts"], 1)
+        stats = limiter.stats()
+        self.assertEqual((stats["calls"], stats["retries"], stats["throttles"]), (1, 1, 1))
+        self.assertEqual(stats["buckets"][0]["account_id"], "111")
+        self.assertEqual(stats["buckets"][0]["service"], "kms")
+        self.assertEqual(stats["buckets"][0]["region"], "us-east-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
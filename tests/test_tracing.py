@@ -0,0 +1,132 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+import boto3
+from botocore.awsrequest import AWSResponse
+from botocore.exceptions import EndpointConnectionError
+
+from soc2_scanner.clients import ClientFactory
+from soc2_scanner.collectors.helpers import safe_call
+from soc2_scanner.scanner import ScanConfig, run_scan
+from soc2_scanner.tracing import Tracer, active_tracer, span, tracing
+
+
+class TracingTests(unittest.TestCase):
+    def test_span_is_a_no_op_without_an_active_tracer(self) -> None:
+        self.assertIsNone(active_tracer())
+        with span("ignored"):
+            pass
+
+    def test_spans_grouped_by_account_and_thread(self) -> None:
+        def _assume_other() -> None:
+            with span("assume_role", "account", "222"):
+                pass
+
+        tracer = Tracer()
+        with tracing(tracer):
+            with span("run", "run"):
+                with span("assume_role", "account", "111", role="Audit"):
+                    pass
+                worker = threading.Thread(target=_assume_other, name="soc2-assume_0")
+                worker.start()
+                worker.join()
+        self.assertIsNone(active_tracer())
+
+        events = tracer.events()
+        spans = [event for event in events if event["ph"] == "X"]
+        self.assertEqual(
+            [(event["name"], event["pid"]) for event in spans],
+            [("run", 0), ("assume_role", 1), ("assume_role", 2)],
+        )
+        self.assertEqual(spans[1]["args"], {"role": "Audit"})
+        self.assertNotEqual(spans[1]["tid"], spans[2]["tid"])
+        metadata = {
+            (event["name"], event["pid"]): event["args"]["name"]
+            for event in events
+            if event["ph"] == "M"
+        }
+        self.assertEqual(metadata[("process_name", 1)], "account 111")
+        self.assertEqual(metadata[("process_name", 2)], "account 222")
+        self.assertEqual(metadata[("thread_name", 2)], "soc2-assume_0")
+
+    def test_taken_spans_can_be_absorbed_by_another_tracer(self) -> None:
+        worker = Tracer()
+        with tracing(worker):
+            with span("scan_account", "account", "111"):
+                pass
+            with span("scan_account", "account", "222"):
+                pass
+
+        taken = worker.take("111")
+        parent = Tracer()
+        parent.absorb("111", taken)
+
+        self.assertEqual([item["name"] for item in taken], ["scan_account"])
+        self.assertEqual(len([event for event in worker.events() if event["ph"] == "X"]), 1)
+        spans = [event for event in parent.events() if event["ph"] == "X"]
+        self.assertEqual([(event["name"], event["pid"]) for event in spans], [("scan_account", 1)])
+
+    def test_aws_calls_become_spans_even_when_they_fail(self) -> None:
+        tracer = Tracer()
+        session = boto3.Session(
+            aws_access_key_id="test", aws_secret_access_key="test", region_name="eu-west-1"
+        )
+        client = ClientFactory(tracer=tracer).bind(session, "111").client("kms", "eu-west-1")
+        raw = Mock()
+        raw.stream.return_value = [b'{"Keys": [], "Truncated": false}']
+        responses = [AWSResponse("https://kms.eu-west-1.amazonaws.com/", 200, {}, raw)]
+
+        def _send(request, **kwargs):
+            if responses:
+                return responses.pop(0)
+            raise EndpointConnectionError(endpoint_url=request.url)
+
+        client.meta.events.register("before-send", _send)
+        with patch("botocore.endpoint.time.sleep"):
+            client.list_keys()
+            _, error = safe_call(client.describe_key, KeyId="alias/audit")
+
+        self.assertIn("Could not connect to the endpoint URL", error)
+        spans = [event for event in tracer.events() if event["ph"] == "X"]
+        self.assertEqual(
+            [(event["name"], event["cat"], event["args"]) for event in spans],
+            [
+                ("kms.ListKeys", "aws", {"region": "eu-west-1"}),
+                (
+                    "kms.DescribeKey",
+                    "aws",
+                    {"region": "eu-west-1", "error": "EndpointConnectionError"},
+                ),
+            ],
+        )
+        self.assertEqual(spans[0]["pid"], spans[1]["pid"])
+
+    def test_run_scan_writes_trace_with_writer_spans(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trace_path = os.path.join(tmp_dir, "trace.json")
+            config = ScanConfig(
+                controls=["CC1", "CC2"],
+                regions=["us-east-1"],
+                profile=None,
+                output_dir=tmp_dir,
+                simulate=True,
+                trace_output=trace_path,
+            )
+            run_scan(config)
+            with open(trace_path, "r", encoding="utf-8") as handle:
+                trace = json.load(handle)
+
+        names = {event["name"] for event in trace["traceEvents"] if event["ph"] == "X"}
+        self.assertTrue(
+            {"run_scan", "write_json", "write_csv", "write_markdown", "write_pdf"} <= names
+        )
+        self.assertIn("hash:evidence.json", names)
+        self.assertIsNone(active_tracer())
+
+
+if __name__ == "__main__":
+    unittest.main()